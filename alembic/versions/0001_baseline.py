@@ -0,0 +1,191 @@
+"""baseline schema
+
+The schema as it was created by Base.metadata.create_all before migrations
+were introduced. Tables that already exist are left untouched, so databases
+created that way can simply be upgraded to head.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _create_table(name, *columns):
+    if name in sa.inspect(op.get_bind()).get_table_names():
+        return False
+    op.create_table(name, *columns)
+    op.create_index(f"ix_{name}_id", name, ["id"])
+    return True
+
+
+def upgrade() -> None:
+    if _create_table(
+        "client",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_superuser", sa.Boolean(), nullable=True),
+        sa.Column("profile_photo", sa.String(), nullable=True),
+        sa.Column("location_country", sa.String(), nullable=True),
+        sa.Column("location_city", sa.String(), nullable=True),
+        sa.Column("language", sa.String(), nullable=True),
+        sa.Column("bio", sa.String(), nullable=True),
+        sa.Column("company_name", sa.String(), nullable=True),
+        sa.Column("company_size", sa.String(), nullable=True),
+        sa.Column("industry", sa.String(), nullable=True),
+        sa.Column("website", sa.String(), nullable=True),
+        sa.Column("preferred_contact_method", sa.String(), nullable=True),
+        sa.Column("contact_email", sa.String(), nullable=True),
+        sa.Column("contact_phone", sa.String(), nullable=True),
+        sa.Column("timezone", sa.String(), nullable=True),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.Column("billing_name", sa.String(), nullable=True),
+        sa.Column("tax_gst_number", sa.String(), nullable=True),
+        sa.Column("billing_contact_email", sa.String(), nullable=True),
+        sa.Column("billing_contact_phone", sa.String(), nullable=True),
+        sa.Column("billing_address", sa.String(), nullable=True),
+    ):
+        op.create_index("ix_client_email", "client", ["email"], unique=True)
+
+    if _create_table(
+        "service_provider",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("professional_title", sa.String(), nullable=True),
+        sa.Column("availability", sa.String(), nullable=True),
+        sa.Column("hourly_rate", sa.Integer(), nullable=True),
+        sa.Column("skills", sa.String(), nullable=True),
+        sa.Column("kyc_file", sa.String(), nullable=True),
+    ):
+        op.create_index("ix_service_provider_email", "service_provider", ["email"], unique=True)
+
+    _create_table(
+        "portfolio_projects",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("project_url", sa.String(), nullable=True),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("image_url", sa.String(), nullable=True),
+    )
+    _create_table(
+        "work_experiences",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False),
+        sa.Column("role", sa.String(), nullable=False),
+        sa.Column("company", sa.String(), nullable=False),
+        sa.Column("start_date", sa.String(), nullable=True),
+        sa.Column("end_date", sa.String(), nullable=True),
+        sa.Column("currently_working", sa.Boolean(), nullable=True),
+        sa.Column("summary", sa.String(), nullable=True),
+    )
+    _create_table(
+        "educations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False),
+        sa.Column("school", sa.String(), nullable=False),
+        sa.Column("degree", sa.String(), nullable=False),
+        sa.Column("field_of_study", sa.String(), nullable=True),
+        sa.Column("start_year", sa.Integer(), nullable=True),
+        sa.Column("end_year", sa.Integer(), nullable=True),
+        sa.Column("highlights", sa.String(), nullable=True),
+    )
+    _create_table(
+        "certifications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("issuer", sa.String(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("certificate_link", sa.String(), nullable=True),
+    )
+    _create_table(
+        "service_provider_profile",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False, unique=True),
+        sa.Column("profile_photo", sa.String(500), nullable=True),
+        sa.Column("full_name", sa.String(255), nullable=True),
+        sa.Column("location_country", sa.String(100), nullable=True),
+        sa.Column("location_city", sa.String(100), nullable=True),
+        sa.Column("language", sa.String(255), nullable=True),
+        sa.Column("experience", sa.String(100), nullable=True),
+        sa.Column("project_completed", sa.Integer(), nullable=True),
+        sa.Column("bio", sa.String(1000), nullable=True),
+    )
+    _create_table(
+        "project",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("budget_range", sa.String(), nullable=True),
+        sa.Column("currency", sa.String(), nullable=True),
+        sa.Column("project_duration", sa.String(), nullable=True),
+        sa.Column("skills_required", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("submission_pdf_path", sa.String(), nullable=True),
+        sa.Column("submission_github_link", sa.String(), nullable=True),
+        sa.Column("escrow_funded", sa.String(), nullable=True),
+        sa.Column("client_id", sa.Integer(), sa.ForeignKey("client.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    _create_table(
+        "bid",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("project.id"), nullable=False),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False),
+        sa.Column("bid_amount", sa.Integer(), nullable=False),
+        sa.Column("currency", sa.String(), nullable=False),
+        sa.Column("cover_letter", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+    _create_table(
+        "contract",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("project.id"), nullable=False),
+        sa.Column("bid_id", sa.Integer(), sa.ForeignKey("bid.id"), nullable=False),
+        sa.Column("client_id", sa.Integer(), sa.ForeignKey("client.id"), nullable=False),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False),
+        sa.Column("terms_and_conditions", sa.Text(), nullable=False),
+        sa.Column("client_signature_path", sa.String(), nullable=True),
+        sa.Column("service_provider_signature_path", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    if _create_table(
+        "refresh_token",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("token_hash", sa.String(64), nullable=False),
+        sa.Column("family_id", sa.String(32), nullable=False),
+        sa.Column("role", sa.String(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    ):
+        op.create_index("ix_refresh_token_token_hash", "refresh_token", ["token_hash"], unique=True)
+        op.create_index("ix_refresh_token_family_id", "refresh_token", ["family_id"])
+
+
+def downgrade() -> None:
+    for name in (
+        "refresh_token", "contract", "bid", "project", "service_provider_profile",
+        "certifications", "educations", "work_experiences", "portfolio_projects",
+        "service_provider", "client",
+    ):
+        op.drop_table(name)
@@ -0,0 +1,39 @@
+"""indexes for foreign keys and hot listing queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_project_client_id_created_at", "project", ["client_id", sa.text("created_at DESC")]),
+    ("ix_bid_project_id_created_at", "bid", ["project_id", "created_at"]),
+    ("ix_bid_service_provider_id_created_at", "bid", ["service_provider_id", "created_at"]),
+    ("ix_bid_service_provider_id_status", "bid", ["service_provider_id", "status"]),
+    ("ix_contract_project_id", "contract", ["project_id"]),
+    ("ix_contract_bid_id", "contract", ["bid_id"]),
+    ("ix_contract_client_id_created_at", "contract", ["client_id", sa.text("created_at DESC")]),
+    ("ix_contract_service_provider_id_created_at", "contract", ["service_provider_id", sa.text("created_at DESC")]),
+    ("ix_portfolio_projects_service_provider_id", "portfolio_projects", ["service_provider_id"]),
+    ("ix_work_experiences_service_provider_id", "work_experiences", ["service_provider_id"]),
+    ("ix_educations_service_provider_id", "educations", ["service_provider_id"]),
+    ("ix_certifications_service_provider_id", "certifications", ["service_provider_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
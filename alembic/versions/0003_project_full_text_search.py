@@ -0,0 +1,26 @@
+"""full-text search and marketplace index for open projects
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.fts import create_project_fts, drop_project_fts
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_project_status_created_at", "project", ["status", sa.text("created_at DESC")])
+    create_project_fts(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_project_fts(op.get_bind())
+    op.drop_index("ix_project_status_created_at", table_name="project")
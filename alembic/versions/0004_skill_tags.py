@@ -0,0 +1,131 @@
+"""normalized skill tags
+
+Adds skill / skill_alias and the project_skill / service_provider_skill
+association tables, then backfills them by parsing the existing free-text
+project.skills_required and service_provider.skills columns.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import re
+
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# A frozen copy of app.core.skills.parse_skills as of this revision, so the
+# backfill stays the same when the live parser changes.
+_ALIASES = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "angularjs": "angular",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "aws cloud": "aws",
+    "amazon web services": "aws",
+}
+
+_SEPARATORS = re.compile(r"[,;|\n]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _parse_skills(text):
+    names = []
+    for part in _SEPARATORS.split(text or ""):
+        name = _WHITESPACE.sub(" ", part.strip().lower())
+        if not name:
+            continue
+        name = _ALIASES.get(name, name)[:100]
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def _backfill(bind, skill_ids, source_sql, table, entity_column):
+    rows = []
+    for entity_id, text in bind.execute(sa.text(source_sql)).all():
+        for name in _parse_skills(text):
+            if name not in skill_ids:
+                skill_ids[name] = bind.execute(
+                    sa.text("INSERT INTO skill (name) VALUES (:name)"), {"name": name}
+                ).lastrowid
+            rows.append({entity_column: entity_id, "skill_id": skill_ids[name]})
+    if rows:
+        op.bulk_insert(table, rows)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "skill",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+    )
+    op.create_index("ix_skill_id", "skill", ["id"])
+    op.create_index("ix_skill_name", "skill", ["name"], unique=True)
+
+    op.create_table(
+        "skill_alias",
+        sa.Column("alias", sa.String(100), primary_key=True),
+        sa.Column("skill_id", sa.Integer(), sa.ForeignKey("skill.id", ondelete="CASCADE"), nullable=False),
+    )
+    op.create_index("ix_skill_alias_skill_id", "skill_alias", ["skill_id"])
+
+    project_skill = op.create_table(
+        "project_skill",
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("project.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("skill_id", sa.Integer(), sa.ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True),
+    )
+    op.create_index("ix_project_skill_skill_id_project_id", "project_skill", ["skill_id", "project_id"])
+
+    service_provider_skill = op.create_table(
+        "service_provider_skill",
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("skill_id", sa.Integer(), sa.ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True),
+    )
+    op.create_index(
+        "ix_service_provider_skill_skill_id_service_provider_id",
+        "service_provider_skill", ["skill_id", "service_provider_id"],
+    )
+
+    bind = op.get_bind()
+    skill_ids = {}
+    _backfill(
+        bind, skill_ids,
+        "SELECT id, skills_required FROM project WHERE skills_required IS NOT NULL",
+        project_skill, "project_id",
+    )
+    _backfill(
+        bind, skill_ids,
+        "SELECT id, skills FROM service_provider WHERE skills IS NOT NULL",
+        service_provider_skill, "service_provider_id",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("service_provider_skill")
+    op.drop_table("project_skill")
+    op.drop_table("skill_alias")
+    op.drop_table("skill")
@@ -0,0 +1,100 @@
+"""numeric project budget columns
+
+Adds project.budget_min / budget_max, parsed from the free-text budget_range
+(backfilled here for existing rows), and an index on
+(currency, budget_min, budget_max) for budget range filters.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+import re
+
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# A frozen copy of app.core.budget.parse_budget_range as of this revision, so
+# the backfill stays the same when the live parser changes.
+_NUMBER = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(?:(k|m|lakhs?|lacs?|crores?|cr)\b)?", re.IGNORECASE)
+_UPPER_BOUND = re.compile(r"\b(?:under|up\s*to|below|less\s+than|max(?:imum)?|within)\b|<", re.IGNORECASE)
+_LOWER_BOUND = re.compile(r"\b(?:above|over|more\s+than|min(?:imum)?|at\s+least|from|starting)\b|>", re.IGNORECASE)
+_MULTIPLIERS = {
+    "k": 1_000,
+    "m": 1_000_000,
+    "lakh": 100_000,
+    "lakhs": 100_000,
+    "lac": 100_000,
+    "lacs": 100_000,
+    "cr": 10_000_000,
+    "crore": 10_000_000,
+    "crores": 10_000_000,
+}
+_MAX_BUDGET = 2_147_483_647
+
+
+def _amount(number, unit):
+    value = int(float(number.replace(",", "")) * _MULTIPLIERS.get(unit.lower(), 1))
+    if value > _MAX_BUDGET:
+        raise ValueError(f"Budget amounts must not exceed {_MAX_BUDGET}")
+    return value
+
+
+def _parse_budget_range(text):
+    matches = list(_NUMBER.finditer(text))[:2]
+    if not matches:
+        return None, None
+
+    parts = [(m.group(1), m.group(2) or "") for m in matches]
+    if len(parts) == 2:
+        (first, first_unit), (second, second_unit) = parts
+        if not first_unit and second_unit and float(first.replace(",", "")) <= float(second.replace(",", "")):
+            parts[0] = (first, second_unit)
+    amounts = [_amount(number, unit) for number, unit in parts]
+
+    if len(amounts) == 1:
+        prefix = text[:matches[0].start()]
+        if text.rstrip().endswith("+") or _LOWER_BOUND.search(prefix):
+            return amounts[0], None
+        if _UPPER_BOUND.search(prefix):
+            return None, amounts[0]
+    return min(amounts), max(amounts)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("project") as batch_op:
+        batch_op.add_column(sa.Column("budget_min", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("budget_max", sa.Integer(), nullable=True))
+
+    bind = op.get_bind()
+    rows = []
+    for project_id, budget_range in bind.execute(
+        sa.text("SELECT id, budget_range FROM project WHERE budget_range IS NOT NULL")
+    ).all():
+        try:
+            budget_min, budget_max = _parse_budget_range(budget_range)
+        except ValueError:
+            continue  # Too large for the columns; left unparsed
+        if budget_min is not None or budget_max is not None:
+            rows.append({"id": project_id, "budget_min": budget_min, "budget_max": budget_max})
+    if rows:
+        bind.execute(
+            sa.text("UPDATE project SET budget_min = :budget_min, budget_max = :budget_max WHERE id = :id"),
+            rows,
+        )
+
+    op.create_index(
+        "ix_project_currency_budget_min_budget_max", "project", ["currency", "budget_min", "budget_max"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_currency_budget_min_budget_max", table_name="project")
+    with op.batch_alter_table("project") as batch_op:
+        batch_op.drop_column("budget_max")
+        batch_op.drop_column("budget_min")
@@ -0,0 +1,49 @@
+"""denormalized bid statistics on project
+
+Adds bid_count, bid_amount_total/min/max, last_bid_at and accepted_bid_amount
+to project and fills them from the existing bids.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+BACKFILL = """
+UPDATE project SET
+    bid_count = (SELECT COUNT(*) FROM bid WHERE bid.project_id = project.id),
+    bid_amount_total = (SELECT COALESCE(SUM(bid_amount), 0) FROM bid WHERE bid.project_id = project.id),
+    bid_amount_min = (SELECT MIN(bid_amount) FROM bid WHERE bid.project_id = project.id),
+    bid_amount_max = (SELECT MAX(bid_amount) FROM bid WHERE bid.project_id = project.id),
+    last_bid_at = (SELECT MAX(created_at) FROM bid WHERE bid.project_id = project.id),
+    accepted_bid_amount = (
+        SELECT MAX(bid_amount) FROM bid WHERE bid.project_id = project.id AND bid.status = 'accepted'
+    )
+"""
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("project") as batch_op:
+        batch_op.add_column(sa.Column("bid_count", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("bid_amount_total", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("bid_amount_min", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("bid_amount_max", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("last_bid_at", sa.DateTime(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column("accepted_bid_amount", sa.Integer(), nullable=True))
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("project") as batch_op:
+        for name in (
+            "accepted_bid_amount", "last_bid_at", "bid_amount_max",
+            "bid_amount_min", "bid_amount_total", "bid_count",
+        ):
+            batch_op.drop_column(name)
@@ -0,0 +1,49 @@
+"""assigned service provider on project
+
+Adds project.assigned_service_provider_id (the provider whose bid was
+accepted), backfilled from accepted bids of projects that are not cancelled.
+
+On SQLite the column is added without its foreign key: adding one requires
+rebuilding the table, which would drop the full-text triggers on project.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+FOREIGN_KEY = "fk_project_assigned_service_provider_id"
+
+BACKFILL = """
+UPDATE project SET assigned_service_provider_id = (
+    SELECT MAX(bid.service_provider_id) FROM bid
+    WHERE bid.project_id = project.id AND bid.status = 'accepted'
+)
+WHERE status IS NULL OR status != 'cancelled'
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.add_column("project", sa.Column("assigned_service_provider_id", sa.Integer(), nullable=True))
+    if bind.dialect.name != "sqlite":
+        op.create_foreign_key(
+            FOREIGN_KEY, "project", "service_provider", ["assigned_service_provider_id"], ["id"]
+        )
+    op.execute(BACKFILL)
+    op.create_index("ix_project_assigned_service_provider_id", "project", ["assigned_service_provider_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_assigned_service_provider_id", table_name="project")
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint(FOREIGN_KEY, "project", type_="foreignkey")
+    with op.batch_alter_table("project") as batch_op:
+        batch_op.drop_column("assigned_service_provider_id")
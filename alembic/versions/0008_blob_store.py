@@ -0,0 +1,99 @@
+"""content-addressed blob store
+
+Adds the blob table and the blob id columns on project (submission) and
+contract (both signatures). Existing uploads referenced by the *_path columns
+are copied into static/uploads/blobs/ and their rows repointed; the original
+files are left where they are. Files that no longer exist are skipped.
+
+On SQLite the columns are added without their foreign keys: adding one
+requires rebuilding the table, which would drop the full-text triggers on
+project.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core import blobs
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+# (table, path column, blob id column, foreign key name)
+REFERENCES = [
+    ("project", "submission_pdf_path", "submission_blob_id", "fk_project_submission_blob_id"),
+    ("contract", "client_signature_path", "client_signature_blob_id", "fk_contract_client_signature_blob_id"),
+    (
+        "contract",
+        "service_provider_signature_path",
+        "service_provider_signature_blob_id",
+        "fk_contract_service_provider_signature_blob_id",
+    ),
+]
+
+
+def _backfill(bind, found):
+    for table, path_column, blob_column, _ in REFERENCES:
+        rows = bind.execute(sa.text(
+            f"SELECT id, {path_column} FROM {table} WHERE {path_column} IS NOT NULL AND {blob_column} IS NULL"
+        )).all()
+        for row_id, path in rows:
+            source = os.path.join("static", path)
+            if not os.path.isfile(source):
+                continue
+            extension = blobs.normalize_extension(path)
+            blob_id, size = blobs.import_file(source, extension)
+            extension = found.setdefault(blob_id, (size, extension))[1]
+            bind.execute(
+                sa.text(f"UPDATE {table} SET {blob_column} = :blob_id, {path_column} = :path WHERE id = :id"),
+                {
+                    "blob_id": blob_id,
+                    "path": f"{blobs.BLOB_URL_PREFIX}/{blobs.relative_path(blob_id, extension)}",
+                    "id": row_id,
+                },
+            )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    blob = op.create_table(
+        "blob",
+        sa.Column("id", sa.String(64), primary_key=True),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("extension", sa.String(16), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_blob_ref_count", "blob", ["ref_count"])
+
+    for table, _, blob_column, foreign_key in REFERENCES:
+        op.add_column(table, sa.Column(blob_column, sa.String(64), nullable=True))
+        if bind.dialect.name != "sqlite":
+            op.create_foreign_key(foreign_key, table, "blob", [blob_column], ["id"])
+
+    found = {}
+    _backfill(bind, found)
+    if found:
+        op.bulk_insert(blob, [
+            {"id": blob_id, "size": size, "extension": extension}
+            for blob_id, (size, extension) in found.items()
+        ])
+    op.execute(blobs.RECOUNT_SQL)
+
+
+def downgrade() -> None:
+    # The *_path columns keep pointing at the blob files, which stay on disk.
+    for table, _, blob_column, foreign_key in reversed(REFERENCES):
+        if op.get_bind().dialect.name != "sqlite":
+            op.drop_constraint(foreign_key, table, type_="foreignkey")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(blob_column)
+    op.drop_index("ix_blob_ref_count", table_name="blob")
+    op.drop_table("blob")
@@ -0,0 +1,40 @@
+"""resumable upload sessions
+
+Adds upload_session, which tracks resumable work-submission uploads staged
+in UPLOAD_STAGING_DIR until they are finalized or expire.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "upload_session",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("project.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("service_provider_id", sa.Integer(), sa.ForeignKey("service_provider.id"), nullable=False),
+        sa.Column("file_name", sa.String(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("received", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_upload_session_project_id", "upload_session", ["project_id"])
+    op.create_index("ix_upload_session_expires_at", "upload_session", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_upload_session_expires_at", table_name="upload_session")
+    op.drop_index("ix_upload_session_project_id", table_name="upload_session")
+    op.drop_table("upload_session")
@@ -0,0 +1,79 @@
+"""persisted profile completion
+
+Adds completion_percentage to client and service_provider, plus per-section
+counters (portfolio, experience, education, certification) on
+service_provider, and fills them from the existing profiles.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+COUNTERS = ["portfolio_count", "experience_count", "education_count", "certification_count"]
+
+BACKFILL_COUNTERS = """
+UPDATE service_provider SET
+    portfolio_count = (SELECT COUNT(*) FROM portfolio_projects p WHERE p.service_provider_id = service_provider.id),
+    experience_count = (SELECT COUNT(*) FROM work_experiences w WHERE w.service_provider_id = service_provider.id),
+    education_count = (SELECT COUNT(*) FROM educations e WHERE e.service_provider_id = service_provider.id),
+    certification_count = (SELECT COUNT(*) FROM certifications c WHERE c.service_provider_id = service_provider.id)
+"""
+
+BACKFILL_SERVICE_PROVIDER = """
+UPDATE service_provider SET completion_percentage =
+    CASE WHEN COALESCE(professional_title, '') != '' AND COALESCE(hourly_rate, 0) != 0
+         AND COALESCE(skills, '') != '' THEN 20 ELSE 0 END
+  + CASE WHEN COALESCE(kyc_file, '') != '' THEN 20 ELSE 0 END
+  + CASE WHEN portfolio_count > 0 THEN 15 ELSE 0 END
+  + CASE WHEN experience_count > 0 THEN 15 ELSE 0 END
+  + CASE WHEN education_count > 0 THEN 15 ELSE 0 END
+  + CASE WHEN certification_count > 0 THEN 15 ELSE 0 END
+"""
+
+CLIENT_SECTIONS = [
+    ["profile_photo", "location_country", "location_city", "language", "bio"],
+    ["company_name", "company_size", "industry", "website"],
+    ["preferred_contact_method", "contact_email", "contact_phone", "timezone"],
+    ["billing_name", "tax_gst_number", "billing_contact_email", "billing_contact_phone", "billing_address"],
+]
+
+
+def _client_backfill() -> str:
+    terms = [
+        "CASE WHEN " + " OR ".join(f"COALESCE({column}, '') != ''" for column in columns) + " THEN 25 ELSE 0 END"
+        for columns in CLIENT_SECTIONS
+    ]
+    return "UPDATE client SET completion_percentage = " + "\n  + ".join(terms)
+
+
+def upgrade() -> None:
+    for name in COUNTERS:
+        op.add_column("service_provider", sa.Column(name, sa.Integer(), nullable=False, server_default="0"))
+    for table in ("service_provider", "client"):
+        op.add_column(table, sa.Column("completion_percentage", sa.Integer(), nullable=False, server_default="0"))
+
+    op.execute(BACKFILL_COUNTERS)
+    op.execute(BACKFILL_SERVICE_PROVIDER)
+    op.execute(_client_backfill())
+
+    op.create_index("ix_service_provider_completion_percentage", "service_provider", ["completion_percentage"])
+    op.create_index("ix_client_completion_percentage", "client", ["completion_percentage"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_client_completion_percentage", table_name="client")
+    op.drop_index("ix_service_provider_completion_percentage", table_name="service_provider")
+    with op.batch_alter_table("client") as batch_op:
+        batch_op.drop_column("completion_percentage")
+    with op.batch_alter_table("service_provider") as batch_op:
+        batch_op.drop_column("completion_percentage")
+        for name in reversed(COUNTERS):
+            batch_op.drop_column(name)
@@ -0,0 +1,28 @@
+"""service provider profile version
+
+Adds service_provider.profile_version, bumped by every profile write and used
+to validate cached GET /service-provider/profile responses.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "service_provider", sa.Column("profile_version", sa.Integer(), nullable=False, server_default="0")
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("service_provider") as batch_op:
+        batch_op.drop_column("profile_version")
@@ -0,0 +1,45 @@
+"""provider directory indexes
+
+Replaces the single-column service_provider completion index with composite
+indexes for the GET /service-providers directory (active providers by
+completion, by hourly rate, by availability) and indexes provider locations.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_service_provider_completion_percentage", table_name="service_provider")
+    op.create_index(
+        "ix_service_provider_active_completion_id", "service_provider",
+        ["is_active", "completion_percentage", "id"],
+    )
+    op.create_index(
+        "ix_service_provider_active_hourly_rate_id", "service_provider",
+        ["is_active", "hourly_rate", "id"],
+    )
+    op.create_index(
+        "ix_service_provider_active_availability_completion", "service_provider",
+        ["is_active", "availability", "completion_percentage", "id"],
+    )
+    op.create_index(
+        "ix_service_provider_profile_country_city_sp_id", "service_provider_profile",
+        ["location_country", "location_city", "service_provider_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_service_provider_profile_country_city_sp_id", table_name="service_provider_profile")
+    op.drop_index("ix_service_provider_active_availability_completion", table_name="service_provider")
+    op.drop_index("ix_service_provider_active_hourly_rate_id", table_name="service_provider")
+    op.drop_index("ix_service_provider_active_completion_id", table_name="service_provider")
+    op.create_index("ix_service_provider_completion_percentage", "service_provider", ["completion_percentage"])
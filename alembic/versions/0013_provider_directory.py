@@ -0,0 +1,95 @@
+"""provider directory read model
+
+Adds provider_directory, one row per service provider merged with its
+service_provider_profile, and fills it from both tables. The directory
+indexes from 0012 move from service_provider / service_provider_profile to
+the new table.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+BACKFILL = """
+INSERT INTO provider_directory (
+    id, is_active, name, professional_title, availability, hourly_rate, skills, completion_percentage,
+    full_name, profile_photo, location_country, location_city, language, experience, project_completed
+)
+SELECT
+    sp.id, COALESCE(sp.is_active, 1), sp.name, sp.professional_title, sp.availability, sp.hourly_rate,
+    sp.skills, sp.completion_percentage,
+    p.full_name, p.profile_photo, p.location_country, p.location_city, p.language, p.experience,
+    p.project_completed
+FROM service_provider sp
+LEFT JOIN service_provider_profile p ON p.service_provider_id = sp.id
+"""
+
+INDEXES = [
+    ("ix_provider_directory_active_completion_id", ["is_active", "completion_percentage", "id"]),
+    ("ix_provider_directory_active_hourly_rate_id", ["is_active", "hourly_rate", "id"]),
+    (
+        "ix_provider_directory_active_availability_completion",
+        ["is_active", "availability", "completion_percentage", "id"],
+    ),
+    (
+        "ix_provider_directory_active_location_completion",
+        ["is_active", "location_country", "location_city", "completion_percentage", "id"],
+    ),
+]
+
+SOURCE_INDEXES = [
+    ("ix_service_provider_active_completion_id", "service_provider", ["is_active", "completion_percentage", "id"]),
+    ("ix_service_provider_active_hourly_rate_id", "service_provider", ["is_active", "hourly_rate", "id"]),
+    (
+        "ix_service_provider_active_availability_completion", "service_provider",
+        ["is_active", "availability", "completion_percentage", "id"],
+    ),
+    (
+        "ix_service_provider_profile_country_city_sp_id", "service_provider_profile",
+        ["location_country", "location_city", "service_provider_id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "provider_directory",
+        sa.Column(
+            "id", sa.Integer(), sa.ForeignKey("service_provider.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("professional_title", sa.String(), nullable=True),
+        sa.Column("availability", sa.String(), nullable=True),
+        sa.Column("hourly_rate", sa.Integer(), nullable=True),
+        sa.Column("skills", sa.String(), nullable=True),
+        sa.Column("completion_percentage", sa.Integer(), nullable=False),
+        sa.Column("full_name", sa.String(255), nullable=True),
+        sa.Column("profile_photo", sa.String(500), nullable=True),
+        sa.Column("location_country", sa.String(100), nullable=True),
+        sa.Column("location_city", sa.String(100), nullable=True),
+        sa.Column("language", sa.String(255), nullable=True),
+        sa.Column("experience", sa.String(100), nullable=True),
+        sa.Column("project_completed", sa.Integer(), nullable=True),
+    )
+    op.execute(BACKFILL)
+    for name, columns in INDEXES:
+        op.create_index(name, "provider_directory", columns)
+    for name, table, _ in SOURCE_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in SOURCE_INDEXES:
+        op.create_index(name, table, columns)
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name="provider_directory")
+    op.drop_table("provider_directory")
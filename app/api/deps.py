@@ -1,12 +1,14 @@
-from typing import Generator, Optional, Any
+from dataclasses import dataclass, field
+from typing import Generator, Optional, Any, Tuple, Union
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, ReadSessionLocal
 from app.core import security
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.models.service_provider import ServiceProvider
 from app.models.client import Client
@@ -22,64 +24,169 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-def get_current_service_provider(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> ServiceProvider:
+def get_read_db() -> Generator:
+    """
+    Session for read-only endpoints; uses the read pool when one is configured.
+    """
+    try:
+        db = ReadSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+PRINCIPAL_MODELS = {
+    security.ROLE_CLIENT: Client,
+    security.ROLE_SERVICE_PROVIDER: ServiceProvider,
+}
+
+
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    enabled=settings.PRINCIPAL_CACHE_ENABLED,
+)
+
+
+def invalidate_principal(role: str, user_id: int) -> None:
+    """
+    Drop a cached principal. Call after changing a user's profile or active flag.
+    """
+    principal_cache.invalidate((role, user_id))
+
+
+@dataclass
+class Principal:
+    """
+    The authenticated caller: its role claim and id. The user row is loaded
+    lazily into the request session the first time `user` is accessed.
+    """
+    role: str
+    id: int
+    db: Optional[Session] = field(default=None, repr=False)
+    _user: Any = field(default=None, repr=False)
+
+    @property
+    def is_client(self) -> bool:
+        return self.role == security.ROLE_CLIENT
+
+    @property
+    def is_service_provider(self) -> bool:
+        return self.role == security.ROLE_SERVICE_PROVIDER
+
+    @property
+    def user(self) -> Union[Client, ServiceProvider]:
+        if self._user is None:
+            self._user = self.db.get(PRINCIPAL_MODELS[self.role], self.id)
+            if self._user is None:
+                principal_cache.invalidate((self.role, self.id))
+                raise HTTPException(status_code=404, detail="User not found")
+        return self._user
+
+
+def decode_token(token: str) -> Tuple[str, int]:
+    """
+    Validate the token and return its (role, user id).
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Could not validate credentials",
+    )
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
         )
         token_data = TokenPayload(**payload)
     except (JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
-    user = db.query(ServiceProvider).filter(ServiceProvider.id == token_data.sub).first()
-    if not user:
+        raise credentials_exception
+    if token_data.role not in PRINCIPAL_MODELS or token_data.sub is None:
+        raise credentials_exception
+    try:
+        return token_data.role, int(token_data.sub)
+    except ValueError:
+        raise credentials_exception
+
+
+def cache_is_active(key: Tuple[str, int], row: Any) -> bool:
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
-    if not user.is_active:
+    is_active = bool(row.is_active)
+    principal_cache.set(key, is_active)
+    return is_active
+
+
+def require_active(is_active: bool) -> None:
+    if not is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return user
 
-def get_current_client(
+
+def get_current_principal(
     db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> Client:
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+) -> Principal:
+    """
+    Decode the token once and check the user in the table named by its role claim.
+    Only (id, is_active) is read, and the result is cached per (role, id).
+    """
+    key = decode_token(token)
+    role, user_id = key
+    is_active = principal_cache.get(key)
+    if is_active is None:
+        model = PRINCIPAL_MODELS[role]
+        is_active = cache_is_active(
+            key, db.query(model.id, model.is_active).filter(model.id == user_id).first()
         )
-        token_data = TokenPayload(**payload)
-    except (JWTError, ValidationError):
+    require_active(is_active)
+    return Principal(role=role, id=user_id, db=db)
+
+def require_service_provider(principal: Principal) -> Principal:
+    if not principal.is_service_provider:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
+            detail="Could not validate credentials as ServiceProvider",
         )
-    user = db.query(Client).filter(Client.id == token_data.sub).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    if not user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return user
+    return principal
+
+def require_client(principal: Principal) -> Principal:
+    if not principal.is_client:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials as Client",
+        )
+    return principal
+
+def get_current_service_provider_principal(
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
+    return require_service_provider(principal)
+
+def get_current_client_principal(
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
+    return require_client(principal)
+
+def get_current_service_provider(
+    principal: Principal = Depends(get_current_service_provider_principal),
+) -> ServiceProvider:
+    return principal.user
+
+def get_current_client(
+    principal: Principal = Depends(get_current_client_principal),
+) -> Client:
+    return principal.user
 
 def get_current_active_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+    principal: Principal = Depends(get_current_principal),
 ) -> Any:
     """
     Authenticate the user as a Client or a Service Provider.
     Used for endpoints that provide mutual visibility.
     """
-    # Try client first
-    try:
-        return get_current_client(db, token)
-    except HTTPException:
-        pass
-    
-    # Try service provider
-    try:
-        return get_current_service_provider(db, token)
-    except HTTPException:
+    return principal.user
+
+def get_current_active_superuser(
+    current_user: Client = Depends(get_current_client),
+) -> Client:
+    if not current_user.is_superuser:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials as Client or ServiceProvider",
+            status_code=400, detail="The user doesn't have enough privileges"
         )
+    return current_user
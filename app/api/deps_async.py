@@ -0,0 +1,45 @@
+from typing import AsyncGenerator
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import (
+    PRINCIPAL_MODELS, Principal, cache_is_active, decode_token, oauth2_scheme,
+    principal_cache, require_active, require_client, require_service_provider,
+)
+from app.db.async_session import get_async_sessionmaker
+
+# Dependencies of the async stack (ASYNC_DB_ENABLED). Kept out of deps.py so
+# the sync app imports without the async drivers or greenlet.
+
+async def get_async_db() -> AsyncGenerator:
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+async def get_current_principal_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """
+    Async counterpart of get_current_principal. The returned Principal has no
+    sync session, so async handlers work from `principal.id` only.
+    """
+    key = decode_token(token)
+    role, user_id = key
+    is_active = principal_cache.get(key)
+    if is_active is None:
+        model = PRINCIPAL_MODELS[role]
+        result = await db.execute(select(model.id, model.is_active).where(model.id == user_id))
+        is_active = cache_is_active(key, result.first())
+    require_active(is_active)
+    return Principal(role=role, id=user_id)
+
+async def get_current_service_provider_principal_async(
+    principal: Principal = Depends(get_current_principal_async),
+) -> Principal:
+    return require_service_provider(principal)
+
+async def get_current_client_principal_async(
+    principal: Principal = Depends(get_current_principal_async),
+) -> Principal:
+    return require_client(principal)
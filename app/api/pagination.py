@@ -0,0 +1,101 @@
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import String, and_, literal, or_
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """
+    Query parameters shared by paginated listings: `limit` plus either an
+    opaque `cursor` (keyset paging) or a legacy `offset`.
+    """
+
+    def __init__(
+        self,
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+        offset: Optional[int] = Query(None, ge=0, description="Offset paging, kept for older clients"),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.offset = offset
+        self.sort_attr: Optional[str] = None  # set by paginate()
+
+
+def _cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        # Same text SQLite holds for CURRENT_TIMESTAMP, which fills every
+        # datetime sort key here (no fraction), and for datetimes SQLAlchemy
+        # binds with a non-zero fraction; MySQL converts it for the comparison.
+        return value.isoformat(sep=" ")
+    return value
+
+
+def encode_cursor(sort_value: Any, last_id: int) -> str:
+    payload = {"v": _cursor_value(sort_value), "id": last_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        value = payload["v"]
+        if value is not None and not isinstance(value, (str, int, float)):
+            raise ValueError(value)
+        return value, int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(query: Any, page: PageParams, sort_key: Any, id_column: Any, descending: bool = True) -> Any:
+    """
+    Order `query` by (sort_key, id) and restrict it to the requested page.
+
+    Works on both ORM Query and Core Select objects. The cursor carries the
+    last row's (sort value, id), so the next page starts in the right place
+    even if that row was updated or deleted in between. `sort_key` must be a
+    non-NULL column or hybrid whose name is also an attribute of each result
+    row (page_items reads the value from it). One extra row is fetched to
+    tell whether another page exists.
+    """
+    page.sort_attr = sort_key.key
+    if descending:
+        query = query.order_by(sort_key.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_key.asc(), id_column.asc())
+
+    if page.cursor:
+        value, last_id = decode_cursor(page.cursor)
+        # Strings (datetimes) are bound untyped so they compare as stored.
+        anchor = literal(value, String()) if isinstance(value, str) else literal(value)
+        if descending:
+            after = or_(sort_key < anchor, and_(sort_key == anchor, id_column < last_id))
+        else:
+            after = or_(sort_key > anchor, and_(sort_key == anchor, id_column > last_id))
+        query = query.filter(after)
+    elif page.offset:
+        query = query.offset(page.offset)
+
+    return query.limit(page.limit + 1)
+
+
+def page_items(rows: List[Any], page: PageParams, response: Response) -> List[Any]:
+    """
+    Trim the look-ahead row and expose the next cursor in the response headers.
+    """
+    rows = list(rows)
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(last, page.sort_attr), last.id)
+    return rows
@@ -0,0 +1,101 @@
+from typing import Any, List, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql import Select, Update
+
+from app.core import bid_stats
+from app.models.bid import Bid
+from app.models.contract import Contract
+from app.models.project import Project
+
+# Statements shared by the sync endpoints and their async counterparts
+# (ASYNC_DB_ENABLED), so both stacks run the same SQL. Listing builders return
+# the statement with the sort key that paginate() orders it by.
+
+
+def projects_for(principal: Any) -> Tuple[Select, Any]:
+    """
+    Projects a client created, or the projects a provider is assigned to.
+    """
+    if principal.is_client:
+        return select(Project).where(Project.client_id == principal.id), Project.created_at
+    return (
+        select(Project).where(Project.assigned_service_provider_id == principal.id),
+        Project.last_activity_at,
+    )
+
+
+def project_for(principal: Any, project_id: int) -> Select:
+    """
+    A project visible to the caller: owned by the client, or assigned to the provider.
+    """
+    if principal.is_client:
+        return select(Project).where(Project.id == project_id, Project.client_id == principal.id)
+    return select(Project).where(
+        Project.id == project_id,
+        Project.assigned_service_provider_id == principal.id,
+    )
+
+
+def owned_project(project_id: int, client_id: int) -> Select:
+    return select(Project).where(Project.id == project_id, Project.client_id == client_id)
+
+
+def project_bids(project_id: int) -> Tuple[Select, Any]:
+    """
+    A project's bids, each with its provider's directory row in the same query.
+    """
+    return select(Bid).options(joinedload(Bid.provider)).where(Bid.project_id == project_id), Bid.created_at
+
+
+def provider_bids(service_provider_id: int) -> Tuple[Select, Any]:
+    return select(Bid).where(Bid.service_provider_id == service_provider_id), Bid.created_at
+
+
+def provider_bid(bid_id: int, service_provider_id: int) -> Select:
+    return select(Bid).where(Bid.id == bid_id, Bid.service_provider_id == service_provider_id)
+
+
+def contracts_for(principal: Any) -> Tuple[Select, Any]:
+    if principal.is_client:
+        return select(Contract).where(Contract.client_id == principal.id), Contract.created_at
+    return select(Contract).where(Contract.service_provider_id == principal.id), Contract.created_at
+
+
+def bid_acceptance_checks(project_id: int, bid_id: int, client_id: int) -> Tuple[Select, Select]:
+    """
+    (project owned by the client, bid belongs to the project); each must return a row.
+    """
+    return (
+        select(Project.id).where(Project.id == project_id, Project.client_id == client_id),
+        select(Bid.id).where(Bid.id == bid_id, Bid.project_id == project_id),
+    )
+
+
+def bid_acceptance(project_id: int, bid_id: int) -> Tuple[Update, List[Update]]:
+    """
+    The conditional 'open' -> 'pending_contract' transition, which matches no
+    row once a bid was accepted, and the bid status UPDATEs to run after it.
+    """
+    transition = (
+        update(Project)
+        .where(Project.id == project_id, Project.status == "open")
+        .values(
+            status="pending_contract",
+            assigned_service_provider_id=select(Bid.service_provider_id).where(Bid.id == bid_id).scalar_subquery(),
+            **bid_stats.accepted_values(bid_id),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    statuses = [
+        update(Bid)
+        .where(Bid.id == bid_id)
+        .values(status="accepted")
+        .execution_options(synchronize_session=False),
+        update(Bid)
+        .where(Bid.project_id == project_id, Bid.id != bid_id)
+        .values(status="rejected")
+        .execution_options(synchronize_session=False),
+    ]
+    return transition, statuses
@@ -0,0 +1,131 @@
+import hashlib
+import os
+import re
+import tempfile
+from typing import Any, Sequence, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core import blobs
+from app.core.config import settings
+from app.models.blob import Blob
+
+
+def _write_chunk(buffer: Any, digest: Any, chunk: bytes) -> None:
+    digest.update(chunk)
+    buffer.write(chunk)
+
+
+def _finish(buffer: Any) -> None:
+    buffer.flush()
+    os.fsync(buffer.fileno())
+    buffer.close()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _discard(buffer: Any, path: str) -> None:
+    buffer.close()
+    _remove(path)
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds the {max_bytes // (1024 * 1024)} MB limit",
+    )
+
+
+# Room for the multipart boundaries, part headers and the other form fields
+# sent along with the file.
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadSizeLimit:
+    """
+    ASGI middleware that answers 413 from the Content-Length header before any
+    of the body is read. Without it Starlette's multipart parser spools the
+    whole request to disk before the handler can look at the file size.
+
+    `limits` holds (method, path regex, max file bytes). Requests without a
+    Content-Length (chunked) are still cut off while streaming.
+    """
+    def __init__(self, app: ASGIApp, limits: Sequence[Tuple[str, str, int]]) -> None:
+        self.app = app
+        self.limits = [(method, re.compile(path), max_bytes) for method, path, max_bytes in limits]
+
+    def _limit_for(self, scope: Scope) -> Any:
+        for method, path, max_bytes in self.limits:
+            if scope["method"] == method and path.fullmatch(scope["path"]):
+                return max_bytes
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            max_bytes = self._limit_for(scope)
+            length = dict(scope["headers"]).get(b"content-length", b"")
+            if max_bytes is not None and length.isdigit() and int(length) > max_bytes + MULTIPART_OVERHEAD:
+                response = JSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content={"detail": f"Request body exceeds the {max_bytes // (1024 * 1024)} MB limit"},
+                    headers={"Connection": "close"},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+async def _stream_to_temp(upload: UploadFile, directory: str, max_bytes: int) -> Tuple[str, int, str]:
+    """
+    Stream `upload` into a temporary file in `directory` without blocking the
+    event loop; returns (temp path, size, SHA-256 hex).
+
+    Chunks of UPLOAD_CHUNK_SIZE are hashed and written on the threadpool, and
+    the file is fsynced before returning. The upload is rejected with 413 as
+    soon as it exceeds `max_bytes`, and the partial file removed.
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise _too_large(max_bytes)
+
+    await run_in_threadpool(os.makedirs, directory, exist_ok=True)
+    fd, temp_path = await run_in_threadpool(tempfile.mkstemp, dir=directory, prefix=".upload-", suffix=".part")
+    buffer = os.fdopen(fd, "wb")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while True:
+            chunk = await upload.read(settings.UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large(max_bytes)
+            await run_in_threadpool(_write_chunk, buffer, digest, chunk)
+        await run_in_threadpool(_finish, buffer)
+    except BaseException:
+        await run_in_threadpool(_discard, buffer, temp_path)
+        raise
+    return temp_path, size, digest.hexdigest()
+
+
+async def save_blob(db: Session, upload: UploadFile, max_bytes: int) -> Blob:
+    """
+    Stream `upload` into the content-addressed blob store and take a reference
+    on it. Identical content is stored once, whatever the file name.
+    """
+    temp_path, size, sha256 = await _stream_to_temp(upload, blobs.BLOB_ROOT, max_bytes)
+    extension = blobs.normalize_extension(upload.filename)
+    try:
+        return await run_in_threadpool(blobs.store, db, temp_path, sha256, size, extension)
+    except BaseException:
+        await run_in_threadpool(_remove, temp_path)
+        raise
@@ -1,10 +1,40 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, service_provider, client, project, contract
+from app.core.config import settings
+from app.api.v1.endpoints import auth, service_provider, client, project, contract, marketplace, metrics, directory
+
+
+def with_overrides(base: APIRouter, overrides: APIRouter) -> APIRouter:
+    """
+    A router with every route of `overrides`, plus the routes of `base` that
+    `overrides` does not redefine (matched on path and method).
+    """
+    merged = APIRouter()
+    replaced = {(route.path, method) for route in overrides.routes for method in route.methods}
+    merged.routes.extend(overrides.routes)
+    merged.routes.extend(
+        route for route in base.routes
+        if not any((route.path, method) in replaced for method in route.methods)
+    )
+    return merged
+
+
+project_router = project.router
+contract_router = contract.router
+service_provider_router = service_provider.router
+if settings.ASYNC_DB_ENABLED:
+    # Imported only here: the async stack needs greenlet and the async drivers.
+    from app.api.v1.endpoints import project_async, contract_async, bid_async
+
+    project_router = with_overrides(project.router, project_async.router)
+    contract_router = with_overrides(contract.router, contract_async.router)
+    service_provider_router = with_overrides(service_provider.router, bid_async.router)
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(service_provider.router, prefix="/service-provider", tags=["service-provider"])
+api_router.include_router(service_provider_router, prefix="/service-provider", tags=["service-provider"])
 api_router.include_router(client.router, prefix="/client", tags=["client"])
-api_router.include_router(project.router, prefix="/client/projects", tags=["projects"])
-api_router.include_router(contract.router, prefix="/client/contracts", tags=["contracts"])
-
+api_router.include_router(project_router, prefix="/client/projects", tags=["projects"])
+api_router.include_router(contract_router, prefix="/client/contracts", tags=["contracts"])
+api_router.include_router(marketplace.router, prefix="/marketplace", tags=["marketplace"])
+api_router.include_router(directory.router, prefix="/service-providers", tags=["service-providers"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
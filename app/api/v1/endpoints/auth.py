@@ -1,73 +1,182 @@
-from datetime import timedelta
-from typing import Any
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.api import deps
 from app.core import security
 from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.matching import provider_index
 from app.models.client import Client
 from app.models.service_provider import ServiceProvider
+from app.models.refresh_token import RefreshToken
 from app.schemas.client import Client as ClientSchema, ClientCreate, ClientLogin
 from app.schemas.service_provider import ServiceProvider as ServiceProviderSchema, ServiceProviderCreate, ServiceProviderLogin
-from app.schemas.token import Token
+from app.schemas.token import Token, RefreshTokenRequest
 
 router = APIRouter()
 
 
+def issue_tokens(db: Session, user_id: int, role: str, family_id: Optional[str] = None) -> dict:
+    """
+    Create an access token and a new opaque refresh token. Only the SHA-256 of the
+    refresh token is stored; `family_id` links it to the tokens it was rotated from.
+    """
+    refresh_token = security.create_refresh_token()
+    db.add(RefreshToken(
+        token_hash=security.hash_refresh_token(refresh_token),
+        family_id=family_id or uuid.uuid4().hex,
+        role=role,
+        user_id=user_id,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    db.commit()
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return {
+        "access_token": security.create_access_token(
+            user_id, expires_delta=access_token_expires, role=role
+        ),
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
+
+
+def revoke_token_family(db: Session, family_id: str) -> None:
+    db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None),
+    ).update({RefreshToken.revoked_at: datetime.now(timezone.utc)}, synchronize_session=False)
+    db.commit()
+
+
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(
+    token_in: RefreshTokenRequest,
+    db: Session = Depends(deps.get_db),
+) -> Any:
+    """
+    Exchange a refresh token for a new access token and a rotated refresh token.
+    Presenting a refresh token that was already rotated revokes the whole family.
+    """
+    invalid = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+    )
+    token = db.query(RefreshToken).filter(
+        RefreshToken.token_hash == security.hash_refresh_token(token_in.refresh_token)
+    ).first()
+    if not token:
+        raise invalid
+
+    # An expired token is rejected without being consumed, so a client
+    # retrying with it is not mistaken for reuse.
+    now = datetime.now(timezone.utc)
+    expires_at = token.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    if expires_at <= now:
+        raise invalid
+
+    # Rotate atomically: only one request may consume a given refresh token.
+    consumed = db.query(RefreshToken).filter(
+        RefreshToken.id == token.id,
+        RefreshToken.revoked_at.is_(None),
+    ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+    if not consumed:
+        revoke_token_family(db, token.family_id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected, please login again",
+        )
+    db.commit()
+
+    model = deps.PRINCIPAL_MODELS.get(token.role)
+    user = db.query(model.id, model.is_active).filter(model.id == token.user_id).first() if model else None
+    if not user:
+        raise invalid
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+
+    return issue_tokens(db, token.user_id, token.role, family_id=token.family_id)
+
+
+@router.post("/logout")
+def logout(
+    token_in: RefreshTokenRequest,
+    db: Session = Depends(deps.get_db),
+) -> Any:
+    """
+    Revoke a refresh token and every token rotated from the same login.
+    """
+    token = db.query(RefreshToken).filter(
+        RefreshToken.token_hash == security.hash_refresh_token(token_in.refresh_token)
+    ).first()
+    if token:
+        revoke_token_family(db, token.family_id)
+    return {"detail": "Logged out"}
+
+
+def find_user(db: Session, model: Any, email: str) -> Any:
+    return db.query(model).filter(model.email == email).first()
+
+
+def add_user(db: Session, user: Any) -> Any:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    if isinstance(user, ServiceProvider):
+        provider_index.mark_dirty(user.id)
+    return user
+
+
+# The login and signup handlers are async so they can await the hashing
+# executor without holding a threadpool thread; their queries and commits run
+# on the threadpool through the helpers above.
+
 @router.post("/login/client", response_model=Token)
-def login_client(
+async def login_client(
     login_in: ClientLogin,
     db: Session = Depends(deps.get_db),
 ) -> Any:
     """
     Token login for Clients.
     """
-    user = db.query(Client).filter(Client.email == login_in.email).first()
-    if not user or not security.verify_password(login_in.password, user.hashed_password):
+    user = await run_in_threadpool(find_user, db, Client, login_in.email)
+    if not user or not await password_hasher.verify(login_in.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect email or password",
         )
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {
-        "access_token": security.create_access_token(
-            user.id, expires_delta=access_token_expires
-        ),
-        "token_type": "bearer",
-    }
+    return await run_in_threadpool(issue_tokens, db, user.id, security.ROLE_CLIENT)
 
 
 @router.post("/login/service-provider", response_model=Token)
-def login_service_provider(
+async def login_service_provider(
     login_in: ServiceProviderLogin,
     db: Session = Depends(deps.get_db),
 ) -> Any:
     """
     Token login for Service Providers.
     """
-    user = db.query(ServiceProvider).filter(ServiceProvider.email == login_in.email).first()
-    if not user or not security.verify_password(login_in.password, user.hashed_password):
+    user = await run_in_threadpool(find_user, db, ServiceProvider, login_in.email)
+    if not user or not await password_hasher.verify(login_in.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect email or password",
         )
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {
-        "access_token": security.create_access_token(
-            user.id, expires_delta=access_token_expires
-        ),
-        "token_type": "bearer",
-    }
+    return await run_in_threadpool(issue_tokens, db, user.id, security.ROLE_SERVICE_PROVIDER)
 
 
 @router.post("/signup/client", response_model=ClientSchema)
-def create_client(
+async def create_client(
     *,
     db: Session = Depends(deps.get_db),
     user_in: ClientCreate,
@@ -75,8 +184,7 @@ def create_client(
     """
     Create new client.
     """
-    user = db.query(Client).filter(Client.email == user_in.email).first()
-    if user:
+    if await run_in_threadpool(find_user, db, Client, user_in.email):
         raise HTTPException(
             status_code=400,
             detail="The user with this username already exists in the system.",
@@ -84,18 +192,15 @@ def create_client(
     user = Client(
         email=user_in.email,
         name=user_in.name,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=await password_hasher.hash(user_in.password),
         is_active=True,
         is_superuser=False,
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+    return await run_in_threadpool(add_user, db, user)
 
 
 @router.post("/signup/service-provider", response_model=ServiceProviderSchema)
-def create_service_provider(
+async def create_service_provider(
     *,
     db: Session = Depends(deps.get_db),
     user_in: ServiceProviderCreate,
@@ -103,8 +208,7 @@ def create_service_provider(
     """
     Create new service provider.
     """
-    user = db.query(ServiceProvider).filter(ServiceProvider.email == user_in.email).first()
-    if user:
+    if await run_in_threadpool(find_user, db, ServiceProvider, user_in.email):
         raise HTTPException(
             status_code=400,
             detail="The user with this username already exists in the system.",
@@ -112,20 +216,41 @@ def create_service_provider(
     user = ServiceProvider(
         email=user_in.email,
         name=user_in.name,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=await password_hasher.hash(user_in.password),
         is_active=True,
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+    return await run_in_threadpool(add_user, db, user)
+
+
+async def social_login(db: Session, user_type: str, email: str, name: Optional[str]) -> dict:
+    """
+    Tokens for the `user_type` account with `email`, created with a random
+    password on first login.
+    """
+    if user_type == "client":
+        model, extra = Client, {"is_superuser": False}
+    else:
+        model, extra = ServiceProvider, {}
+    user = await run_in_threadpool(find_user, db, model, email)
+    if not user:
+        user = model(
+            email=email,
+            name=name,
+            hashed_password=await password_hasher.hash(get_random_string()),
+            is_active=True,
+            **extra,
+        )
+        user = await run_in_threadpool(add_user, db, user)
+
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return await run_in_threadpool(issue_tokens, db, user.id, user_type)
 
 
 #--> google auth implementation
 
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
-import requests
 import secrets
 import string
 
@@ -142,7 +267,7 @@ def verify_google_token(token: str):
 from app.schemas.token import GoogleToken
 
 @router.post("/login/google/{user_type}", response_model=Token)
-def login_google(
+async def login_google(
     user_type: str,
     token_data: GoogleToken,
     db: Session = Depends(deps.get_db),
@@ -154,7 +279,7 @@ def login_google(
     if user_type not in ["client", "service_provider"]:
         raise HTTPException(status_code=400, detail="Invalid user type")
 
-    google_data = verify_google_token(token_data.token)
+    google_data = await run_in_threadpool(verify_google_token, token_data.token)
     if not google_data:
         raise HTTPException(status_code=400, detail="Invalid Google token")
 
@@ -162,78 +287,27 @@ def login_google(
     if not email:
         raise HTTPException(status_code=400, detail="Email not found in Google token")
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    if user_type == "client":
-        user = db.query(Client).filter(Client.email == email).first()
-        if not user:
-            password = get_random_string()
-            user = Client(
-                email=email,
-                name=google_data.get("name"),
-                hashed_password=security.get_password_hash(password),
-                is_active=True,
-                is_superuser=False,
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-        
-        if not user.is_active:
-             raise HTTPException(status_code=400, detail="Inactive user")
-
-        return {
-            "access_token": security.create_access_token(
-                user.id, expires_delta=access_token_expires
-            ),
-            "token_type": "bearer",
-        }
-
-    elif user_type == "service_provider":
-        user = db.query(ServiceProvider).filter(ServiceProvider.email == email).first()
-        if not user:
-            password = get_random_string()
-            user = ServiceProvider(
-                email=email,
-                name=google_data.get("name"),
-                hashed_password=security.get_password_hash(password),
-                is_active=True,
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            
-        if not user.is_active:
-             raise HTTPException(status_code=400, detail="Inactive user")
-
-        return {
-            "access_token": security.create_access_token(
-                user.id, expires_delta=access_token_expires
-            ),
-            "token_type": "bearer",
-        }
+    return await social_login(db, user_type, email, google_data.get("name"))
 
 #--> Microsoft auth implementation
 
 from app.schemas.token import MicrosoftToken
+from app.core.jwks import microsoft_jwks_cache
 from jose import jwt
 
 def verify_microsoft_token(token: str):
     try:
-        jwks_url = f'https://login.microsoftonline.com/{settings.MICROSOFT_TENANT_ID}/discovery/v2.0/keys'
-        jwks = requests.get(jwks_url).json()
-        
         header = jwt.get_unverified_header(token)
+        key = microsoft_jwks_cache.get_key(settings.MICROSOFT_TENANT_ID, header['kid'])
         rsa_key = {}
-        for key in jwks['keys']:
-            if key['kid'] == header['kid']:
-                rsa_key = {
-                    'kty': key['kty'],
-                    'kid': key['kid'],
-                    'use': key['use'],
-                    'n': key['n'],
-                    'e': key['e']
-                }
+        if key:
+            rsa_key = {
+                'kty': key['kty'],
+                'kid': key['kid'],
+                'use': key['use'],
+                'n': key['n'],
+                'e': key['e']
+            }
         
         if rsa_key:
             try:
@@ -264,7 +338,7 @@ def verify_microsoft_token(token: str):
 
 
 @router.post('/login/microsoft/{user_type}', response_model=Token)
-def login_microsoft(
+async def login_microsoft(
     user_type: str,
     token_data: MicrosoftToken,
     db: Session = Depends(deps.get_db),
@@ -276,7 +350,7 @@ def login_microsoft(
     if user_type not in ['client', 'service_provider']:
         raise HTTPException(status_code=400, detail='Invalid user type')
 
-    ms_data = verify_microsoft_token(token_data.token)
+    ms_data = await run_in_threadpool(verify_microsoft_token, token_data.token)
     if not ms_data:
         raise HTTPException(status_code=400, detail='Invalid Microsoft token')
 
@@ -285,54 +359,4 @@ def login_microsoft(
     if not email:
         raise HTTPException(status_code=400, detail='Email not found in Microsoft token')
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    if user_type == 'client':
-        user = db.query(Client).filter(Client.email == email).first()
-        if not user:
-            password = get_random_string()
-            user = Client(
-                email=email,
-                name=ms_data.get("name"),
-                hashed_password=security.get_password_hash(password),
-                is_active=True,
-                is_superuser=False,
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-        
-        if not user.is_active:
-             raise HTTPException(status_code=400, detail='Inactive user')
-
-        return {
-            'access_token': security.create_access_token(
-                user.id, expires_delta=access_token_expires
-            ),
-            'token_type': 'bearer',
-        }
-
-    elif user_type == 'service_provider':
-        user = db.query(ServiceProvider).filter(ServiceProvider.email == email).first()
-        if not user:
-            password = get_random_string()
-            user = ServiceProvider(
-                email=email,
-                name=ms_data.get("name"),
-                hashed_password=security.get_password_hash(password),
-                is_active=True,
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            
-        if not user.is_active:
-             raise HTTPException(status_code=400, detail='Inactive user')
-
-        return {
-            'access_token': security.create_access_token(
-                user.id, expires_delta=access_token_expires
-            ),
-            'token_type': 'bearer',
-        }
-
+    return await social_login(db, user_type, email, ms_data.get("name"))
@@ -0,0 +1,86 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps, deps_async, queries
+from app.api.pagination import PageParams, paginate, page_items
+from app.core import bid_stats
+from app.models.project import Project
+from app.models.bid import Bid
+from app.schemas import bid as bid_schemas
+
+# Async counterparts of the bid endpoints in service_provider.py (ASYNC_DB_ENABLED).
+router = APIRouter()
+
+@router.get("/my-bids", response_model=List[bid_schemas.Bid])
+async def get_my_bids(
+    response: Response,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_service_provider: deps.Principal = Depends(deps_async.get_current_service_provider_principal_async),
+    page: PageParams = Depends(),
+) -> Any:
+    """
+    Get all bids submitted by the current service provider, newest first.
+    """
+    stmt, sort_key = queries.provider_bids(current_service_provider.id)
+    result = await db.scalars(paginate(stmt, page, sort_key, Bid.id))
+    return page_items(result.all(), page, response)
+
+@router.post("/projects/{project_id}/bid", response_model=bid_schemas.Bid)
+async def create_project_bid(
+    *,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    project_id: int,
+    bid_in: bid_schemas.BidCreate,
+    current_service_provider: deps.Principal = Depends(deps_async.get_current_service_provider_principal_async),
+) -> Any:
+    """
+    Submit a bid for a project.
+    """
+    project = await db.get(Project, project_id)
+    if not project:
+        raise HTTPException(
+            status_code=404,
+            detail="Project not found",
+        )
+
+    bid = Bid(
+        **bid_in.model_dump(),
+        project_id=project_id,
+        service_provider_id=current_service_provider.id
+    )
+    db.add(bid)
+    await db.flush()
+    await db.execute(bid_stats.bid_added(bid.id, project_id, bid.bid_amount))
+    await db.commit()
+    await db.refresh(bid)
+    return bid
+
+@router.put("/bids/{bid_id}", response_model=bid_schemas.Bid)
+async def update_project_bid(
+    *,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    bid_id: int,
+    bid_in: bid_schemas.BidUpdate,
+    current_service_provider: deps.Principal = Depends(deps_async.get_current_service_provider_principal_async),
+) -> Any:
+    """
+    Update an existing bid.
+    """
+    bid = (await db.scalars(queries.provider_bid(bid_id, current_service_provider.id))).first()
+    if not bid:
+        raise HTTPException(
+            status_code=404,
+            detail="Bid not found or you don't have permission to update it",
+        )
+
+    update_data = bid_in.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(bid, field, value)
+    if "bid_amount" in update_data:
+        await db.flush()
+        await db.execute(bid_stats.recompute(bid.project_id))
+
+    await db.commit()
+    await db.refresh(bid)
+    return bid
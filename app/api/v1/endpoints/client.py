@@ -3,36 +3,12 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core import profile, security
 from app.models.client import Client
 from app.schemas import client as schemas
 
 router = APIRouter()
 
-def calculate_completion_percentage(client: Client) -> int:
-    score = 0
-    
-    # 1. Personal Details - 25%
-    personal_fields = [client.profile_photo, client.location_country, client.location_city, client.language, client.bio]
-    if any(personal_fields):
-        score += 25
-    
-    # 2. Company Information - 25%
-    company_fields = [client.company_name, client.company_size, client.industry, client.website]
-    if any(company_fields):
-        score += 25
-    
-    # 3. Contact Preferences - 25%
-    contact_fields = [client.preferred_contact_method, client.contact_email, client.contact_phone, client.timezone]
-    if any(contact_fields):
-        score += 25
-    
-    # 4. Billing Information - 25%
-    billing_fields = [client.billing_name, client.tax_gst_number, client.billing_contact_email, client.billing_contact_phone, client.billing_address]
-    if any(billing_fields):
-        score += 25
-    
-    return min(score, 100)
-
 @router.get("/profile", response_model=schemas.Client)
 def get_current_client_profile(
     db: Session = Depends(deps.get_db),
@@ -41,7 +17,6 @@ def get_current_client_profile(
     """
     Get current client profile with completion percentage.
     """
-    current_client.completion_percentage = calculate_completion_percentage(current_client)
     return current_client
 
 @router.put("/personal-details", response_model=schemas.Client)
@@ -59,9 +34,11 @@ def update_personal_details(
         setattr(current_client, field, value)
     
     db.add(current_client)
+    db.flush()
+    db.execute(profile.client_rescored(current_client.id))
     db.commit()
+    deps.invalidate_principal(security.ROLE_CLIENT, current_client.id)
     db.refresh(current_client)
-    current_client.completion_percentage = calculate_completion_percentage(current_client)
     return current_client
 
 @router.put("/company-info", response_model=schemas.Client)
@@ -79,9 +56,11 @@ def update_company_info(
         setattr(current_client, field, value)
     
     db.add(current_client)
+    db.flush()
+    db.execute(profile.client_rescored(current_client.id))
     db.commit()
+    deps.invalidate_principal(security.ROLE_CLIENT, current_client.id)
     db.refresh(current_client)
-    current_client.completion_percentage = calculate_completion_percentage(current_client)
     return current_client
 
 @router.put("/contact-preferences", response_model=schemas.Client)
@@ -99,9 +78,11 @@ def update_contact_preferences(
         setattr(current_client, field, value)
     
     db.add(current_client)
+    db.flush()
+    db.execute(profile.client_rescored(current_client.id))
     db.commit()
+    deps.invalidate_principal(security.ROLE_CLIENT, current_client.id)
     db.refresh(current_client)
-    current_client.completion_percentage = calculate_completion_percentage(current_client)
     return current_client
 
 @router.put("/billing-info", response_model=schemas.Client)
@@ -119,7 +100,9 @@ def update_billing_info(
         setattr(current_client, field, value)
     
     db.add(current_client)
+    db.flush()
+    db.execute(profile.client_rescored(current_client.id))
     db.commit()
+    deps.invalidate_principal(security.ROLE_CLIENT, current_client.id)
     db.refresh(current_client)
-    current_client.completion_percentage = calculate_completion_percentage(current_client)
     return current_client
@@ -1,21 +1,21 @@
-import os
-import shutil
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, Response, status, File, UploadFile, Form
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.api import deps
-from app.models.client import Client
+from app.api import deps, queries
+from app.api.pagination import PageParams, paginate, page_items
+from app.api.uploads import save_blob
+from app.core import blobs
+from app.core.config import settings
 from app.models.project import Project
 from app.models.bid import Bid
+from app.models.blob import Blob
 from app.models.contract import Contract
-from app.models.service_provider import ServiceProvider
 from app.schemas import contract as schemas
 
 router = APIRouter()
 
-UPLOAD_DIR = "static/uploads/signatures"
-
 @router.post("/", response_model=schemas.Contract)
 async def create_contract(
     *,
@@ -24,13 +24,35 @@ async def create_contract(
     bid_id: int = Form(...),
     terms_and_conditions: str = Form(...),
     signature_photo: UploadFile = File(...),
-    current_client: Client = Depends(deps.get_current_client),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
 ) -> Any:
     """
     Create a new contract with terms and signature.
     """
+    bid = await run_in_threadpool(get_contractable_bid, db, project_id, bid_id, current_client.id)
+
+    # Save signature photo
+    signature = await save_blob(db, signature_photo, settings.UPLOAD_MAX_SIGNATURE_BYTES)
+
+    # Create contract
+    contract = Contract(
+        project_id=project_id,
+        bid_id=bid_id,
+        client_id=current_client.id,
+        service_provider_id=bid.service_provider_id,
+        terms_and_conditions=terms_and_conditions,
+        client_signature_blob_id=signature.id,
+        client_signature_path=blobs.url_path(signature),
+        status="client_signed"
+    )
+    return await run_in_threadpool(save_contract, db, contract)
+
+# The upload handlers stay async to stream the file; their queries and commits
+# run on the threadpool through these helpers.
+
+def get_contractable_bid(db: Session, project_id: int, bid_id: int, client_id: int) -> Bid:
     # Verify project ownership
-    project = db.query(Project).filter(Project.id == project_id, Project.client_id == current_client.id).first()
+    project = db.query(Project).filter(Project.id == project_id, Project.client_id == client_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -43,46 +65,47 @@ async def create_contract(
     existing_contract = db.query(Contract).filter(Contract.bid_id == bid_id).first()
     if existing_contract:
         raise HTTPException(status_code=400, detail="Contract already exists for this bid")
+    return bid
 
-    # Save signature photo
-    file_extension = os.path.splitext(signature_photo.filename)[1]
-    file_name = f"sig_{project_id}_{bid_id}{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, file_name)
-    
-    # Ensure directory exists
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(signature_photo.file, buffer)
-
-    # Create contract
-    contract = Contract(
-        project_id=project_id,
-        bid_id=bid_id,
-        client_id=current_client.id,
-        service_provider_id=bid.service_provider_id,
-        terms_and_conditions=terms_and_conditions,
-        client_signature_path=f"uploads/signatures/{file_name}",
-        status="client_signed"
-    )
-    
+def save_contract(db: Session, contract: Contract) -> Contract:
     db.add(contract)
     db.commit()
     db.refresh(contract)
     return contract
 
+def get_signable_contract(db: Session, contract_id: int, service_provider_id: int) -> Contract:
+    contract = db.query(Contract).filter(Contract.id == contract_id, Contract.service_provider_id == service_provider_id).first()
+    if not contract:
+        raise HTTPException(status_code=404, detail="Contract not found")
+    
+    if contract.status != "client_signed":
+        raise HTTPException(status_code=400, detail="Contract is not in a signable state")
+    return contract
+
+def complete_signature(db: Session, contract: Contract, signature: Blob) -> Contract:
+    contract.service_provider_signature_blob_id = signature.id
+    contract.service_provider_signature_path = blobs.url_path(signature)
+    contract.status = "fully_signed"
+    
+    # Update project status to in_progress
+    project = db.query(Project).filter(Project.id == contract.project_id).first()
+    if project:
+        project.status = "in_progress"
+    
+    return save_contract(db, contract)
+
 @router.get("/", response_model=List[schemas.Contract])
 def get_contracts(
-    db: Session = Depends(deps.get_db),
-    current_user: Any = Depends(deps.get_current_active_user),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+    page: PageParams = Depends(),
 ) -> Any:
     """
-    Get all contracts relevant to the current user.
+    Get all contracts relevant to the current user, newest first.
     """
-    if isinstance(current_user, Client):
-        return db.query(Contract).filter(Contract.client_id == current_user.id).order_by(Contract.created_at.desc()).all()
-    else:
-        return db.query(Contract).filter(Contract.service_provider_id == current_user.id).order_by(Contract.created_at.desc()).all()
+    stmt, sort_key = queries.contracts_for(current_user)
+    return page_items(db.scalars(paginate(stmt, page, sort_key, Contract.id)).all(), page, response)
 
 
 @router.post("/{contract_id}/sign/service-provider", response_model=schemas.Contract)
@@ -90,36 +113,13 @@ async def sign_contract_sp(
     contract_id: int,
     signature_photo: UploadFile = File(...),
     db: Session = Depends(deps.get_db),
-    current_sp: ServiceProvider = Depends(deps.get_current_service_provider),
+    current_sp: deps.Principal = Depends(deps.get_current_service_provider_principal),
 ) -> Any:
     """
     Service provider signs an existing contract.
     """
-    contract = db.query(Contract).filter(Contract.id == contract_id, Contract.service_provider_id == current_sp.id).first()
-    if not contract:
-        raise HTTPException(status_code=404, detail="Contract not found")
-    
-    if contract.status != "client_signed":
-        raise HTTPException(status_code=400, detail="Contract is not in a signable state")
+    contract = await run_in_threadpool(get_signable_contract, db, contract_id, current_sp.id)
 
     # Save signature photo
-    file_extension = os.path.splitext(signature_photo.filename)[1]
-    file_name = f"sig_sp_{contract.project_id}_{contract.bid_id}{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, file_name)
-    
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(signature_photo.file, buffer)
-
-    contract.service_provider_signature_path = f"uploads/signatures/{file_name}"
-    contract.status = "fully_signed"
-    
-    # Update project status to in_progress
-    project = db.query(Project).filter(Project.id == contract.project_id).first()
-    if project:
-        project.status = "in_progress"
-    
-    db.commit()
-    db.refresh(contract)
-    return contract
+    signature = await save_blob(db, signature_photo, settings.UPLOAD_MAX_SIGNATURE_BYTES)
+    return await run_in_threadpool(complete_signature, db, contract, signature)
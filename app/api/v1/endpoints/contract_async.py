@@ -0,0 +1,25 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps, deps_async, queries
+from app.api.pagination import PageParams, paginate, page_items
+from app.models.contract import Contract
+from app.schemas import contract as schemas
+
+# Async counterparts of the JSON endpoints in contract.py (ASYNC_DB_ENABLED).
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.Contract])
+async def get_contracts(
+    response: Response,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_user: deps.Principal = Depends(deps_async.get_current_principal_async),
+    page: PageParams = Depends(),
+) -> Any:
+    """
+    Get all contracts relevant to the current user, newest first.
+    """
+    stmt, sort_key = queries.contracts_for(current_user)
+    result = await db.scalars(paginate(stmt, page, sort_key, Contract.id))
+    return page_items(result.all(), page, response)
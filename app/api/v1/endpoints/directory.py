@@ -0,0 +1,82 @@
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import true
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.pagination import PageParams, paginate, page_items
+from app.core.skills import parse_skills, service_providers_having_skills, skill_filter_ids
+from app.models.provider_directory import ProviderDirectory
+from app.schemas import service_provider as schemas
+
+router = APIRouter()
+
+# Columns of schemas.ServiceProviderSummary, selected instead of full ORM rows.
+# They include every sort key (completion_percentage, hourly_rate), which
+# page_items reads from the last row to put (sort value, id) in the cursor.
+SUMMARY_COLUMNS = (
+    ProviderDirectory.id,
+    ProviderDirectory.name,
+    ProviderDirectory.professional_title,
+    ProviderDirectory.availability,
+    ProviderDirectory.hourly_rate,
+    ProviderDirectory.skills,
+    ProviderDirectory.completion_percentage,
+    ProviderDirectory.profile_photo,
+    ProviderDirectory.location_country,
+    ProviderDirectory.location_city,
+)
+
+@router.get("/", response_model=List[schemas.ServiceProviderSummary])
+def search_service_providers(
+    response: Response,
+    skills: Optional[str] = Query(None, description="Comma-separated skills"),
+    skills_match: str = Query("all", pattern="^(all|any)$"),
+    min_rate: Optional[int] = Query(None, ge=0),
+    max_rate: Optional[int] = Query(None, ge=0),
+    availability: Optional[str] = None,
+    location_country: Optional[str] = None,
+    location_city: Optional[str] = None,
+    min_completion: Optional[int] = Query(None, ge=0, le=100),
+    sort: str = Query("completion", pattern="^(completion|rate_asc|rate_desc)$"),
+    db: Session = Depends(deps.get_read_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+    page: PageParams = Depends(),
+) -> Any:
+    """
+    Browse active service providers, most complete profiles first by default,
+    from the provider_directory read model. Sorting by rate (or filtering on
+    it) only lists providers that set one. The cursor carries the last row's
+    sort value, so a provider whose score or rate changes between pages does
+    not shift the pages after it.
+    """
+    query = db.query(*SUMMARY_COLUMNS).filter(ProviderDirectory.is_active == true())
+
+    if parse_skills(skills):
+        ids = skill_filter_ids(db, skills, skills_match)
+        if not ids:
+            return []
+        query = query.filter(ProviderDirectory.id.in_(service_providers_having_skills(ids, skills_match)))
+
+    if min_rate is not None:
+        query = query.filter(ProviderDirectory.hourly_rate >= min_rate)
+    if max_rate is not None:
+        query = query.filter(ProviderDirectory.hourly_rate <= max_rate)
+    if availability:
+        query = query.filter(ProviderDirectory.availability == availability)
+    if location_country:
+        query = query.filter(ProviderDirectory.location_country == location_country)
+    if location_city:
+        query = query.filter(ProviderDirectory.location_city == location_city)
+    if min_completion is not None:
+        query = query.filter(ProviderDirectory.completion_percentage >= min_completion)
+
+    if sort == "completion":
+        query = paginate(query, page, ProviderDirectory.completion_percentage, ProviderDirectory.id)
+    else:
+        # Keyset comparisons skip NULLs, so unrated providers cannot be paged by rate.
+        query = query.filter(ProviderDirectory.hourly_rate.is_not(None))
+        query = paginate(
+            query, page, ProviderDirectory.hourly_rate, ProviderDirectory.id, descending=sort == "rate_desc"
+        )
+    return page_items(query.all(), page, response)
@@ -0,0 +1,57 @@
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.pagination import PageParams, paginate, page_items
+from app.core.skills import parse_skills, projects_having_skills, skill_filter_ids
+from app.db.fts import project_text_filter, search_terms
+from app.models.project import Project
+from app.schemas import project as schemas
+
+router = APIRouter()
+
+@router.get("/projects", response_model=List[schemas.MarketplaceProject])
+def search_open_projects(
+    response: Response,
+    q: Optional[str] = Query(None, description="Full-text search over title and description"),
+    skills: Optional[str] = Query(None, description="Comma-separated skills"),
+    skills_match: str = Query("all", pattern="^(all|any)$"),
+    currency: Optional[str] = None,
+    min_budget: Optional[int] = Query(None, ge=0),
+    max_budget: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(deps.get_read_db),
+    page: PageParams = Depends(),
+) -> Any:
+    """
+    Browse open projects, newest first. Projects match a budget filter when
+    their budget range overlaps [min_budget, max_budget].
+    """
+    query = db.query(Project).filter(Project.status == "open")
+
+    if q and search_terms(q):
+        query = query.filter(project_text_filter(db.get_bind().dialect.name, q))
+
+    if parse_skills(skills):
+        ids = skill_filter_ids(db, skills, skills_match)
+        if not ids:
+            return []
+        query = query.filter(Project.id.in_(projects_having_skills(ids, skills_match)))
+
+    if currency:
+        query = query.filter(Project.currency == currency)
+    if min_budget is not None:
+        # budget_max is NULL for open-ended budgets ("5000+"), which reach any minimum.
+        query = query.filter(or_(
+            Project.budget_max >= min_budget,
+            and_(Project.budget_max.is_(None), Project.budget_min.is_not(None)),
+        ))
+    if max_budget is not None:
+        # budget_min is NULL for "under 500" style budgets, which reach any maximum.
+        query = query.filter(or_(
+            Project.budget_min <= max_budget,
+            and_(Project.budget_min.is_(None), Project.budget_max.is_not(None)),
+        ))
+
+    return page_items(paginate(query, page, Project.created_at, Project.id).all(), page, response)
@@ -0,0 +1,29 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.api import deps
+from app.core.hashing import password_hasher
+from app.core.jwks import microsoft_jwks_cache
+from app.core.matching import provider_index
+from app.core.profile import profile_cache
+from app.db.session import pool_stats
+
+router = APIRouter()
+
+
+@router.get("/")
+def get_metrics(
+    current_user: Any = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Runtime counters for caches, pools and executors (superusers only).
+    """
+    return {
+        "password_hashing": password_hasher.stats(),
+        "jwks_cache": microsoft_jwks_cache.stats(),
+        "principal_cache": deps.principal_cache.stats(),
+        "profile_cache": profile_cache.stats(),
+        "db_pool": pool_stats(),
+        "provider_matching": provider_index.stats(),
+    }
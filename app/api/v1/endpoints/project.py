@@ -1,14 +1,24 @@
-import os
-import shutil
+import hashlib
+import secrets
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request, Response, status, File, UploadFile, Form
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.api import deps
-from app.models.client import Client
-from app.models.service_provider import ServiceProvider
+from app.api import queries
+from app.api.pagination import PageParams, paginate, page_items
+from app.api.uploads import save_blob
+from app.core import blobs, upload_sessions
+from app.core.config import settings
+from app.core.matching import provider_index
+from app.core.skills import sync_project_skills
 from app.models.project import Project
 from app.models.bid import Bid
+from app.models.provider_directory import ProviderDirectory
+from app.models.blob import Blob
+from app.models.upload_session import UploadSession
 from app.schemas import project as schemas
 from app.schemas import bid as bid_schemas
 
@@ -19,7 +29,7 @@ def create_project(
     *,
     db: Session = Depends(deps.get_db),
     project_in: schemas.ProjectCreate,
-    current_client: Client = Depends(deps.get_current_client),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
 ) -> Any:
     """
     Create a new project.
@@ -29,49 +39,39 @@ def create_project(
         client_id=current_client.id
     )
     db.add(project)
+    sync_project_skills(db, project)
     db.commit()
     db.refresh(project)
     return project
 
 @router.get("/", response_model=List[schemas.Project])
 def get_projects(
-    db: Session = Depends(deps.get_db),
-    current_user: Any = Depends(deps.get_current_active_user),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+    page: PageParams = Depends(),
 ) -> Any:
     """
     Get all projects relevant to the current user.
     - For Clients: Projects they created.
-    - For Service Providers: Projects they have accepted bids on.
+    - For Service Providers: Projects they are assigned to (accepted bid).
+    Paginated: pass the X-Next-Cursor response header back as `cursor`.
     """
-    if isinstance(current_user, Client):
-        return db.query(Project).filter(Project.client_id == current_user.id).order_by(Project.created_at.desc()).all()
-    else:
-        # Get projects where SP has an accepted bid
-        return db.query(Project).join(Bid).filter(
-            Bid.service_provider_id == current_user.id,
-            Bid.status == "accepted"
-        ).order_by(Project.updated_at.desc()).all()
+    stmt, sort_key = queries.projects_for(current_user)
+    return page_items(db.scalars(paginate(stmt, page, sort_key, Project.id)).all(), page, response)
 
 @router.get("/{project_id}", response_model=schemas.Project)
 def get_project(
     project_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: Any = Depends(deps.get_current_active_user),
+    db: Session = Depends(deps.get_read_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Get a specific project.
     - Client must be the owner.
-    - SP must have an accepted bid.
+    - SP must be assigned to it (accepted bid).
     """
-    if isinstance(current_user, Client):
-        project = db.query(Project).filter(Project.id == project_id, Project.client_id == current_user.id).first()
-    else:
-        project = db.query(Project).join(Bid).filter(
-            Project.id == project_id,
-            Bid.service_provider_id == current_user.id,
-            Bid.status == "accepted"
-        ).first()
-
+    project = db.scalars(queries.project_for(current_user, project_id)).first()
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,12 +84,12 @@ def update_project(
     project_id: int,
     project_in: schemas.ProjectUpdate,
     db: Session = Depends(deps.get_db),
-    current_client: Client = Depends(deps.get_current_client),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
 ) -> Any:
     """
     Update a project.
     """
-    project = db.query(Project).filter(Project.id == project_id, Project.client_id == current_client.id).first()
+    project = db.scalars(queries.owned_project(project_id, current_client.id)).first()
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -99,8 +99,12 @@ def update_project(
     update_data = project_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(project, field, value)
+    if update_data.get("status") == "cancelled":
+        project.assigned_service_provider_id = None
     
     db.add(project)
+    if "skills_required" in update_data:
+        sync_project_skills(db, project)
     db.commit()
     db.refresh(project)
     return project
@@ -109,67 +113,118 @@ def update_project(
 def delete_project(
     project_id: int,
     db: Session = Depends(deps.get_db),
-    current_client: Client = Depends(deps.get_current_client),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
 ) -> Any:
     """
     Delete a project.
     """
-    project = db.query(Project).filter(Project.id == project_id, Project.client_id == current_client.id).first()
+    project = db.scalars(queries.owned_project(project_id, current_client.id)).first()
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
     
+    if project.submission_blob_id:
+        db.execute(blobs.release(project.submission_blob_id))
     db.delete(project)
     db.commit()
     return project
 
-@router.get("/{project_id}/bids", response_model=List[bid_schemas.Bid])
+@router.get("/{project_id}/matches", response_model=List[schemas.ProviderMatch])
+def get_project_matches(
+    project_id: int,
+    limit: int = Query(20, ge=1, le=settings.MATCH_TOP_K_MAX),
+    db: Session = Depends(deps.get_read_db),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
+) -> Any:
+    """
+    Rank active service providers for a project owned by the client, by skill
+    overlap, hourly rate against the budget, availability and profile completeness.
+    """
+    project = db.scalars(queries.owned_project(project_id, current_client.id)).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    matches = provider_index.top_k(
+        [skill.id for skill in project.skills], (project.budget_min, project.budget_max), limit
+    )
+    providers = {
+        sp.id: sp for sp in db.query(ProviderDirectory).filter(
+            ProviderDirectory.id.in_([match.service_provider_id for match in matches])
+        )
+    }
+    return [
+        schemas.ProviderMatch(
+            **match._asdict(),
+            name=providers[match.service_provider_id].name,
+            professional_title=providers[match.service_provider_id].professional_title,
+            hourly_rate=providers[match.service_provider_id].hourly_rate,
+            availability=providers[match.service_provider_id].availability,
+            profile_photo=providers[match.service_provider_id].profile_photo,
+            location_country=providers[match.service_provider_id].location_country,
+            location_city=providers[match.service_provider_id].location_city,
+        )
+        for match in matches
+        if match.service_provider_id in providers
+    ]
+
+@router.get("/{project_id}/bids", response_model=List[bid_schemas.ProjectBid])
 def get_project_bids(
     project_id: int,
-    db: Session = Depends(deps.get_db),
-    current_client: Client = Depends(deps.get_current_client),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
+    page: PageParams = Depends(),
 ) -> Any:
     """
-    Get all bids for a specific project owned by the client.
+    Get all bids for a specific project owned by the client, newest first,
+    each with its provider's directory summary (one query per page).
     """
-    project = db.query(Project).filter(Project.id == project_id, Project.client_id == current_client.id).first()
+    project = db.query(Project.id).filter(Project.id == project_id, Project.client_id == current_client.id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project.bids
+    stmt, sort_key = queries.project_bids(project_id)
+    return page_items(db.scalars(paginate(stmt, page, sort_key, Bid.id)).all(), page, response)
+
+def accept_bid(db: Session, project_id: int, bid_id: int, client_id: int) -> Bid:
+    """
+    Accept `bid_id` and reject every other bid of the project in one transaction,
+    with set-based UPDATEs instead of loading the bids. The project moves from
+    'open' to 'pending_contract' with a conditional UPDATE, so of two concurrent
+    acceptances only one succeeds; the other gets 409.
+    """
+    owned, found = queries.bid_acceptance_checks(project_id, bid_id, client_id)
+    if db.execute(owned).first() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if db.execute(found).first() is None:
+        raise HTTPException(status_code=404, detail="Bid not found")
+
+    transition, statuses = queries.bid_acceptance(project_id, bid_id)
+    if not db.execute(transition).rowcount:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A bid has already been accepted for this project")
+    for stmt in statuses:
+        db.execute(stmt)
+    db.commit()
+    return db.get(Bid, bid_id)
 
 @router.put("/{project_id}/bids/{bid_id}/accept", response_model=bid_schemas.Bid)
 def accept_project_bid(
     project_id: int,
     bid_id: int,
     db: Session = Depends(deps.get_db),
-    current_client: Client = Depends(deps.get_current_client),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
 ) -> Any:
     """
-    Accept a specific bid for a project. 
-    This will set the bid status to 'accepted' and project status to 'in_progress'.
+    Accept a specific bid for an open project.
+    This will set the bid status to 'accepted' and project status to 'pending_contract'.
     All other bids for this project will be set to 'rejected'.
     """
-    project = db.query(Project).filter(Project.id == project_id, Project.client_id == current_client.id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    bid = db.query(Bid).filter(Bid.id == bid_id, Bid.project_id == project_id).first()
-    if not bid:
-        raise HTTPException(status_code=404, detail="Bid not found")
-    
-    project.status = "pending_contract"
-    
-    for b in project.bids:
-        if b.id == bid_id:
-            b.status = "accepted"
-        else:
-            b.status = "rejected"
-            
-    db.commit()
-    db.refresh(bid)
-    return bid
+    return accept_bid(db, project_id, bid_id, current_client.id)
 
 @router.post("/{project_id}/submit-work", response_model=schemas.Project)
 async def submit_project_work(
@@ -177,57 +232,238 @@ async def submit_project_work(
     github_link: str = Form(...),
     work_pdf: UploadFile = File(...),
     db: Session = Depends(deps.get_db),
-    current_sp: ServiceProvider = Depends(deps.get_current_service_provider),
+    current_sp: deps.Principal = Depends(deps.get_current_service_provider_principal),
 ) -> Any:
     """
     Service provider submits their completed work (PDF + GitHub link).
+    Large files can use the resumable upload endpoints below instead.
     """
+    project = await run_in_threadpool(get_submittable_project, db, project_id, current_sp.id)
+
+    # Save PDF
+    submission = await save_blob(db, work_pdf, settings.UPLOAD_MAX_SUBMISSION_BYTES)
+    return await run_in_threadpool(submit_work, db, project, submission, github_link)
+
+def get_submittable_project(db: Session, project_id: int, service_provider_id: int) -> Project:
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Verify this SP has an accepted bid for this project
-    bid = db.query(Bid).filter(
-        Bid.project_id == project_id, 
-        Bid.service_provider_id == current_sp.id,
-        Bid.status == "accepted"
-    ).first()
-    
-    if not bid:
+    if project.assigned_service_provider_id != service_provider_id:
         raise HTTPException(status_code=403, detail="You do not have an accepted bid for this project")
 
     if project.status != "in_progress":
         raise HTTPException(status_code=400, detail="Project is not in a submittable state")
+    return project
 
-    # Save PDF
-    UPLOAD_DIR = "static/uploads/submissions"
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    
-    file_extension = os.path.splitext(work_pdf.filename)[1]
-    file_name = f"work_{project_id}_{current_sp.id}{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, file_name)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(work_pdf.file, buffer)
+def attach_submission(db: Session, project: Project, submission: Blob, github_link: str) -> None:
+    """
+    Point `project` at the submitted file and move it to awaiting_review,
+    releasing any previous submission. The caller commits.
+    """
+    if project.submission_blob_id:
+        db.execute(blobs.release(project.submission_blob_id))
 
-    project.submission_pdf_path = f"uploads/submissions/{file_name}"
+    project.submission_blob_id = submission.id
+    project.submission_pdf_path = blobs.url_path(submission)
     project.submission_github_link = github_link
     project.status = "awaiting_review"
-    
+
+def submit_work(db: Session, project: Project, submission: Blob, github_link: str) -> Project:
+    attach_submission(db, project, submission, github_link)
     db.commit()
     db.refresh(project)
     return project
 
+def get_upload_session(db: Session, project_id: int, upload_id: str, service_provider_id: int) -> UploadSession:
+    session = db.get(UploadSession, upload_id)
+    if not session or session.project_id != project_id or session.service_provider_id != service_provider_id:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if upload_sessions.is_expired(session):
+        db.delete(session)
+        db.commit()
+        upload_sessions.remove_file(upload_id)
+        raise HTTPException(status_code=410, detail="Upload expired")
+    return session
+
+def upload_session_out(session: UploadSession) -> schemas.UploadSession:
+    return schemas.UploadSession(
+        id=session.id,
+        project_id=session.project_id,
+        file_name=session.file_name,
+        size=session.size,
+        offset=session.received,
+        max_chunk_size=settings.UPLOAD_SESSION_MAX_CHUNK_BYTES,
+        expires_at=session.expires_at,
+    )
+
+@router.post("/{project_id}/submit-work/uploads", response_model=schemas.UploadSession)
+def create_submission_upload(
+    project_id: int,
+    upload_in: schemas.UploadSessionCreate,
+    db: Session = Depends(deps.get_db),
+    current_sp: deps.Principal = Depends(deps.get_current_service_provider_principal),
+) -> Any:
+    """
+    Start a resumable work submission upload. Send the file with
+    PUT .../uploads/{upload_id}?offset=N chunks, then finalize it.
+    """
+    upload_sessions.purge_expired(db)
+    get_submittable_project(db, project_id, current_sp.id)
+    if upload_in.size > settings.UPLOAD_MAX_SUBMISSION_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the {settings.UPLOAD_MAX_SUBMISSION_BYTES // (1024 * 1024)} MB limit",
+        )
+
+    session = UploadSession(
+        id=secrets.token_hex(16),
+        project_id=project_id,
+        service_provider_id=current_sp.id,
+        file_name=upload_in.file_name,
+        size=upload_in.size,
+        received=0,
+        expires_at=upload_sessions.new_expiry(),
+    )
+    upload_sessions.create_file(session.id)
+    db.add(session)
+    db.commit()
+    return upload_session_out(session)
+
+@router.get("/{project_id}/submit-work/uploads/{upload_id}", response_model=schemas.UploadSession)
+def get_submission_upload(
+    project_id: int,
+    upload_id: str,
+    db: Session = Depends(deps.get_db),
+    current_sp: deps.Principal = Depends(deps.get_current_service_provider_principal),
+) -> Any:
+    """
+    Current offset of an upload, to resume after a dropped connection.
+    """
+    return upload_session_out(get_upload_session(db, project_id, upload_id, current_sp.id))
+
+@router.put("/{project_id}/submit-work/uploads/{upload_id}", response_model=schemas.UploadSession)
+async def put_submission_upload_chunk(
+    project_id: int,
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0),
+    x_chunk_sha256: str = Header(...),
+    db: Session = Depends(deps.get_db),
+    current_sp: deps.Principal = Depends(deps.get_current_service_provider_principal),
+) -> Any:
+    """
+    Write the raw request body at `offset`, which must equal the upload's
+    current offset (409 otherwise, with the expected value in Upload-Offset).
+    The body must match the X-Chunk-SHA256 header; a rejected chunk leaves
+    the upload unchanged and can simply be sent again.
+    """
+    session = await run_in_threadpool(get_upload_session, db, project_id, upload_id, current_sp.id)
+    if offset != session.received:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Expected offset {session.received}",
+            headers={"Upload-Offset": str(session.received)},
+        )
+
+    limit = min(settings.UPLOAD_SESSION_MAX_CHUNK_BYTES, session.size - offset)
+    chunk = bytearray()
+    async for part in request.stream():
+        chunk += part
+        if len(chunk) > limit:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Chunk exceeds {limit} bytes (chunk size limit or remaining file size)",
+            )
+    if not chunk:
+        raise HTTPException(status_code=400, detail="Empty chunk")
+    if hashlib.sha256(chunk).hexdigest() != x_chunk_sha256.lower():
+        raise HTTPException(status_code=400, detail="Chunk checksum mismatch")
+
+    try:
+        appended = await run_in_threadpool(upload_sessions.append_chunk, db, upload_id, offset, bytes(chunk))
+    except FileNotFoundError:
+        raise HTTPException(status_code=409, detail="Upload already finalized")
+    if not appended:
+        raise HTTPException(status_code=409, detail="Upload offset changed concurrently")
+    await run_in_threadpool(db.refresh, session)
+    return upload_session_out(session)
+
+@router.post("/{project_id}/submit-work/uploads/{upload_id}/finalize", response_model=schemas.Project)
+def finalize_submission_upload(
+    project_id: int,
+    upload_id: str,
+    finalize_in: schemas.UploadSessionFinalize,
+    db: Session = Depends(deps.get_db),
+    current_sp: deps.Principal = Depends(deps.get_current_service_provider_principal),
+) -> Any:
+    """
+    Attach a fully uploaded file to the project as its work submission and
+    move the project to awaiting_review. If `sha256` is given, the assembled
+    file must match it.
+    """
+    session = get_upload_session(db, project_id, upload_id, current_sp.id)
+    project = get_submittable_project(db, project_id, current_sp.id)
+    if session.received != session.size:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload incomplete: {session.received} of {session.size} bytes received",
+            headers={"Upload-Offset": str(session.received)},
+        )
+
+    try:
+        sha256 = upload_sessions.file_sha256(upload_id, session.size)
+    except FileNotFoundError:
+        raise HTTPException(status_code=409, detail="Upload already finalized")
+    if finalize_in.sha256 and finalize_in.sha256.lower() != sha256:
+        raise HTTPException(status_code=400, detail="File checksum mismatch")
+
+    # Only one finalize can remove the session row
+    if not db.execute(
+        delete(UploadSession).where(UploadSession.id == upload_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Upload already finalized")
+
+    extension = blobs.stored_extension(db, sha256, blobs.normalize_extension(session.file_name))
+    try:
+        submission = blobs.store(db, upload_sessions.staging_path(upload_id), sha256, session.size, extension)
+        return submit_work(db, project, submission, finalize_in.github_link)
+    except BaseException:
+        # The rollback brings the session row back, so it needs its staged file
+        # again to be resumed or finalized.
+        db.rollback()
+        upload_sessions.restore_file(upload_id, blobs.file_path(sha256, extension))
+        raise
+
+@router.delete("/{project_id}/submit-work/uploads/{upload_id}")
+def cancel_submission_upload(
+    project_id: int,
+    upload_id: str,
+    db: Session = Depends(deps.get_db),
+    current_sp: deps.Principal = Depends(deps.get_current_service_provider_principal),
+) -> Any:
+    """
+    Abandon an upload and discard the bytes received so far.
+    """
+    session = get_upload_session(db, project_id, upload_id, current_sp.id)
+    db.delete(session)
+    db.commit()
+    upload_sessions.remove_file(upload_id)
+    return {"detail": "Upload cancelled"}
+
 @router.put("/{project_id}/release-funds", response_model=schemas.Project)
 def release_project_funds(
     project_id: int,
     db: Session = Depends(deps.get_db),
-    current_client: Client = Depends(deps.get_current_client),
+    current_client: deps.Principal = Depends(deps.get_current_client_principal),
 ) -> Any:
     """
     Client releases escrowed funds and marks project as completed.
     """
-    project = db.query(Project).filter(Project.id == project_id, Project.client_id == current_client.id).first()
+    project = db.scalars(queries.owned_project(project_id, current_client.id)).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
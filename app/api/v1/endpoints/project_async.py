@@ -0,0 +1,186 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps, deps_async, queries
+from app.api.pagination import PageParams, paginate, page_items
+from app.core import blobs
+from app.core.skills import sync_project_skills
+from app.models.project import Project
+from app.models.bid import Bid
+from app.schemas import project as schemas
+from app.schemas import bid as bid_schemas
+
+# Async counterparts of the JSON endpoints in project.py, served when
+# ASYNC_DB_ENABLED is set. Upload endpoints stay on the sync router.
+router = APIRouter()
+
+async def get_owned_project(db: AsyncSession, project_id: int, client_id: int) -> Project:
+    project = (await db.scalars(queries.owned_project(project_id, client_id))).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return project
+
+@router.post("/", response_model=schemas.Project)
+async def create_project(
+    *,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    project_in: schemas.ProjectCreate,
+    current_client: deps.Principal = Depends(deps_async.get_current_client_principal_async),
+) -> Any:
+    """
+    Create a new project.
+    """
+    project = Project(
+        **project_in.model_dump(),
+        client_id=current_client.id
+    )
+    db.add(project)
+    await db.run_sync(lambda session: sync_project_skills(session, project))
+    await db.commit()
+    await db.refresh(project)
+    return project
+
+@router.get("/", response_model=List[schemas.Project])
+async def get_projects(
+    response: Response,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_user: deps.Principal = Depends(deps_async.get_current_principal_async),
+    page: PageParams = Depends(),
+) -> Any:
+    """
+    Get all projects relevant to the current user.
+    - For Clients: Projects they created.
+    - For Service Providers: Projects they are assigned to (accepted bid).
+    Paginated: pass the X-Next-Cursor response header back as `cursor`.
+    """
+    stmt, sort_key = queries.projects_for(current_user)
+    result = await db.scalars(paginate(stmt, page, sort_key, Project.id))
+    return page_items(result.all(), page, response)
+
+@router.get("/{project_id}", response_model=schemas.Project)
+async def get_project(
+    project_id: int,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_user: deps.Principal = Depends(deps_async.get_current_principal_async),
+) -> Any:
+    """
+    Get a specific project.
+    - Client must be the owner.
+    - SP must be assigned to it (accepted bid).
+    """
+    project = (await db.scalars(queries.project_for(current_user, project_id))).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found or access denied",
+        )
+    return project
+
+@router.put("/{project_id}", response_model=schemas.Project)
+async def update_project(
+    project_id: int,
+    project_in: schemas.ProjectUpdate,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_client: deps.Principal = Depends(deps_async.get_current_client_principal_async),
+) -> Any:
+    """
+    Update a project.
+    """
+    project = await get_owned_project(db, project_id, current_client.id)
+    update_data = project_in.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(project, field, value)
+    if update_data.get("status") == "cancelled":
+        project.assigned_service_provider_id = None
+    if "skills_required" in update_data:
+        await db.run_sync(lambda session: sync_project_skills(session, project))
+
+    await db.commit()
+    await db.refresh(project)
+    return project
+
+@router.delete("/{project_id}", response_model=schemas.Project)
+async def delete_project(
+    project_id: int,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_client: deps.Principal = Depends(deps_async.get_current_client_principal_async),
+) -> Any:
+    """
+    Delete a project.
+    """
+    project = await get_owned_project(db, project_id, current_client.id)
+    if project.submission_blob_id:
+        await db.execute(blobs.release(project.submission_blob_id))
+    await db.delete(project)
+    await db.commit()
+    return project
+
+@router.get("/{project_id}/bids", response_model=List[bid_schemas.ProjectBid])
+async def get_project_bids(
+    project_id: int,
+    response: Response,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_client: deps.Principal = Depends(deps_async.get_current_client_principal_async),
+    page: PageParams = Depends(),
+) -> Any:
+    """
+    Get all bids for a specific project owned by the client, newest first,
+    each with its provider's directory summary (one query per page).
+    """
+    await get_owned_project(db, project_id, current_client.id)
+    stmt, sort_key = queries.project_bids(project_id)
+    result = await db.scalars(paginate(stmt, page, sort_key, Bid.id))
+    return page_items(result.all(), page, response)
+
+@router.put("/{project_id}/bids/{bid_id}/accept", response_model=bid_schemas.Bid)
+async def accept_project_bid(
+    project_id: int,
+    bid_id: int,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_client: deps.Principal = Depends(deps_async.get_current_client_principal_async),
+) -> Any:
+    """
+    Accept a specific bid for an open project.
+    This will set the bid status to 'accepted' and project status to 'pending_contract'.
+    All other bids for this project will be set to 'rejected'; a concurrent
+    second acceptance gets 409.
+    """
+    owned, found = queries.bid_acceptance_checks(project_id, bid_id, current_client.id)
+    if (await db.execute(owned)).first() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if (await db.execute(found)).first() is None:
+        raise HTTPException(status_code=404, detail="Bid not found")
+
+    transition, statuses = queries.bid_acceptance(project_id, bid_id)
+    if not (await db.execute(transition)).rowcount:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="A bid has already been accepted for this project")
+    for stmt in statuses:
+        await db.execute(stmt)
+    await db.commit()
+    return await db.get(Bid, bid_id)
+
+@router.put("/{project_id}/release-funds", response_model=schemas.Project)
+async def release_project_funds(
+    project_id: int,
+    db: AsyncSession = Depends(deps_async.get_async_db),
+    current_client: deps.Principal = Depends(deps_async.get_current_client_principal_async),
+) -> Any:
+    """
+    Client releases escrowed funds and marks project as completed.
+    """
+    project = await get_owned_project(db, project_id, current_client.id)
+
+    if project.status != "awaiting_review":
+        raise HTTPException(status_code=400, detail="Funds can only be released after work submission")
+
+    project.escrow_funded = "released"
+    project.status = "completed"
+
+    await db.commit()
+    await db.refresh(project)
+    return project
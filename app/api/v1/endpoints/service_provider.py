@@ -1,8 +1,13 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Response
+from sqlalchemy import delete, insert
 from sqlalchemy.orm import Session
 
-from app.api import deps
+from app.api import deps, queries
+from app.api.pagination import PageParams, paginate, page_items
+from app.core import bid_stats, profile, provider_directory, security
+from app.core.matching import provider_index
+from app.core.skills import sync_service_provider_skills
 from app.models.service_provider import (
     ServiceProvider, PortfolioProject, WorkExperience, Education, Certification
 )
@@ -15,53 +20,40 @@ router = APIRouter()
 
 @router.get("/my-bids", response_model=List[bid_schemas.Bid])
 def get_my_bids(
-    db: Session = Depends(deps.get_db),
-    current_service_provider: ServiceProvider = Depends(deps.get_current_service_provider),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
+    current_service_provider: deps.Principal = Depends(deps.get_current_service_provider_principal),
+    page: PageParams = Depends(),
 ) -> Any:
     """
-    Get all bids submitted by the current service provider.
+    Get all bids submitted by the current service provider, newest first.
     """
-    return db.query(Bid).filter(Bid.service_provider_id == current_service_provider.id).all()
+    stmt, sort_key = queries.provider_bids(current_service_provider.id)
+    return page_items(db.scalars(paginate(stmt, page, sort_key, Bid.id)).all(), page, response)
 
-def calculate_completion_percentage(sp: ServiceProvider) -> int:
-    score = 0
-    
-    if sp.professional_title and sp.hourly_rate and sp.skills:
-        score += 20
-    
-    
-    if sp.kyc_file:
-        score += 20
-        
-    
-    if sp.portfolio_projects:
-        score += 15
-        
-    
-    if sp.work_experiences:
-        score += 15
-        
-    
-    if sp.educations:
-        score += 15
-        
-    
-    if sp.certifications:
-        score += 15
-        
-    return min(score, 100)
+def profile_response(db: Session, service_provider_id: int) -> Response:
+    """
+    Serialize a provider profile, eagerly loaded, and cache the JSON under
+    the profile_version it was read at.
+    """
+    provider = profile.load_service_provider_profile(db, service_provider_id)
+    body = schemas.ServiceProvider.model_validate(provider).model_dump_json().encode()
+    profile.profile_cache.set(service_provider_id, (provider.profile_version, body))
+    return Response(content=body, media_type="application/json")
 
 @router.get("/profile", response_model=schemas.ServiceProvider)
 def get_current_service_provider_profile(
-    db: Session = Depends(deps.get_db),
-    current_service_provider: ServiceProvider = Depends(deps.get_current_service_provider),
+    db: Session = Depends(deps.get_read_db),
+    current_service_provider: deps.Principal = Depends(deps.get_current_service_provider_principal),
 ) -> Any:
     """
     Get current service provider profile with completion percentage.
+    Served from the response cache while profile_version is unchanged.
     """
-    
-    current_service_provider.completion_percentage = calculate_completion_percentage(current_service_provider)
-    return current_service_provider
+    cached = profile.profile_cache.get(current_service_provider.id)
+    if cached is not None and cached[0] == profile.profile_version(db, current_service_provider.id):
+        return Response(content=cached[1], media_type="application/json")
+    return profile_response(db, current_service_provider.id)
 
 @router.put("/professional-info", response_model=schemas.ServiceProvider)
 def update_professional_info(
@@ -76,12 +68,69 @@ def update_professional_info(
     update_data = info_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(current_service_provider, field, value)
+    if "skills" in update_data:
+        sync_service_provider_skills(db, current_service_provider)
     
     db.add(current_service_provider)
+    db.flush()
+    db.execute(profile.service_provider_rescored(current_service_provider.id))
+    provider_directory.mark(db, [current_service_provider.id])
     db.commit()
-    db.refresh(current_service_provider)
-    current_service_provider.completion_percentage = calculate_completion_percentage(current_service_provider)
-    return current_service_provider
+    provider_index.mark_dirty(current_service_provider.id)
+    deps.invalidate_principal(security.ROLE_SERVICE_PROVIDER, current_service_provider.id)
+    return profile_response(db, current_service_provider.id)
+
+PROFILE_SUMMARY_FIELDS = {"professional_title", "availability", "hourly_rate", "skills"}
+
+PROFILE_SECTION_MODELS = {
+    "portfolio_projects": PortfolioProject,
+    "work_experiences": WorkExperience,
+    "educations": Education,
+    "certifications": Certification,
+}
+
+@router.post("/profile/import", response_model=schemas.ServiceProvider)
+def import_profile(
+    *,
+    db: Session = Depends(deps.get_db),
+    profile_in: schemas.ServiceProviderProfileImport,
+    replace: bool = False,
+    current_service_provider: ServiceProvider = Depends(deps.get_current_service_provider),
+) -> Any:
+    """
+    Import a whole profile (summary, portfolio, experience, education and
+    certifications) in one transaction, with one multi-row INSERT per section.
+    With `replace=true` the existing section entries are deleted first.
+    """
+    summary = profile_in.model_dump(include=PROFILE_SUMMARY_FIELDS, exclude_unset=True)
+    for field, value in summary.items():
+        setattr(current_service_provider, field, value)
+    if "skills" in summary:
+        sync_service_provider_skills(db, current_service_provider)
+    db.add(current_service_provider)
+    db.flush()
+
+    counts = {}
+    for section, model in PROFILE_SECTION_MODELS.items():
+        rows = [
+            {**item.model_dump(), "service_provider_id": current_service_provider.id}
+            for item in getattr(profile_in, section)
+        ]
+        if replace:
+            db.execute(
+                delete(model).where(model.service_provider_id == current_service_provider.id)
+                .execution_options(synchronize_session=False)
+            )
+        if rows:
+            db.execute(insert(model), rows)
+        counts[section] = len(rows)
+    db.execute(profile.sections_changed(current_service_provider.id, counts, replace=replace))
+    provider_directory.mark(db, [current_service_provider.id])
+    db.commit()
+    provider_index.mark_dirty(current_service_provider.id)
+    if summary:
+        deps.invalidate_principal(security.ROLE_SERVICE_PROVIDER, current_service_provider.id)
+    return profile_response(db, current_service_provider.id)
 
 @router.post("/portfolio", response_model=schemas.PortfolioProject)
 def add_portfolio_project(
@@ -98,7 +147,11 @@ def add_portfolio_project(
         service_provider_id=current_service_provider.id
     )
     db.add(project)
+    db.flush()
+    db.execute(profile.section_added(current_service_provider.id, "portfolio_projects"))
+    provider_directory.mark(db, [current_service_provider.id])
     db.commit()
+    provider_index.mark_dirty(current_service_provider.id)
     db.refresh(project)
     return project
 
@@ -117,7 +170,11 @@ def add_work_experience(
         service_provider_id=current_service_provider.id
     )
     db.add(experience)
+    db.flush()
+    db.execute(profile.section_added(current_service_provider.id, "work_experiences"))
+    provider_directory.mark(db, [current_service_provider.id])
     db.commit()
+    provider_index.mark_dirty(current_service_provider.id)
     db.refresh(experience)
     return experience
 
@@ -136,7 +193,11 @@ def add_education(
         service_provider_id=current_service_provider.id
     )
     db.add(education)
+    db.flush()
+    db.execute(profile.section_added(current_service_provider.id, "educations"))
+    provider_directory.mark(db, [current_service_provider.id])
     db.commit()
+    provider_index.mark_dirty(current_service_provider.id)
     db.refresh(education)
     return education
 
@@ -155,7 +216,11 @@ def add_certification(
         service_provider_id=current_service_provider.id
     )
     db.add(certification)
+    db.flush()
+    db.execute(profile.section_added(current_service_provider.id, "certifications"))
+    provider_directory.mark(db, [current_service_provider.id])
     db.commit()
+    provider_index.mark_dirty(current_service_provider.id)
     db.refresh(certification)
     return certification
 
@@ -171,10 +236,12 @@ def upload_kyc_document(
     """
     current_service_provider.kyc_file = file_path
     db.add(current_service_provider)
+    db.flush()
+    db.execute(profile.service_provider_rescored(current_service_provider.id))
+    provider_directory.mark(db, [current_service_provider.id])
     db.commit()
-    db.refresh(current_service_provider)
-    current_service_provider.completion_percentage = calculate_completion_percentage(current_service_provider)
-    return current_service_provider
+    provider_index.mark_dirty(current_service_provider.id)
+    return profile_response(db, current_service_provider.id)
 
 @router.post("/projects/{project_id}/bid", response_model=bid_schemas.Bid)
 def create_project_bid(
@@ -182,7 +249,7 @@ def create_project_bid(
     db: Session = Depends(deps.get_db),
     project_id: int,
     bid_in: bid_schemas.BidCreate,
-    current_service_provider: ServiceProvider = Depends(deps.get_current_service_provider),
+    current_service_provider: deps.Principal = Depends(deps.get_current_service_provider_principal),
 ) -> Any:
     """
     Submit a bid for a project.
@@ -201,6 +268,8 @@ def create_project_bid(
         service_provider_id=current_service_provider.id
     )
     db.add(bid)
+    db.flush()
+    db.execute(bid_stats.bid_added(bid.id, project_id, bid.bid_amount))
     db.commit()
     db.refresh(bid)
     return bid
@@ -211,12 +280,12 @@ def update_project_bid(
     db: Session = Depends(deps.get_db),
     bid_id: int,
     bid_in: bid_schemas.BidUpdate,
-    current_service_provider: ServiceProvider = Depends(deps.get_current_service_provider),
+    current_service_provider: deps.Principal = Depends(deps.get_current_service_provider_principal),
 ) -> Any:
     """
     Update an existing bid.
     """
-    bid = db.query(Bid).filter(Bid.id == bid_id, Bid.service_provider_id == current_service_provider.id).first()
+    bid = db.scalars(queries.provider_bid(bid_id, current_service_provider.id)).first()
     if not bid:
         raise HTTPException(
             status_code=404,
@@ -228,6 +297,9 @@ def update_project_bid(
         setattr(bid, field, value)
     
     db.add(bid)
+    if "bid_amount" in update_data:
+        db.flush()
+        db.execute(bid_stats.recompute(bid.project_id))
     db.commit()
     db.refresh(bid)
     return bid
@@ -0,0 +1,55 @@
+from typing import Any, Dict
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.sql import Update
+
+from app.models.bid import Bid
+from app.models.project import Project
+
+# Statements maintaining the denormalized bid statistics on `project`
+# (bid_count, bid_amount_total/min/max, last_bid_at, accepted_bid_amount).
+# They are plain UPDATEs computed in SQL, so concurrent bids never lose an
+# increment, and they run in the same transaction as the bid change.
+
+
+def bid_added(bid_id: int, project_id: int, amount: int) -> Update:
+    """
+    Fold a new bid into its project's stats. Run after the bid is flushed.
+    """
+    return update(Project).where(Project.id == project_id).values(
+        bid_count=Project.bid_count + 1,
+        bid_amount_total=Project.bid_amount_total + amount,
+        bid_amount_min=case(
+            (or_(Project.bid_amount_min.is_(None), Project.bid_amount_min > amount), amount),
+            else_=Project.bid_amount_min,
+        ),
+        bid_amount_max=case(
+            (or_(Project.bid_amount_max.is_(None), Project.bid_amount_max < amount), amount),
+            else_=Project.bid_amount_max,
+        ),
+        last_bid_at=select(Bid.created_at).where(Bid.id == bid_id).scalar_subquery(),
+    ).execution_options(synchronize_session=False)
+
+
+def recompute(project_id: int) -> Update:
+    """
+    Recompute a project's stats from its bids, for changes that cannot be
+    applied incrementally (an amount edit may move the min or max).
+    """
+    def aggregate(expression: Any) -> Any:
+        return select(expression).where(Bid.project_id == project_id).scalar_subquery()
+
+    return update(Project).where(Project.id == project_id).values(
+        bid_count=aggregate(func.count(Bid.id)),
+        bid_amount_total=aggregate(func.coalesce(func.sum(Bid.bid_amount), 0)),
+        bid_amount_min=aggregate(func.min(Bid.bid_amount)),
+        bid_amount_max=aggregate(func.max(Bid.bid_amount)),
+        last_bid_at=aggregate(func.max(Bid.created_at)),
+    ).execution_options(synchronize_session=False)
+
+
+def accepted_values(bid_id: int) -> Dict[str, Any]:
+    """
+    Extra SET values for the project UPDATE that accepts `bid_id`.
+    """
+    return {"accepted_bid_amount": select(Bid.bid_amount).where(Bid.id == bid_id).scalar_subquery()}
@@ -0,0 +1,128 @@
+import hashlib
+import os
+import re
+import shutil
+from typing import Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Update
+
+from app.models.blob import Blob
+
+# Content-addressed storage for uploaded files. A blob lives at
+# static/uploads/blobs/<ab>/<cd>/<sha256><ext> and never changes once written,
+# so it can be cached forever and shared by every row that uploads the same
+# bytes. blob.ref_count counts the referencing columns (RECOUNT_SQL); gc_blobs.py
+# deletes blobs nobody references.
+
+BLOB_URL_PREFIX = "uploads/blobs"  # Relative to /static, as stored in the *_path columns
+BLOB_ROOT = os.path.join("static", BLOB_URL_PREFIX)
+
+_EXTENSION = re.compile(r"^\.[a-z0-9]{1,15}$")
+
+RECOUNT_SQL = """
+UPDATE blob SET ref_count =
+    (SELECT COUNT(*) FROM project WHERE project.submission_blob_id = blob.id)
+  + (SELECT COUNT(*) FROM contract WHERE contract.client_signature_blob_id = blob.id)
+  + (SELECT COUNT(*) FROM contract WHERE contract.service_provider_signature_blob_id = blob.id)
+"""
+
+
+def normalize_extension(filename: str) -> str:
+    extension = os.path.splitext(filename or "")[1].lower()
+    return extension if _EXTENSION.match(extension) else ""
+
+
+def relative_path(blob_id: str, extension: str) -> str:
+    return f"{blob_id[:2]}/{blob_id[2:4]}/{blob_id}{extension}"
+
+
+def file_path(blob_id: str, extension: str) -> str:
+    return os.path.join(BLOB_ROOT, relative_path(blob_id, extension))
+
+
+def url_path(blob: Blob) -> str:
+    return f"{BLOB_URL_PREFIX}/{relative_path(blob.id, blob.extension)}"
+
+
+def place(temp_path: str, blob_id: str, extension: str) -> None:
+    """
+    Move a fully written temp file into the store, or drop it if the content
+    is already there. The existing file's mtime is refreshed so the garbage
+    collector's grace period covers the reference about to be added.
+    """
+    target = file_path(blob_id, extension)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    try:
+        os.utime(target)
+    except FileNotFoundError:
+        # Not stored yet, or just moved aside by gc_blobs.py
+        os.replace(temp_path, target)
+    else:
+        os.remove(temp_path)
+
+
+def import_file(path: str, extension: str) -> Tuple[str, int]:
+    """
+    Copy an existing file into the store; returns (blob id, size).
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    blob_id = digest.hexdigest()
+    target = file_path(blob_id, extension)
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(path, target)
+    return blob_id, size
+
+
+def acquire(db: Session, blob_id: str, size: int, extension: str) -> Blob:
+    """
+    Add a reference to a stored blob, creating its row on first use. A single
+    upsert, so concurrent uploads of the same content never race on the insert.
+    """
+    values = {"id": blob_id, "size": size, "extension": extension, "ref_count": 1}
+    if db.get_bind().dialect.name == "mysql":
+        stmt = mysql_insert(Blob).values(**values)
+        stmt = stmt.on_duplicate_key_update(ref_count=Blob.ref_count + 1)
+    else:
+        stmt = sqlite_insert(Blob).values(**values).on_conflict_do_update(
+            index_elements=[Blob.id], set_={"ref_count": Blob.ref_count + 1}
+        )
+    db.execute(stmt)
+    return db.get(Blob, blob_id, populate_existing=True)
+
+
+def stored_extension(db: Session, blob_id: str, extension: str) -> str:
+    """
+    The extension `blob_id` is stored under, or `extension` for new content.
+    """
+    stored = db.scalar(select(Blob.extension).where(Blob.id == blob_id))
+    return extension if stored is None else stored
+
+
+def store(db: Session, temp_path: str, blob_id: str, size: int, extension: str) -> Blob:
+    """
+    place() a fully written temp file and acquire() a reference on it.
+    Content that already has a row keeps the row's extension, whatever the
+    new file was called, so the row always names the file on disk.
+    """
+    extension = stored_extension(db, blob_id, extension)
+    place(temp_path, blob_id, extension)
+    return acquire(db, blob_id, size, extension)
+
+
+def release(blob_id: str) -> Update:
+    """
+    Drop one reference to `blob_id`; the file is left for gc_blobs.py.
+    """
+    return update(Blob).where(Blob.id == blob_id, Blob.ref_count > 0).values(
+        ref_count=Blob.ref_count - 1
+    ).execution_options(synchronize_session=False)
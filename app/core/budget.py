@@ -0,0 +1,63 @@
+import re
+from typing import List, Optional, Tuple
+
+_NUMBER = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(?:(k|m|lakhs?|lacs?|crores?|cr)\b)?", re.IGNORECASE)
+
+# Words before a single amount that make it an upper ("under 500") or a
+# lower ("above 500") bound instead of an exact budget.
+_UPPER_BOUND = re.compile(r"\b(?:under|up\s*to|below|less\s+than|max(?:imum)?|within)\b|<", re.IGNORECASE)
+_LOWER_BOUND = re.compile(r"\b(?:above|over|more\s+than|min(?:imum)?|at\s+least|from|starting)\b|>", re.IGNORECASE)
+
+_MULTIPLIERS = {
+    "k": 1_000,
+    "m": 1_000_000,
+    "lakh": 100_000,
+    "lakhs": 100_000,
+    "lac": 100_000,
+    "lacs": 100_000,
+    "cr": 10_000_000,
+    "crore": 10_000_000,
+    "crores": 10_000_000,
+}
+
+# budget_min / budget_max are INT columns
+MAX_BUDGET = 2_147_483_647
+
+
+def _amount(number: str, unit: str) -> int:
+    value = int(float(number.replace(",", "")) * _MULTIPLIERS.get(unit.lower(), 1))
+    if value > MAX_BUDGET:
+        raise ValueError(f"Budget amounts must not exceed {MAX_BUDGET}")
+    return value
+
+
+def parse_budget_range(text: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parse a free-form budget such as "$1000-$5000", "1-5k", "10-20 lakhs" or
+    "₹2 lakh" into (low, high). A unit after the second amount also applies
+    to a bare first one. A single amount gives low == high, except for "5000+"
+    / "above 5000" (no upper bound) and "under 5000" (no lower bound).
+    Unparseable input gives (None, None); amounts too large for the budget
+    columns raise ValueError.
+    """
+    if not text:
+        return None, None
+    matches = list(_NUMBER.finditer(text))[:2]
+    if not matches:
+        return None, None
+
+    parts: List[Tuple[str, str]] = [(m.group(1), m.group(2) or "") for m in matches]
+    if len(parts) == 2:
+        (first, first_unit), (second, second_unit) = parts
+        # "10-20 lakhs" and "1-5k", but not "500 - 2k"
+        if not first_unit and second_unit and float(first.replace(",", "")) <= float(second.replace(",", "")):
+            parts[0] = (first, second_unit)
+    amounts = [_amount(number, unit) for number, unit in parts]
+
+    if len(amounts) == 1:
+        prefix = text[:matches[0].start()]
+        if text.rstrip().endswith("+") or _LOWER_BOUND.search(prefix):
+            return amounts[0], None
+        if _UPPER_BOUND.search(prefix):
+            return None, amounts[0]
+    return min(amounts), max(amounts)
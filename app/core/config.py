@@ -7,17 +7,84 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = "changethis"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+
+    # Password hashing executor: "process" or "thread"
+    PASSWORD_HASH_EXECUTOR: str = "process"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Cache of resolved (role, id) -> is_active for authenticated requests
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # Serialized GET /service-provider/profile responses, keyed by provider id
+    # and checked against service_provider.profile_version on every read
+    PROFILE_CACHE_ENABLED: bool = True
+    PROFILE_CACHE_TTL_SECONDS: int = 300
+    PROFILE_CACHE_MAX_SIZE: int = 10000
     
     MYSQL_SERVER: str = "localhost"
     MYSQL_USER: str = "root"
     MYSQL_PASSWORD: str = "280124"
     MYSQL_DB: str = "Main"
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
+
+    # "sqlite" (local file) or "mysql" (SQLALCHEMY_DATABASE_URI / MYSQL_* settings)
+    DATABASE_BACKEND: str = "sqlite"
+    SQLITE_DATABASE_URI: str = "sqlite:///../sql_app.db"
+
+    # Connection pool; unset values fall back to per-dialect defaults in app.db.session
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_PRE_PING: Optional[bool] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+
+    # Opt-in SQLite production profile (WAL + pragmas + separate read pool)
+    SQLITE_TUNED: bool = False
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_CACHE_SIZE: int = -65536  # negative = KiB, i.e. 64 MiB per connection
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_READ_POOL_SIZE: int = 8
+
+    # Listing pagination
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+
+    # Provider matching (GET /client/projects/{id}/matches)
+    MATCH_MAX_SKILLS: int = 32  # skills per provider kept in the feature matrix
+    MATCH_REBUILD_SECONDS: int = 600  # full reload interval; edits in between are applied incrementally
+    MATCH_REFERENCE_HOURS: int = 160  # hours a project budget is assumed to pay for when comparing hourly rates
+    MATCH_TOP_K_MAX: int = 100
+
+    # File uploads, streamed to disk in chunks off the event loop
+    UPLOAD_CHUNK_SIZE: int = 1048576  # 1 MiB
+    UPLOAD_MAX_SUBMISSION_BYTES: int = 52428800  # 50 MiB work PDFs
+    UPLOAD_MAX_SIGNATURE_BYTES: int = 5242880  # 5 MiB signature photos
+    # Resumable submission uploads (init / PUT chunk / finalize). The staging
+    # directory must be on the same filesystem as static/ so finalized files
+    # can be renamed into the blob store.
+    UPLOAD_STAGING_DIR: str = "upload_staging"
+    UPLOAD_SESSION_MAX_CHUNK_BYTES: int = 8388608  # 8 MiB per PUT
+    UPLOAD_SESSION_TTL_SECONDS: int = 86400  # abandoned sessions are purged after a day of inactivity
+
+    # Serve project, bid and contract endpoints from the AsyncEngine stack
+    ASYNC_DB_ENABLED: bool = False
+    ASYNC_DATABASE_URI: Optional[str] = None  # defaults to the sync URL with an async driver
+
     GOOGLE_CLIENT_ID: Optional[str] = None
     MICROSOFT_CLIENT_ID: Optional[str] = None
     MICROSOFT_TENANT_ID: Optional[str] = None
+    # Local JWKS document to use instead of the Microsoft endpoint (offline/testing)
+    MICROSOFT_JWKS_FILE: Optional[str] = None
+    JWKS_CACHE_TTL_SECONDS: int = 3600
+    JWKS_REFRESH_AHEAD_SECONDS: int = 300
 
-    @validator("SQLALCHEMY_DATABASE_URI", pre=True)
+    @validator("SQLALCHEMY_DATABASE_URI", pre=True, always=True)
     def assemble_db_connection(cls, v: Optional[str], values: Dict[str, Any]) -> Any:
         if isinstance(v, str):
             return v
@@ -26,7 +93,7 @@ class Settings(BaseSettings):
             username=values.get("MYSQL_USER"),
             password=values.get("MYSQL_PASSWORD"),
             host=values.get("MYSQL_SERVER"),
-            path=f"/{values.get('MYSQL_DB') or ''}",
+            path=values.get("MYSQL_DB") or "",
         ))
 
     class Config:
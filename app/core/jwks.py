@@ -0,0 +1,191 @@
+import abc
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+from app.core.config import settings
+
+MICROSOFT_JWKS_URL = "https://login.microsoftonline.com/{tenant}/discovery/v2.0/keys"
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSProvider(abc.ABC):
+    """
+    Source of a JWKS document. Returns the parsed document and the number of
+    seconds it may be cached for (None when the source does not say).
+    """
+
+    @abc.abstractmethod
+    def fetch(self, tenant: str) -> Tuple[Dict[str, Any], Optional[int]]:
+        ...
+
+
+class HTTPJWKSProvider(JWKSProvider):
+    def __init__(self, url_template: str = MICROSOFT_JWKS_URL, timeout: float = 5.0):
+        self.url_template = url_template
+        self.timeout = timeout
+
+    def fetch(self, tenant: str) -> Tuple[Dict[str, Any], Optional[int]]:
+        response = requests.get(self.url_template.format(tenant=tenant), timeout=self.timeout)
+        response.raise_for_status()
+        match = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+        return response.json(), int(match.group(1)) if match else None
+
+
+class FileJWKSProvider(JWKSProvider):
+    """
+    Reads the key set from a local JSON file, for offline development and tests.
+    The path may contain a `{tenant}` placeholder.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def fetch(self, tenant: str) -> Tuple[Dict[str, Any], Optional[int]]:
+        with open(self.path.format(tenant=tenant)) as f:
+            return json.load(f), None
+
+
+class StaticJWKSProvider(JWKSProvider):
+    """
+    Serves an in-memory key set; counts fetches so callers can assert on them.
+    """
+
+    def __init__(self, jwks: Dict[str, Any], max_age: Optional[int] = None):
+        self.jwks = jwks
+        self.max_age = max_age
+        self.fetch_count = 0
+
+    def fetch(self, tenant: str) -> Tuple[Dict[str, Any], Optional[int]]:
+        self.fetch_count += 1
+        return self.jwks, self.max_age
+
+
+class _TenantKeys:
+    def __init__(self) -> None:
+        self.keys: Dict[str, Dict[str, Any]] = {}
+        self.fetched_at = 0.0
+        self.expires_at = 0.0
+        self.refreshing = False
+        self.lock = threading.Lock()
+
+
+class JWKSCache:
+    """
+    In-process JWKS cache keyed by tenant and indexed by `kid`.
+
+    - Keys are kept for the provider's Cache-Control max-age (or `default_ttl`).
+    - Once a key set is within `refresh_ahead` seconds of expiry, the next
+      lookup starts a background refresh and keeps serving the cached keys.
+    - An unknown `kid` triggers a single-flight refetch: concurrent callers wait
+      on the same fetch, and refetches are rate limited by `min_refetch_interval`.
+    """
+
+    def __init__(
+        self,
+        provider: JWKSProvider,
+        default_ttl: int = 3600,
+        refresh_ahead: int = 300,
+        min_refetch_interval: int = 30,
+    ):
+        self.provider = provider
+        self.default_ttl = default_ttl
+        self.refresh_ahead = refresh_ahead
+        self.min_refetch_interval = min_refetch_interval
+        self._tenants: Dict[str, _TenantKeys] = {}
+        self._tenants_lock = threading.Lock()
+        self.fetches = 0
+        self.fetch_errors = 0
+
+    def _entry(self, tenant: str) -> _TenantKeys:
+        with self._tenants_lock:
+            entry = self._tenants.get(tenant)
+            if entry is None:
+                entry = self._tenants[tenant] = _TenantKeys()
+            return entry
+
+    def _load(self, tenant: str, entry: _TenantKeys) -> None:
+        self.fetches += 1
+        try:
+            jwks, max_age = self.provider.fetch(tenant)
+        except Exception:
+            self.fetch_errors += 1
+            raise
+        now = time.monotonic()
+        entry.keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+        entry.fetched_at = now
+        entry.expires_at = now + (max_age if max_age is not None else self.default_ttl)
+
+    def _refresh_in_background(self, tenant: str, entry: _TenantKeys) -> None:
+        # Claimed under the cache lock so only one refresh thread starts per tenant.
+        with self._tenants_lock:
+            if entry.refreshing:
+                return
+            entry.refreshing = True
+
+        def run() -> None:
+            try:
+                with entry.lock:
+                    self._load(tenant, entry)
+            except Exception:
+                logger.exception("JWKS background refresh failed for tenant %s", tenant)
+            finally:
+                with self._tenants_lock:
+                    entry.refreshing = False
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def get_key(self, tenant: str, kid: str) -> Optional[Dict[str, Any]]:
+        entry = self._entry(tenant)
+        now = time.monotonic()
+
+        if now >= entry.expires_at:
+            with entry.lock:
+                # Another caller may have refreshed while we waited for the lock.
+                if time.monotonic() >= entry.expires_at:
+                    self._load(tenant, entry)
+        elif now >= entry.expires_at - self.refresh_ahead and not entry.refreshing:
+            self._refresh_in_background(tenant, entry)
+
+        key = entry.keys.get(kid)
+        if key is not None:
+            return key
+
+        # Unknown kid: the tenant may have rotated keys. Refetch once.
+        fetched_at = entry.fetched_at
+        with entry.lock:
+            if entry.fetched_at == fetched_at and time.monotonic() - fetched_at >= self.min_refetch_interval:
+                self._load(tenant, entry)
+        return entry.keys.get(kid)
+
+    def clear(self) -> None:
+        with self._tenants_lock:
+            self._tenants.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tenants": len(self._tenants),
+            "fetches": self.fetches,
+            "fetch_errors": self.fetch_errors,
+        }
+
+
+def get_jwks_provider() -> JWKSProvider:
+    if settings.MICROSOFT_JWKS_FILE:
+        return FileJWKSProvider(settings.MICROSOFT_JWKS_FILE)
+    return HTTPJWKSProvider()
+
+
+microsoft_jwks_cache = JWKSCache(
+    get_jwks_provider(),
+    default_ttl=settings.JWKS_CACHE_TTL_SECONDS,
+    refresh_ahead=settings.JWKS_REFRESH_AHEAD_SECONDS,
+)
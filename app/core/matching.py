@@ -0,0 +1,306 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.db.session import ReadSessionLocal
+from app.models.provider_directory import ProviderDirectory
+
+# Every feature is scaled to [0, 1]; the score is their weighted sum.
+SKILL_WEIGHT = 0.5
+RATE_WEIGHT = 0.2
+AVAILABILITY_WEIGHT = 0.1
+COMPLETENESS_WEIGHT = 0.2
+
+AVAILABILITY_SCORES = {"full-time": 1.0, "part-time": 0.7, "contract": 0.6}
+UNKNOWN_AVAILABILITY_SCORE = 0.4
+UNKNOWN_RATE_SCORE = 0.5
+
+NO_SKILL = -1
+LOAD_BATCH_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class Match(NamedTuple):
+    service_provider_id: int
+    score: float
+    skill_overlap: int
+    completion_percentage: int
+
+
+class ProviderFeatures:
+    """
+    Column-oriented provider features, one row per provider:
+
+    - skills: (n, max_skills) int32 skill ids, padded with NO_SKILL
+    - rate: hourly_rate as float32, NaN when unset
+    - availability, completeness: float32 scores in [0, 1]
+    - active: rows of inactive or deleted providers are kept but never ranked
+
+    `postings` inverts the skills matrix (skill id -> rows having it), so skill
+    overlap costs a bincount over the rows of the wanted skills instead of a
+    pass over the whole matrix.
+    """
+
+    def __init__(self, max_skills: int, capacity: int = 1024):
+        self.max_skills = max_skills
+        self.size = 0
+        self.rows: Dict[int, int] = {}
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.skills = np.full((capacity, max_skills), NO_SKILL, dtype=np.int32)
+        self.rate = np.full(capacity, np.nan, dtype=np.float32)
+        self.availability = np.zeros(capacity, dtype=np.float32)
+        self.completeness = np.zeros(capacity, dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.postings: Dict[int, np.ndarray] = {}
+
+    def _grow(self) -> None:
+        capacity = max(2 * len(self.ids), 1024)
+        extra = capacity - len(self.ids)
+        self.ids = np.concatenate([self.ids, np.zeros(extra, dtype=np.int64)])
+        self.skills = np.concatenate([self.skills, np.full((extra, self.max_skills), NO_SKILL, dtype=np.int32)])
+        self.rate = np.concatenate([self.rate, np.full(extra, np.nan, dtype=np.float32)])
+        self.availability = np.concatenate([self.availability, np.zeros(extra, dtype=np.float32)])
+        self.completeness = np.concatenate([self.completeness, np.zeros(extra, dtype=np.float32)])
+        self.active = np.concatenate([self.active, np.zeros(extra, dtype=bool)])
+
+    def _row(self, provider_id: int) -> int:
+        row = self.rows.get(provider_id)
+        if row is None:
+            if self.size == len(self.ids):
+                self._grow()
+            row = self.rows[provider_id] = self.size
+            self.ids[row] = provider_id
+            self.size += 1
+        return row
+
+    def build_postings(self) -> None:
+        rows, columns = np.nonzero(self.skills[:self.size] != NO_SKILL)
+        skill_ids = self.skills[rows, columns]
+        order = np.argsort(skill_ids, kind="stable")
+        skill_ids, rows = skill_ids[order], rows[order].astype(np.int32)
+        unique_ids, starts = np.unique(skill_ids, return_index=True)
+        self.postings = dict(zip(unique_ids.tolist(), np.split(rows, starts[1:])))
+
+    def _update_postings(self, row: int, old: Set[int], new: Set[int]) -> None:
+        for skill_id in old - new:
+            self.postings[skill_id] = self.postings[skill_id][self.postings[skill_id] != row]
+        for skill_id in new - old:
+            self.postings[skill_id] = np.append(
+                self.postings.get(skill_id, np.zeros(0, dtype=np.int32)), np.int32(row)
+            )
+
+    def skill_overlap(self, wanted: np.ndarray) -> np.ndarray:
+        rows = [self.postings[skill_id] for skill_id in wanted.tolist() if skill_id in self.postings]
+        if not rows:
+            return np.zeros(self.size, dtype=np.int64)
+        return np.bincount(np.concatenate(rows), minlength=self.size)
+
+    def set(self, provider: ProviderDirectory, update_postings: bool = True) -> None:
+        row = self._row(provider.id)
+        skill_ids = [skill.id for skill in provider.skill_tags][:self.max_skills]
+        if update_postings:
+            old = set(self.skills[row].tolist()) - {NO_SKILL}
+            self._update_postings(row, old, set(skill_ids))
+        self.skills[row] = NO_SKILL
+        self.skills[row, :len(skill_ids)] = skill_ids
+        self.rate[row] = provider.hourly_rate if provider.hourly_rate else np.nan
+        self.availability[row] = AVAILABILITY_SCORES.get(
+            (provider.availability or "").lower(), UNKNOWN_AVAILABILITY_SCORE
+        )
+        self.completeness[row] = provider.completion_percentage / 100
+        self.active[row] = bool(provider.is_active)
+
+    def deactivate(self, provider_id: int) -> None:
+        row = self.rows.get(provider_id)
+        if row is not None:
+            self.active[row] = False
+
+
+def _load_providers(session, ids: Optional[Iterable[int]] = None):
+    stmt = select(ProviderDirectory).options(
+        selectinload(ProviderDirectory.skill_tags),
+    )
+    if ids is not None:
+        stmt = stmt.where(ProviderDirectory.id.in_(list(ids)))
+    return session.execute(stmt.execution_options(yield_per=LOAD_BATCH_SIZE)).scalars()
+
+
+def rate_scores(rate: np.ndarray, budget: Tuple[Optional[int], Optional[int]], reference_hours: int) -> np.ndarray:
+    """
+    How well each hourly rate fits a project budget: 1 when the rate is
+    within budget / reference_hours, falling off proportionally above it.
+    """
+    low, high = budget
+    if low is None and high is None:
+        return np.full(rate.shape, UNKNOWN_RATE_SCORE, dtype=np.float32)
+    if high is None:
+        scores = np.ones(rate.shape, dtype=np.float32)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.clip((high / reference_hours) / rate, 0.0, 1.0)
+    return np.where(np.isnan(rate), UNKNOWN_RATE_SCORE, scores).astype(np.float32)
+
+
+class ProviderIndex:
+    """
+    Ranks active service providers against a project over an in-memory
+    feature matrix.
+
+    The matrix is loaded in full on first use, which is the only load a
+    request waits for. Every `rebuild_seconds` a fresh matrix is built on a
+    background thread and swapped in, while requests keep ranking against the
+    current one. In between, providers passed to `mark_dirty` by the write
+    endpoints are reloaded individually before the next ranking. The periodic
+    rebuild bounds staleness for changes made by other processes.
+    """
+
+    def __init__(self, max_skills: int = 32, rebuild_seconds: int = 600, reference_hours: int = 160):
+        self.max_skills = max_skills
+        self.rebuild_seconds = rebuild_seconds
+        self.reference_hours = reference_hours
+        self._features: Optional[ProviderFeatures] = None
+        self._built_at = 0.0
+        self._dirty: Set[int] = set()
+        self._rebuilding = False
+        # Providers reloaded into the current matrix while a rebuild was
+        # reading them; marked dirty again once the rebuilt matrix is swapped in.
+        self._reloaded_during_rebuild: Set[int] = set()
+        self._lock = threading.Lock()  # guards _features while it is read or changed
+        self._refresh_lock = threading.Lock()  # one reload or swap at a time
+        self.rebuilds = 0
+        self.reloads = 0
+
+    def mark_dirty(self, provider_id: int) -> None:
+        self._dirty.add(provider_id)
+
+    def invalidate(self) -> None:
+        self._built_at = 0.0
+
+    def _build(self) -> ProviderFeatures:
+        features = ProviderFeatures(self.max_skills)
+        with ReadSessionLocal() as session:
+            for provider in _load_providers(session):
+                features.set(provider, update_postings=False)
+        features.build_postings()
+        return features
+
+    def _swap(self, features: ProviderFeatures) -> None:
+        # Called with _refresh_lock held.
+        with self._lock:
+            self._features = features
+        self._dirty.update(self._reloaded_during_rebuild)
+        self._reloaded_during_rebuild = set()
+        self._built_at = time.monotonic()
+        self.rebuilds += 1
+
+    def _rebuild_in_background(self) -> None:
+        with self._refresh_lock:
+            if self._rebuilding or time.monotonic() - self._built_at < self.rebuild_seconds:
+                return
+            self._rebuilding = True
+
+        def run() -> None:
+            try:
+                features = self._build()
+                with self._refresh_lock:
+                    self._swap(features)
+            except Exception:
+                logger.exception("Provider index rebuild failed")
+            finally:
+                with self._refresh_lock:
+                    self._rebuilding = False
+
+        threading.Thread(target=run, name="provider-index-rebuild", daemon=True).start()
+
+    def _reload_dirty(self) -> None:
+        # Called with _refresh_lock held.
+        ids = set()
+        while self._dirty:
+            ids.add(self._dirty.pop())
+        with ReadSessionLocal() as session:
+            providers = list(_load_providers(session, ids))
+            with self._lock:
+                for provider in providers:
+                    self._features.set(provider)
+                for provider_id in ids - {provider.id for provider in providers}:
+                    self._features.deactivate(provider_id)
+        if self._rebuilding:
+            self._reloaded_during_rebuild.update(ids)
+        self.reloads += 1
+
+    def refresh(self) -> None:
+        if self._features is None:
+            with self._refresh_lock:
+                if self._features is None:
+                    self._swap(self._build())
+        elif time.monotonic() - self._built_at >= self.rebuild_seconds:
+            self._rebuild_in_background()
+        if self._dirty:
+            with self._refresh_lock:
+                if self._dirty:
+                    self._reload_dirty()
+
+    def top_k(
+        self,
+        skill_ids: Sequence[int],
+        budget: Tuple[Optional[int], Optional[int]],
+        k: int,
+    ) -> List[Match]:
+        """
+        The `k` best providers for a project requiring `skill_ids` with the
+        given (low, high) budget, best first.
+        """
+        self.refresh()
+        wanted = np.unique(np.asarray(skill_ids, dtype=np.int32))
+        with self._lock:
+            features = self._features
+            n = features.size
+            overlap = features.skill_overlap(wanted)
+            skill_score = overlap / wanted.size if wanted.size else 0.0
+            score = (
+                SKILL_WEIGHT * skill_score
+                + RATE_WEIGHT * rate_scores(features.rate[:n], budget, self.reference_hours)
+                + AVAILABILITY_WEIGHT * features.availability[:n]
+                + COMPLETENESS_WEIGHT * features.completeness[:n]
+            )
+            active = features.active[:n]
+            k = min(k, int(active.sum()))
+            if k <= 0:
+                return []
+            score = np.where(active, score, -np.inf)
+            top = np.argpartition(-score, k - 1)[:k]
+            top = top[np.argsort(-score[top], kind="stable")]
+            return [
+                Match(
+                    service_provider_id=int(features.ids[row]),
+                    score=round(float(score[row]), 4),
+                    skill_overlap=int(overlap[row]),
+                    completion_percentage=int(round(features.completeness[row] * 100)),
+                )
+                for row in top
+            ]
+
+    def stats(self) -> Dict[str, Any]:
+        features = self._features
+        return {
+            "providers": features.size if features else 0,
+            "active": int(features.active[:features.size].sum()) if features else 0,
+            "dirty": len(self._dirty),
+            "rebuilding": self._rebuilding,
+            "rebuilds": self.rebuilds,
+            "reloads": self.reloads,
+        }
+
+
+provider_index = ProviderIndex(
+    max_skills=settings.MATCH_MAX_SKILLS,
+    rebuild_seconds=settings.MATCH_REBUILD_SECONDS,
+    reference_hours=settings.MATCH_REFERENCE_HOURS,
+)
@@ -0,0 +1,154 @@
+from typing import Any, Dict
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql import Update
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.client import Client
+from app.models.service_provider import ServiceProvider
+
+# Statements maintaining the persisted profile completion scores. Service
+# providers keep one counter per profile section (portfolio_count, ...), so the
+# score never needs the child rows; both are updated in SQL, in the same
+# transaction as the profile change. The provider statements also bump
+# profile_version, which validates the serialized profiles in profile_cache.
+
+# provider id -> (profile_version, JSON body of GET /service-provider/profile)
+profile_cache = TTLCache(
+    maxsize=settings.PROFILE_CACHE_MAX_SIZE,
+    ttl=settings.PROFILE_CACHE_TTL_SECONDS,
+    enabled=settings.PROFILE_CACHE_ENABLED,
+)
+
+SECTION_COUNTERS = {
+    "portfolio_projects": "portfolio_count",
+    "work_experiences": "experience_count",
+    "educations": "education_count",
+    "certifications": "certification_count",
+}
+
+
+def _filled(column: Any) -> Any:
+    return func.coalesce(column, "") != ""
+
+
+def _points(condition: Any, points: int) -> Any:
+    return case((condition, points), else_=0)
+
+
+def service_provider_completion(**counters: Any) -> Any:
+    """
+    SQL expression for a provider's completion percentage. Counter columns
+    can be overridden (e.g. with `portfolio_count + 1`) so the score agrees
+    with counters assigned in the same UPDATE on every dialect.
+    """
+    def count(name: str) -> Any:
+        return counters.get(name, getattr(ServiceProvider, name))
+
+    return (
+        _points(
+            _filled(ServiceProvider.professional_title)
+            & (func.coalesce(ServiceProvider.hourly_rate, 0) != 0)
+            & _filled(ServiceProvider.skills),
+            20,
+        )
+        + _points(_filled(ServiceProvider.kyc_file), 20)
+        + _points(count("portfolio_count") > 0, 15)
+        + _points(count("experience_count") > 0, 15)
+        + _points(count("education_count") > 0, 15)
+        + _points(count("certification_count") > 0, 15)
+    )
+
+
+def client_completion() -> Any:
+    """
+    SQL expression for a client's completion percentage: 25 points for each
+    section with at least one field filled in.
+    """
+    sections = [
+        # 1. Personal Details
+        [Client.profile_photo, Client.location_country, Client.location_city, Client.language, Client.bio],
+        # 2. Company Information
+        [Client.company_name, Client.company_size, Client.industry, Client.website],
+        # 3. Contact Preferences
+        [Client.preferred_contact_method, Client.contact_email, Client.contact_phone, Client.timezone],
+        # 4. Billing Information
+        [
+            Client.billing_name, Client.tax_gst_number, Client.billing_contact_email,
+            Client.billing_contact_phone, Client.billing_address,
+        ],
+    ]
+    score = _points(or_(*[_filled(column) for column in sections[0]]), 25)
+    for columns in sections[1:]:
+        score = score + _points(or_(*[_filled(column) for column in columns]), 25)
+    return score
+
+
+def section_added(service_provider_id: int, section: str, count: int = 1) -> Update:
+    """
+    Count `count` new rows in a profile section (a relationship name such as
+    "portfolio_projects"), rescore and bump profile_version. Run after the
+    rows are flushed.
+    """
+    return sections_changed(service_provider_id, {section: count})
+
+
+def sections_changed(service_provider_id: int, counts: Dict[str, int], replace: bool = False) -> Update:
+    """
+    Add `counts` (section -> rows) to the provider's section counters, or set
+    them when `replace`, then rescore and bump profile_version.
+    """
+    values: Dict[str, Any] = {}
+    for section, count in counts.items():
+        counter = SECTION_COUNTERS[section]
+        values[counter] = count if replace else getattr(ServiceProvider, counter) + count
+    return update(ServiceProvider).where(ServiceProvider.id == service_provider_id).values(
+        {
+            **values,
+            "completion_percentage": service_provider_completion(**values),
+            "profile_version": ServiceProvider.profile_version + 1,
+        }
+    ).execution_options(synchronize_session=False)
+
+
+def service_provider_rescored(service_provider_id: int) -> Update:
+    """
+    Rescore a provider and bump profile_version after its own columns
+    changed. Run after the flush.
+    """
+    return update(ServiceProvider).where(ServiceProvider.id == service_provider_id).values(
+        completion_percentage=service_provider_completion(),
+        profile_version=ServiceProvider.profile_version + 1,
+    ).execution_options(synchronize_session=False)
+
+
+def client_rescored(client_id: int) -> Update:
+    """
+    Rescore a client after its profile changed. Run after the flush.
+    """
+    return update(Client).where(Client.id == client_id).values(
+        completion_percentage=client_completion()
+    ).execution_options(synchronize_session=False)
+
+
+def profile_version(db: Session, service_provider_id: int) -> Any:
+    return db.scalar(select(ServiceProvider.profile_version).where(ServiceProvider.id == service_provider_id))
+
+
+def load_service_provider_profile(db: Session, service_provider_id: int) -> ServiceProvider:
+    """
+    A provider with every profile section, in a fixed five queries.
+    """
+    return db.scalars(
+        select(ServiceProvider)
+        .options(
+            selectinload(ServiceProvider.portfolio_projects),
+            selectinload(ServiceProvider.work_experiences),
+            selectinload(ServiceProvider.educations),
+            selectinload(ServiceProvider.certifications),
+        )
+        .where(ServiceProvider.id == service_provider_id)
+        .execution_options(populate_existing=True)
+    ).one()
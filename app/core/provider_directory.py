@@ -0,0 +1,97 @@
+from typing import Any, Iterable
+
+from sqlalchemy import delete, event, func, insert, select, true
+from sqlalchemy.orm import Session
+
+from app.models.provider_directory import ProviderDirectory
+from app.models.service_provider import ServiceProvider
+from app.models.service_provider_profile import ServiceProviderProfile
+
+# provider_directory holds one row per provider, merged from service_provider
+# and service_provider_profile, so listings render from a single table. Rows
+# are rewritten from their sources by sync() once per transaction, just before
+# it commits, for every provider that an ORM flush touched or that mark() named
+# (after Core UPDATEs such as the app.core.profile statements, which the ORM
+# does not see). Syncing at commit picks up both kinds of change in one pass.
+
+_PENDING = "provider_directory_pending"
+
+SOURCE_COLUMNS = {
+    "id": ServiceProvider.id,
+    "is_active": func.coalesce(ServiceProvider.is_active, true()),
+    "name": ServiceProvider.name,
+    "professional_title": ServiceProvider.professional_title,
+    "availability": ServiceProvider.availability,
+    "hourly_rate": ServiceProvider.hourly_rate,
+    "skills": ServiceProvider.skills,
+    "completion_percentage": ServiceProvider.completion_percentage,
+    "full_name": ServiceProviderProfile.full_name,
+    "profile_photo": ServiceProviderProfile.profile_photo,
+    "location_country": ServiceProviderProfile.location_country,
+    "location_city": ServiceProviderProfile.location_city,
+    "language": ServiceProviderProfile.language,
+    "experience": ServiceProviderProfile.experience,
+    "project_completed": ServiceProviderProfile.project_completed,
+}
+
+
+def _source() -> Any:
+    return select(*SOURCE_COLUMNS.values()).outerjoin(
+        ServiceProviderProfile, ServiceProviderProfile.service_provider_id == ServiceProvider.id
+    )
+
+
+def sync(db: Any, provider_ids: Iterable[int]) -> None:
+    """
+    Rewrite the directory rows of `provider_ids` from the source tables, in
+    the caller's transaction. `db` is a Session or Connection.
+    """
+    ids = sorted(set(provider_ids))
+    if not ids:
+        return
+    db.execute(
+        delete(ProviderDirectory).where(ProviderDirectory.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        insert(ProviderDirectory).from_select(
+            list(SOURCE_COLUMNS), _source().where(ServiceProvider.id.in_(ids))
+        )
+    )
+
+
+def rebuild(db: Any) -> None:
+    """
+    Rewrite the whole directory, e.g. after bulk changes made outside the app.
+    """
+    db.execute(delete(ProviderDirectory).execution_options(synchronize_session=False))
+    db.execute(insert(ProviderDirectory).from_select(list(SOURCE_COLUMNS), _source()))
+
+
+def mark(db: Session, provider_ids: Iterable[int]) -> None:
+    """
+    Have the directory rows of `provider_ids` synced when `db` commits.
+    """
+    db.info.setdefault(_PENDING, set()).update(provider_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_after_flush(session: Session, flush_context: Any) -> None:
+    ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, ServiceProvider):
+            ids.add(obj.id)
+        elif isinstance(obj, ServiceProviderProfile):
+            ids.add(obj.service_provider_id)
+    ids.discard(None)
+    if ids:
+        mark(session, ids)
+
+
+@event.listens_for(Session, "before_commit")
+def _sync_before_commit(session: Session) -> None:
+    # Commit flushes only after this hook, so flush first to collect every change
+    session.flush()
+    ids = session.info.pop(_PENDING, None)
+    if ids:
+        sync(session.connection(), ids)
@@ -0,0 +1,156 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+from app.models.service_provider import ServiceProvider
+from app.models.skill import Skill, SkillAlias, project_skill, service_provider_skill
+
+# Common spellings mapped to their canonical skill name. Additional aliases can
+# be stored in the skill_alias table without a code change.
+BUILTIN_ALIASES: Dict[str, str] = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "angularjs": "angular",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "aws cloud": "aws",
+    "amazon web services": "aws",
+}
+
+_SEPARATORS = re.compile(r"[,;|\n]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_skill(raw: str) -> Optional[str]:
+    name = _WHITESPACE.sub(" ", raw.strip().lower())
+    if not name:
+        return None
+    return BUILTIN_ALIASES.get(name, name)[:100]
+
+
+def parse_skills(text: Optional[str]) -> List[str]:
+    """
+    Split a free-form skills string ("Python, ReactJS; node") into distinct
+    normalized names, keeping their original order.
+    """
+    if not text:
+        return []
+    names: List[str] = []
+    for part in _SEPARATORS.split(text):
+        name = normalize_skill(part)
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def _apply_stored_aliases(db: Session, names: List[str]) -> Dict[str, int]:
+    """
+    Map each name to a skill id through skill_alias and skill, in two queries.
+    """
+    if not names:
+        return {}
+    resolved: Dict[str, int] = dict(
+        db.execute(select(SkillAlias.alias, SkillAlias.skill_id).where(SkillAlias.alias.in_(names))).all()
+    )
+    remaining = [name for name in names if name not in resolved]
+    if remaining:
+        resolved.update(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(remaining))).all())
+    return resolved
+
+
+def _insert_missing(db: Session, names: List[str]) -> None:
+    """
+    Insert skills by name, skipping names another transaction added first.
+    """
+    rows = [{"name": name} for name in names]
+    if db.get_bind().dialect.name == "mysql":
+        stmt = mysql_insert(Skill).values(rows).on_duplicate_key_update(name=Skill.name)
+    else:
+        stmt = sqlite_insert(Skill).values(rows).on_conflict_do_nothing(index_elements=[Skill.name])
+    db.execute(stmt)
+
+
+def resolve_skills(db: Session, names: Iterable[str], create: bool = True) -> List[Skill]:
+    """
+    Skill rows for normalized `names`, creating unknown ones when `create` is set.
+    Concurrent saves introducing the same new skill both end up with its one row.
+    """
+    names = list(dict.fromkeys(names))
+    resolved = _apply_stored_aliases(db, names)
+    missing = [name for name in names if name not in resolved]
+    if create and missing:
+        _insert_missing(db, missing)
+        # A locking read sees rows committed after this transaction's snapshot.
+        resolved.update(
+            db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(missing)).with_for_update(read=True)).all()
+        )
+    skills = {skill.id: skill for skill in db.query(Skill).filter(Skill.id.in_(set(resolved.values())))} if resolved else {}
+    result: List[Skill] = []
+    for name in names:
+        if name not in resolved:
+            continue
+        skill = skills[resolved[name]]
+        if skill not in result:
+            result.append(skill)
+    return result
+
+
+def skill_filter_ids(db: Session, text: Optional[str], match: str = "all") -> List[int]:
+    """
+    Skill ids to filter on for the skills named in `text`. For "all" matching,
+    an unknown skill means nothing can match, and an empty list is returned.
+    """
+    names = parse_skills(text)
+    resolved = _apply_stored_aliases(db, names)
+    if match == "all" and len(resolved) < len(names):
+        return []
+    return list(dict.fromkeys(resolved[name] for name in names if name in resolved))
+
+
+def sync_project_skills(db: Session, project: Project) -> None:
+    project.skills = resolve_skills(db, parse_skills(project.skills_required))
+
+
+def sync_service_provider_skills(db: Session, service_provider: ServiceProvider) -> None:
+    service_provider.skill_tags = resolve_skills(db, parse_skills(service_provider.skills))
+
+
+def _having_skills(table: Any, entity_column: Any, ids: List[int], match: str) -> Any:
+    stmt = select(entity_column).where(table.c.skill_id.in_(ids))
+    if match == "all":
+        stmt = stmt.group_by(entity_column).having(func.count() == len(ids))
+    return stmt
+
+
+def projects_having_skills(ids: List[int], match: str = "all") -> Any:
+    """
+    Subquery of project ids tagged with all (or any) of the skill ids,
+    answered from the (skill_id, project_id) index.
+    """
+    return _having_skills(project_skill, project_skill.c.project_id, ids, match)
+
+
+def service_providers_having_skills(ids: List[int], match: str = "all") -> Any:
+    return _having_skills(service_provider_skill, service_provider_skill.c.service_provider_id, ids, match)
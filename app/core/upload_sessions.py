@@ -0,0 +1,134 @@
+import fcntl
+import hashlib
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.upload_session import UploadSession
+
+# Resumable uploads are staged in UPLOAD_STAGING_DIR/<session id>.part. A chunk
+# is written at the offset the session has committed (truncating anything a
+# failed attempt left past it), fsynced, and only then is `received` advanced
+# with a conditional UPDATE, so the row never claims bytes the file lacks.
+# Writers hold an exclusive flock on the staged file from reading the offset
+# to the commit, so concurrent PUTs cannot interleave, and no database write
+# lock is held while the chunk is on its way to disk.
+
+
+def staging_path(session_id: str) -> str:
+    return os.path.join(settings.UPLOAD_STAGING_DIR, f"{session_id}.part")
+
+
+def new_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=settings.UPLOAD_SESSION_TTL_SECONDS)
+
+
+def is_expired(session: UploadSession) -> bool:
+    expires_at = session.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= datetime.now(timezone.utc)
+
+
+def create_file(session_id: str) -> None:
+    os.makedirs(settings.UPLOAD_STAGING_DIR, exist_ok=True)
+    with open(staging_path(session_id), "xb"):
+        pass
+
+
+def append_chunk(db: Session, session_id: str, offset: int, chunk: bytes) -> bool:
+    """
+    Write `chunk` at `offset` and advance the session's `received` past it.
+    Returns False, leaving the upload unchanged, if `offset` is no longer the
+    committed offset. Raises FileNotFoundError once the upload was finalized.
+    """
+    # End the current transaction so the offset read below is not a stale snapshot
+    db.commit()
+    with open(staging_path(session_id), "r+b") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        received = db.scalar(select(UploadSession.received).where(UploadSession.id == session_id))
+        if received != offset:
+            db.rollback()
+            return False
+        f.seek(offset)
+        f.write(chunk)
+        f.truncate()
+        f.flush()
+        os.fsync(f.fileno())
+        claimed = db.execute(
+            update(UploadSession)
+            .where(UploadSession.id == session_id, UploadSession.received == offset)
+            .values(received=offset + len(chunk), expires_at=new_expiry())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not claimed:
+            db.rollback()
+            return False
+        db.commit()
+    return True
+
+
+def file_sha256(session_id: str, size: int) -> str:
+    digest = hashlib.sha256()
+    remaining = size
+    with open(staging_path(session_id), "rb") as f:
+        while remaining:
+            chunk = f.read(min(settings.UPLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise OSError(f"Staged upload {session_id} is shorter than {size} bytes")
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def restore_file(session_id: str, source: str) -> None:
+    """
+    Hard-link a staged file back from the blob store after a finalize that
+    moved it there failed. `source` stays in place for any other references.
+    """
+    try:
+        os.link(source, staging_path(session_id))
+    except (FileExistsError, FileNotFoundError):
+        pass  # Never moved, or nothing to restore
+
+
+def remove_file(session_id: str) -> None:
+    try:
+        os.remove(staging_path(session_id))
+    except FileNotFoundError:
+        pass
+
+
+def purge_expired(db: Session, limit: Optional[int] = 100, sweep_files: bool = False) -> int:
+    """
+    Delete up to `limit` expired sessions (all of them if None) and their
+    staged files; returns how many were purged. With `sweep_files`, staged
+    files without a session row that are older than the TTL are removed too.
+    """
+    stmt = select(UploadSession.id).where(UploadSession.expires_at <= datetime.now(timezone.utc))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    expired = db.scalars(stmt).all()
+    if expired:
+        db.execute(
+            delete(UploadSession).where(UploadSession.id.in_(expired))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        for session_id in expired:
+            remove_file(session_id)
+
+    if sweep_files and os.path.isdir(settings.UPLOAD_STAGING_DIR):
+        live = set(db.scalars(select(UploadSession.id)))
+        cutoff = time.time() - settings.UPLOAD_SESSION_TTL_SECONDS
+        for name in os.listdir(settings.UPLOAD_STAGING_DIR):
+            session_id, extension = os.path.splitext(name)
+            path = os.path.join(settings.UPLOAD_STAGING_DIR, name)
+            if extension == ".part" and session_id not in live and os.path.getmtime(path) < cutoff:
+                remove_file(session_id)
+    return len(expired)
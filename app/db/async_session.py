@@ -0,0 +1,68 @@
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.db.session import POOL_DEFAULTS, get_database_url, sqlite_pragmas
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+asyncmy",
+}
+
+
+def get_async_database_url(url: Optional[str] = None) -> URL:
+    """
+    The configured database URL with its driver swapped for the async one.
+    """
+    url = make_url(url or settings.ASYNC_DATABASE_URI or get_database_url())
+    backend = url.get_backend_name()
+    if url.get_driver_name() in ("aiosqlite", "asyncmy", "aiomysql"):
+        return url
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def create_async_db_engine(url: Optional[str] = None, **overrides: Any) -> AsyncEngine:
+    url = get_async_database_url(url)
+    backend = url.get_backend_name()
+    options = dict(POOL_DEFAULTS.get(backend, POOL_DEFAULTS["mysql"]))
+    configured = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    options.update({key: value for key, value in configured.items() if value is not None})
+    options.update(overrides)
+    engine = create_async_engine(url, **options)
+
+    if backend == "sqlite" and settings.SQLITE_TUNED:
+        pragmas = sqlite_pragmas()
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
+
+
+# Built on first use so the async drivers are only required when the async
+# stack is enabled (ASYNC_DB_ENABLED).
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    global async_engine, AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        async_engine = create_async_db_engine()
+        AsyncSessionLocal = async_sessionmaker(
+            bind=async_engine, autoflush=False, expire_on_commit=False
+        )
+    return AsyncSessionLocal
@@ -0,0 +1,92 @@
+import re
+from typing import Any, List
+
+from sqlalchemy import text
+
+# Full-text index over project.title / project.description.
+#
+# SQLite: an external-content FTS5 table kept in sync by triggers, so every
+# insert, update and delete on `project` (ORM or not) updates the index.
+# MySQL: a FULLTEXT index on the table itself.
+
+SQLITE_PROJECT_FTS_DDL: List[str] = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS project_fts USING fts5(
+        title, description,
+        content='project', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS project_fts_ai AFTER INSERT ON project BEGIN
+        INSERT INTO project_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS project_fts_ad AFTER DELETE ON project BEGIN
+        INSERT INTO project_fts(project_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS project_fts_au AFTER UPDATE OF title, description ON project BEGIN
+        INSERT INTO project_fts(project_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO project_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+SQLITE_PROJECT_FTS_DROP: List[str] = [
+    "DROP TRIGGER IF EXISTS project_fts_au",
+    "DROP TRIGGER IF EXISTS project_fts_ad",
+    "DROP TRIGGER IF EXISTS project_fts_ai",
+    "DROP TABLE IF EXISTS project_fts",
+]
+
+MYSQL_PROJECT_FULLTEXT_INDEX = "ft_project_title_description"
+
+
+def create_project_fts(connection: Any) -> None:
+    """
+    Create the project full-text index for the connection's dialect and index
+    the rows already present.
+    """
+    if connection.dialect.name == "sqlite":
+        for statement in SQLITE_PROJECT_FTS_DDL:
+            connection.execute(text(statement))
+        connection.execute(text("INSERT INTO project_fts(project_fts) VALUES ('rebuild')"))
+    elif connection.dialect.name == "mysql":
+        connection.execute(text(
+            f"ALTER TABLE project ADD FULLTEXT INDEX {MYSQL_PROJECT_FULLTEXT_INDEX} (title, description)"
+        ))
+
+
+def drop_project_fts(connection: Any) -> None:
+    if connection.dialect.name == "sqlite":
+        for statement in SQLITE_PROJECT_FTS_DROP:
+            connection.execute(text(statement))
+    elif connection.dialect.name == "mysql":
+        connection.execute(text(f"ALTER TABLE project DROP INDEX {MYSQL_PROJECT_FULLTEXT_INDEX}"))
+
+
+def search_terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query.lower())
+
+
+def project_text_filter(dialect_name: str, query: str) -> Any:
+    """
+    WHERE clause restricting `project` rows to those whose title or description
+    contain every term of `query` (prefix match on each term). User input is
+    reduced to word tokens, so it can never inject full-text query syntax.
+    """
+    terms = search_terms(query)
+    if dialect_name == "mysql":
+        return text(
+            "MATCH (project.title, project.description) AGAINST (:fts_query IN BOOLEAN MODE)"
+        ).bindparams(fts_query=" ".join(f"+{term}*" for term in terms))
+    return text(
+        "project.id IN (SELECT rowid FROM project_fts WHERE project_fts MATCH :fts_query)"
+    ).bindparams(fts_query=" ".join(f'"{term}"*' for term in terms))
@@ -1,8 +1,154 @@
-from sqlalchemy import create_engine
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.core.config import settings
+
+# Per-dialect pool defaults, overridden by the DB_POOL_* settings.
+POOL_DEFAULTS = {
+    "mysql": {"pool_size": 10, "max_overflow": 20, "pool_pre_ping": True, "pool_recycle": 1800},
+    "sqlite": {"pool_size": 5, "max_overflow": 10, "pool_pre_ping": False, "pool_recycle": -1},
+}
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how many checkouts it served and how long callers
+    waited for a connection (including connect time for new connections).
+    """
+
+    def __init__(self, *args: Any, **kw: Any):
+        super().__init__(*args, **kw)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+def sqlite_pragmas(read_only: bool = False) -> Dict[str, Any]:
+    """
+    Pragmas of the tuned SQLite profile. WAL lets readers proceed while a
+    writer commits; NORMAL sync is durable across application crashes in WAL.
+    """
+    pragmas: Dict[str, Any] = {
+        "journal_mode": "WAL",
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+    if read_only:
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def _apply_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///../sql_app.db"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+
+def get_database_url() -> str:
+    if settings.DATABASE_BACKEND == "mysql":
+        return settings.SQLALCHEMY_DATABASE_URI
+    return settings.SQLITE_DATABASE_URI
+
+
+def create_db_engine(
+    url: Optional[str] = None,
+    read_only: bool = False,
+    sqlite_tuned: Optional[bool] = None,
+    **overrides: Any,
+) -> Engine:
+    """
+    Build an engine for `url` (default: the configured database) with pooling
+    tuned for its dialect. Keyword arguments override individual pool options.
+    For SQLite, `sqlite_tuned` (default: SQLITE_TUNED) applies the production
+    pragmas on connect, and `read_only` makes every connection query-only.
+    """
+    url = make_url(url or get_database_url())
+    backend = url.get_backend_name()
+
+    if backend == "sqlite" and url.database in (None, "", ":memory:"):
+        # A private in-memory database only exists on a single connection.
+        return create_engine(
+            url, connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+
+    options = dict(POOL_DEFAULTS.get(backend, POOL_DEFAULTS["mysql"]))
+    configured = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    options.update({key: value for key, value in configured.items() if value is not None})
+    options.update(overrides)
+
+    connect_args = {"check_same_thread": False} if backend == "sqlite" else {}
+    engine = create_engine(
+        url, poolclass=InstrumentedQueuePool, connect_args=connect_args, **options
+    )
+    if backend == "sqlite":
+        if sqlite_tuned is None:
+            sqlite_tuned = settings.SQLITE_TUNED
+        if sqlite_tuned:
+            _apply_pragmas(engine, sqlite_pragmas(read_only=read_only))
+        elif read_only:
+            _apply_pragmas(engine, {"query_only": "ON"})
+    return engine
+
+
+def pool_stats(bind: Optional[Engine] = None) -> Dict[str, Any]:
+    pool = (bind or engine).pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update({
+            "checkouts": pool.checkouts,
+            "timeouts": pool.timeouts,
+            "wait_avg_ms": round(pool.wait_total * 1000 / pool.checkouts, 3) if pool.checkouts else 0.0,
+            "wait_max_ms": round(pool.wait_max * 1000, 3),
+        })
+    return stats
+
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Read-only requests get their own pool of query-only connections when the tuned
+# SQLite profile is on, so they never queue behind writers for a connection.
+if engine.dialect.name == "sqlite" and settings.SQLITE_TUNED:
+    read_engine = create_db_engine(read_only=True, pool_size=settings.SQLITE_READ_POOL_SIZE)
+else:
+    read_engine = engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
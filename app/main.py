@@ -1,15 +1,25 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from app.api.uploads import UploadSizeLimit
+from app.core import blobs
 from app.core.config import settings
+from app.core.hashing import HashingBusy, password_hasher
 from app.api.v1.api import api_router
-from app.db.session import engine
-from app.db.base import Base
-from app.models import client, service_provider, service_provider_profile
-
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(title=settings.PROJECT_NAME, openapi_url=f"{settings.API_V1_STR}/openapi.json")
 
+# Reject oversized uploads from Content-Length before the body is parsed
+app.add_middleware(
+    UploadSizeLimit,
+    limits=[
+        ("POST", rf"{settings.API_V1_STR}/client/contracts/?", settings.UPLOAD_MAX_SIGNATURE_BYTES),
+        ("POST", rf"{settings.API_V1_STR}/client/contracts/\d+/sign/service-provider", settings.UPLOAD_MAX_SIGNATURE_BYTES),
+        ("POST", rf"{settings.API_V1_STR}/client/projects/\d+/submit-work", settings.UPLOAD_MAX_SUBMISSION_BYTES),
+        ("PUT", rf"{settings.API_V1_STR}/client/projects/\d+/submit-work/uploads/[^/]+", settings.UPLOAD_SESSION_MAX_CHUNK_BYTES),
+    ],
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -17,12 +27,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods (GET, POST, PUT, DELETE, etc.)
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["X-Next-Cursor"],  # Pagination cursor for listing endpoints
 )
 
+@app.exception_handler(HashingBusy)
+async def hashing_busy_handler(request: Request, exc: HashingBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many concurrent logins, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+@app.on_event("shutdown")
+def shutdown_password_hasher():
+    password_hasher.shutdown()
+
+if settings.ASYNC_DB_ENABLED:
+    from app.db import async_session
+
+    @app.on_event("shutdown")
+    async def dispose_async_engine():
+        if async_session.async_engine is not None:
+            await async_session.async_engine.dispose()
+
 from fastapi.staticfiles import StaticFiles
 
+class ImmutableStaticFiles(StaticFiles):
+    """
+    Serves content-addressed files, which never change under a given URL.
+    """
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+app.mount(f"/static/{blobs.BLOB_URL_PREFIX}", ImmutableStaticFiles(directory=blobs.BLOB_ROOT, check_dir=False), name="blobs")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/", StaticFiles(directory="frontend", html=True), name="frontend")
 
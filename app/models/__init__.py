@@ -4,3 +4,12 @@ from .service_provider_profile import ServiceProviderProfile
 from .project import Project
 from .bid import Bid
 from .contract import Contract
+from .refresh_token import RefreshToken
+from .blob import Blob
+from .upload_session import UploadSession
+from .skill import Skill, SkillAlias, project_skill, service_provider_skill
+from .provider_directory import ProviderDirectory
+
+# Keeps provider_directory in sync on every flush; imported last, once every
+# model it reads is defined.
+from app.core import provider_directory as _provider_directory  # noqa: E402,F401
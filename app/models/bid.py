@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -20,3 +20,17 @@ class Bid(Base):
     from sqlalchemy.orm import relationship
     project = relationship("Project", back_populates="bids")
     service_provider = relationship("ServiceProvider")
+    # Same provider, as its provider_directory row, for rendering bid listings
+    provider = relationship(
+        "ProviderDirectory",
+        primaryjoin="foreign(Bid.service_provider_id) == ProviderDirectory.id",
+        viewonly=True,
+    )
+
+    __table_args__ = (
+        # Bids on a project, newest first; also serves project_id lookups
+        Index("ix_bid_project_id_created_at", project_id, created_at),
+        # "My bids" listing and the accepted-bid check for a provider
+        Index("ix_bid_service_provider_id_created_at", service_provider_id, created_at),
+        Index("ix_bid_service_provider_id_status", service_provider_id, status),
+    )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class Blob(Base):
+    __tablename__ = "blob"
+
+    id = Column(String(64), primary_key=True)  # Hex SHA-256 of the content
+    size = Column(Integer, nullable=False)
+    extension = Column(String(16), nullable=False, default="")  # e.g. ".pdf", from the first upload
+    ref_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Garbage collection: WHERE ref_count <= 0
+        Index("ix_blob_ref_count", ref_count),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import Boolean, Column, Integer, String, Index
 from app.db.base import Base
 
 class Client(Base):
@@ -38,3 +38,9 @@ class Client(Base):
     billing_contact_phone = Column(String, nullable=True)
     billing_address = Column(String, nullable=True)
 
+    # Profile completion, maintained by app.core.profile
+    completion_percentage = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        Index("ix_client_completion_percentage", completion_percentage),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 from sqlalchemy.orm import relationship
@@ -7,14 +7,16 @@ class Contract(Base):
     __tablename__ = "contract"
 
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("project.id"), nullable=False)
-    bid_id = Column(Integer, ForeignKey("bid.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("project.id"), nullable=False, index=True)
+    bid_id = Column(Integer, ForeignKey("bid.id"), nullable=False, index=True)
     client_id = Column(Integer, ForeignKey("client.id"), nullable=False)
     service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False)
     
     terms_and_conditions = Column(Text, nullable=False)
     client_signature_path = Column(String, nullable=True)  # Path to the client's signature image
     service_provider_signature_path = Column(String, nullable=True)  # Path to the service provider's signature image
+    client_signature_blob_id = Column(String(64), ForeignKey("blob.id"), nullable=True)
+    service_provider_signature_blob_id = Column(String(64), ForeignKey("blob.id"), nullable=True)
     status = Column(String, default="client_signed")  # client_signed, fully_signed, active, completed
     
     # Timestamps
@@ -26,3 +28,9 @@ class Contract(Base):
     bid = relationship("Bid")
     client = relationship("Client")
     service_provider = relationship("ServiceProvider")
+
+    __table_args__ = (
+        # Contract listings for each side, newest first
+        Index("ix_contract_client_id_created_at", client_id, created_at.desc()),
+        Index("ix_contract_service_provider_id_created_at", service_provider_id, created_at.desc()),
+    )
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -9,6 +10,8 @@ class Project(Base):
     title = Column(String, nullable=False)
     description = Column(String, nullable=False)
     budget_range = Column(String, nullable=True)  
+    budget_min = Column(Integer, nullable=True)  # Parsed from budget_range; NULL for upper bounds such as "under 500"
+    budget_max = Column(Integer, nullable=True)  # NULL for open-ended budgets such as "5000+"
     currency = Column(String, nullable=True)  
     project_duration = Column(String, nullable=True)  
     skills_required = Column(String, nullable=True)  
@@ -16,13 +19,24 @@ class Project(Base):
     
     # Work Submission Fields
     submission_pdf_path = Column(String, nullable=True)
+    submission_blob_id = Column(String(64), ForeignKey("blob.id"), nullable=True)
     submission_github_link = Column(String, nullable=True)
     
     # Escrow / Funds
     escrow_funded = Column(String, default="no")  # no, yes, released
     
+    # Bid statistics, maintained by app.core.bid_stats
+    bid_count = Column(Integer, nullable=False, default=0, server_default="0")
+    bid_amount_total = Column(Integer, nullable=False, default=0, server_default="0")
+    bid_amount_min = Column(Integer, nullable=True)
+    bid_amount_max = Column(Integer, nullable=True)
+    last_bid_at = Column(DateTime(timezone=True), nullable=True)
+    accepted_bid_amount = Column(Integer, nullable=True)
+
     # Foreign key 
     client_id = Column(Integer, ForeignKey("client.id"), nullable=False)
+    # Provider whose bid was accepted; cleared when the project is cancelled
+    assigned_service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=True, index=True)
     
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -31,3 +45,26 @@ class Project(Base):
     
     from sqlalchemy.orm import relationship
     bids = relationship("Bid", back_populates="project", cascade="all, delete-orphan")
+    skills = relationship("Skill", secondary="project_skill")
+
+    @property
+    def bid_amount_avg(self):
+        return self.bid_amount_total / self.bid_count if self.bid_count else None
+
+    @hybrid_property
+    def last_activity_at(self):
+        # Sort key of the provider project listing
+        return self.updated_at or self.created_at
+
+    @last_activity_at.expression
+    def last_activity_at(cls):
+        return func.coalesce(cls.updated_at, cls.created_at)
+
+    __table_args__ = (
+        # Client project listing: WHERE client_id = ? ORDER BY created_at DESC
+        Index("ix_project_client_id_created_at", client_id, created_at.desc()),
+        # Marketplace: WHERE status = 'open' ORDER BY created_at DESC
+        Index("ix_project_status_created_at", status, created_at.desc()),
+        # Budget range filters: WHERE currency = ? AND budget_min <= ? AND budget_max >= ?
+        Index("ix_project_currency_budget_min_budget_max", currency, budget_min, budget_max),
+    )
@@ -0,0 +1,56 @@
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+from app.models.skill import Skill, service_provider_skill
+
+class ProviderDirectory(Base):
+    """
+    Read model merging service_provider with its service_provider_profile,
+    one row per provider, maintained by app.core.provider_directory.
+    """
+    __tablename__ = "provider_directory"
+
+    id = Column(Integer, ForeignKey("service_provider.id", ondelete="CASCADE"), primary_key=True)  # Service provider id
+    is_active = Column(Boolean(), nullable=False, default=True)
+
+    # From service_provider
+    name = Column(String, nullable=True)
+    professional_title = Column(String, nullable=True)
+    availability = Column(String, nullable=True)
+    hourly_rate = Column(Integer, nullable=True)
+    skills = Column(String, nullable=True)
+    completion_percentage = Column(Integer, nullable=False, default=0)
+
+    # From service_provider_profile
+    full_name = Column(String(255), nullable=True)
+    profile_photo = Column(String(500), nullable=True)
+    location_country = Column(String(100), nullable=True)
+    location_city = Column(String(100), nullable=True)
+    language = Column(String(255), nullable=True)
+    experience = Column(String(100), nullable=True)
+    project_completed = Column(Integer, nullable=True)
+
+    skill_tags = relationship(
+        "Skill",
+        secondary=service_provider_skill,
+        primaryjoin=lambda: ProviderDirectory.id == service_provider_skill.c.service_provider_id,
+        secondaryjoin=lambda: Skill.id == service_provider_skill.c.skill_id,
+        viewonly=True,
+    )
+
+    __table_args__ = (
+        # Directory, default sort: WHERE is_active ORDER BY completion_percentage DESC, id DESC
+        Index("ix_provider_directory_active_completion_id", is_active, completion_percentage, id),
+        # Directory, rate sort and range: WHERE is_active AND hourly_rate BETWEEN ? AND ? ORDER BY hourly_rate, id
+        Index("ix_provider_directory_active_hourly_rate_id", is_active, hourly_rate, id),
+        # Directory, availability filter: WHERE is_active AND availability = ? ORDER BY completion_percentage
+        Index(
+            "ix_provider_directory_active_availability_completion",
+            is_active, availability, completion_percentage, id,
+        ),
+        # Directory, location filter: WHERE is_active AND location_country = ? [AND location_city = ?]
+        Index(
+            "ix_provider_directory_active_location_completion",
+            is_active, location_country, location_city, completion_percentage, id,
+        ),
+    )
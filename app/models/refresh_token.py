@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_token"
+
+    id = Column(Integer, primary_key=True, index=True)
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)  # SHA-256 hex of the opaque token
+    family_id = Column(String(32), index=True, nullable=False)  # Shared by every rotation of one login
+    role = Column(String, nullable=False)  # client, service_provider
+    user_id = Column(Integer, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)  # Set when rotated or revoked
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -18,18 +18,27 @@ class ServiceProvider(Base):
     skills = Column(String, nullable=True)  # Comma-separated or JSON
     kyc_file = Column(String, nullable=True)  # Path to file
 
+    # Profile completion, maintained by app.core.profile
+    portfolio_count = Column(Integer, nullable=False, default=0, server_default="0")
+    experience_count = Column(Integer, nullable=False, default=0, server_default="0")
+    education_count = Column(Integer, nullable=False, default=0, server_default="0")
+    certification_count = Column(Integer, nullable=False, default=0, server_default="0")
+    completion_percentage = Column(Integer, nullable=False, default=0, server_default="0")
+    profile_version = Column(Integer, nullable=False, default=0, server_default="0")  # Bumped by every profile write
+
     # Relationships
     portfolio_projects = relationship("PortfolioProject", back_populates="service_provider", cascade="all, delete-orphan")
     work_experiences = relationship("WorkExperience", back_populates="service_provider", cascade="all, delete-orphan")
     educations = relationship("Education", back_populates="service_provider", cascade="all, delete-orphan")
     certifications = relationship("Certification", back_populates="service_provider", cascade="all, delete-orphan")
+    skill_tags = relationship("Skill", secondary="service_provider_skill")
 
 
 class PortfolioProject(Base):
     __tablename__ = "portfolio_projects"
 
     id = Column(Integer, primary_key=True, index=True)
-    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False)
+    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     project_url = Column(String, nullable=True)
     description = Column(String, nullable=True)
@@ -42,7 +51,7 @@ class WorkExperience(Base):
     __tablename__ = "work_experiences"
 
     id = Column(Integer, primary_key=True, index=True)
-    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False)
+    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False, index=True)
     role = Column(String, nullable=False)
     company = Column(String, nullable=False)
     start_date = Column(String, nullable=True) # Or Date type
@@ -57,7 +66,7 @@ class Education(Base):
     __tablename__ = "educations"
 
     id = Column(Integer, primary_key=True, index=True)
-    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False)
+    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False, index=True)
     school = Column(String, nullable=False)
     degree = Column(String, nullable=False) # degree/program
     field_of_study = Column(String, nullable=True)
@@ -72,7 +81,7 @@ class Certification(Base):
     __tablename__ = "certifications"
 
     id = Column(Integer, primary_key=True, index=True)
-    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False)
+    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     issuer = Column(String, nullable=True)
     year = Column(Integer, nullable=True)
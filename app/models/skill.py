@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Index
+from app.db.base import Base
+
+# Association tables; the composite primary key serves "skills of an entity",
+# the reverse index serves "entities having a skill".
+project_skill = Table(
+    "project_skill",
+    Base.metadata,
+    Column("project_id", Integer, ForeignKey("project.id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_project_skill_skill_id_project_id", "skill_id", "project_id"),
+)
+
+service_provider_skill = Table(
+    "service_provider_skill",
+    Base.metadata,
+    Column("service_provider_id", Integer, ForeignKey("service_provider.id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_service_provider_skill_skill_id_service_provider_id", "skill_id", "service_provider_id"),
+)
+
+class Skill(Base):
+    __tablename__ = "skill"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), unique=True, index=True, nullable=False)  # Canonical, lower-case
+
+class SkillAlias(Base):
+    __tablename__ = "skill_alias"
+
+    alias = Column(String(100), primary_key=True)  # Normalized spelling, e.g. "reactjs"
+    skill_id = Column(Integer, ForeignKey("skill.id", ondelete="CASCADE"), nullable=False, index=True)
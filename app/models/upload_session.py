@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class UploadSession(Base):
+    __tablename__ = "upload_session"
+
+    id = Column(String(32), primary_key=True)  # Random hex token, also the staging file name
+    project_id = Column(Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=False, index=True)
+    service_provider_id = Column(Integer, ForeignKey("service_provider.id"), nullable=False)
+    file_name = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)  # Total bytes announced at init
+    received = Column(Integer, nullable=False, default=0, server_default="0")  # Bytes committed so far
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
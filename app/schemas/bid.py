@@ -28,3 +28,22 @@ class BidInDBBase(BidBase):
 
 class Bid(BidInDBBase):
     pass
+
+class BidProvider(BaseModel):
+    """
+    Provider summary shown next to a bid.
+    """
+    id: int
+    name: Optional[str] = None
+    professional_title: Optional[str] = None
+    hourly_rate: Optional[int] = None
+    completion_percentage: int
+    profile_photo: Optional[str] = None
+    location_country: Optional[str] = None
+    location_city: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class ProjectBid(Bid):
+    provider: Optional[BidProvider] = None
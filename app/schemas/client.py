@@ -54,7 +54,7 @@ class ClientInDBBase(ClientBase):
 
 
 class Client(ClientInDBBase):
-    # Computed field for API response
+    # Maintained by app.core.profile
     completion_percentage: Optional[int] = None
 
 
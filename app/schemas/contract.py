@@ -19,6 +19,8 @@ class Contract(ContractBase):
     service_provider_id: int
     client_signature_path: Optional[str] = None
     service_provider_signature_path: Optional[str] = None
+    client_signature_blob_id: Optional[str] = None
+    service_provider_signature_blob_id: Optional[str] = None
     status: str
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -1,11 +1,35 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Optional
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 
+from app.core.budget import parse_budget_range
+
+
+def with_parsed_budget(data: Any) -> Any:
+    """
+    Derive budget_min / budget_max from budget_range whenever it is supplied.
+    They cannot be set on their own, and explicit values must match the parse.
+    """
+    if not isinstance(data, dict):
+        return data
+    given = {key: data[key] for key in ("budget_min", "budget_max") if key in data}
+    if "budget_range" not in data:
+        if given:
+            raise ValueError("budget_min and budget_max are derived from budget_range; set budget_range instead")
+        return data
+    data = dict(data)
+    data["budget_min"], data["budget_max"] = parse_budget_range(data["budget_range"])
+    for key, value in given.items():
+        if value != data[key]:
+            raise ValueError(f"{key}={value} does not match budget_range {data['budget_range']!r}")
+    return data
+
 class ProjectBase(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     budget_range: Optional[str] = None
+    budget_min: Optional[int] = None
+    budget_max: Optional[int] = None
     currency: Optional[str] = None
     project_duration: Optional[str] = None
     skills_required: Optional[str] = None
@@ -18,21 +42,94 @@ class ProjectCreate(BaseModel):
     title: str
     description: str
     budget_range: Optional[str] = None
+    budget_min: Optional[int] = None
+    budget_max: Optional[int] = None
     currency: Optional[str] = None
     project_duration: Optional[str] = None
     skills_required: Optional[str] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def parse_budget(cls, data: Any) -> Any:
+        return with_parsed_budget(data)
+
 class ProjectUpdate(ProjectBase):
-    pass
+    @model_validator(mode="before")
+    @classmethod
+    def parse_budget(cls, data: Any) -> Any:
+        return with_parsed_budget(data)
 
 class ProjectInDBBase(ProjectBase):
     id: int
     client_id: int
+    assigned_service_provider_id: Optional[int] = None
+    submission_blob_id: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    bid_count: int = 0
+    bid_amount_min: Optional[int] = None
+    bid_amount_max: Optional[int] = None
+    bid_amount_avg: Optional[float] = None
+    last_bid_at: Optional[datetime] = None
+    accepted_bid_amount: Optional[int] = None
 
     class Config:
         from_attributes = True
 
 class Project(ProjectInDBBase):
     pass
+
+class MarketplaceProject(BaseModel):
+    """
+    Public view of an open project, without submission or escrow details.
+    """
+    id: int
+    title: str
+    description: str
+    budget_range: Optional[str] = None
+    budget_min: Optional[int] = None
+    budget_max: Optional[int] = None
+    currency: Optional[str] = None
+    project_duration: Optional[str] = None
+    skills_required: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ProviderMatch(BaseModel):
+    """
+    A service provider ranked against a project; `score` is in [0, 1].
+    """
+    service_provider_id: int
+    score: float
+    skill_overlap: int
+    completion_percentage: int
+    name: Optional[str] = None
+    professional_title: Optional[str] = None
+    hourly_rate: Optional[int] = None
+    availability: Optional[str] = None
+    profile_photo: Optional[str] = None
+    location_country: Optional[str] = None
+    location_city: Optional[str] = None
+
+class UploadSessionCreate(BaseModel):
+    file_name: str
+    size: int = Field(..., gt=0)  # Total bytes of the file to be uploaded
+
+class UploadSession(BaseModel):
+    """
+    A resumable work-submission upload. The next chunk must be sent at
+    `offset`; once `offset == size` the upload can be finalized.
+    """
+    id: str
+    project_id: int
+    file_name: str
+    size: int
+    offset: int
+    max_chunk_size: int
+    expires_at: datetime
+
+class UploadSessionFinalize(BaseModel):
+    github_link: str
+    sha256: Optional[str] = None  # Optional checksum of the whole file
@@ -130,8 +130,47 @@ class ServiceProvider(ServiceProviderInDBBase):
     educations: List[Education] = []
     certifications: List[Certification] = []
     
-    # Computed field for API response
+    # Maintained with the per-section counters by app.core.profile
     completion_percentage: Optional[int] = None
+    portfolio_count: int = 0
+    experience_count: int = 0
+    education_count: int = 0
+    certification_count: int = 0
+
+class ServiceProviderSummary(BaseModel):
+    """
+    Directory listing entry: public profile fields only, no email or sections.
+    """
+    id: int
+    name: Optional[str] = None
+    professional_title: Optional[str] = None
+    availability: Optional[str] = None
+    hourly_rate: Optional[int] = None
+    skills: Optional[str] = None
+    completion_percentage: int
+    profile_photo: Optional[str] = None
+    location_country: Optional[str] = None
+    location_city: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+PROFILE_IMPORT_MAX_ITEMS = 200  # Per section
+
+class ServiceProviderProfileImport(BaseModel):
+    """
+    A whole profile document. Summary fields that are omitted are left
+    unchanged; section entries are appended, or replace every existing entry
+    when importing with `replace=true`.
+    """
+    professional_title: Optional[str] = None
+    availability: Optional[str] = None
+    hourly_rate: Optional[int] = None
+    skills: Optional[str] = None
+    portfolio_projects: List[PortfolioProjectCreate] = Field(default_factory=list, max_length=PROFILE_IMPORT_MAX_ITEMS)
+    work_experiences: List[WorkExperienceCreate] = Field(default_factory=list, max_length=PROFILE_IMPORT_MAX_ITEMS)
+    educations: List[EducationCreate] = Field(default_factory=list, max_length=PROFILE_IMPORT_MAX_ITEMS)
+    certifications: List[CertificationCreate] = Field(default_factory=list, max_length=PROFILE_IMPORT_MAX_ITEMS)
 
 class ServiceProviderInDB(ServiceProviderInDBBase):
     hashed_password: str
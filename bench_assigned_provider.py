@@ -0,0 +1,145 @@
+"""
+Service-provider project lookups: the previous Project JOIN Bid on accepted
+bids against the denormalized project.assigned_service_provider_id.
+
+    python bench_assigned_provider.py [--projects 5000] [--bids-per-project 40]
+                                      [--providers 500] [--queries 2000]
+
+Seeds a temporary SQLite database with model indexes, then times the provider
+project listing (first page) and the per-project authorization check.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.models import Bid, Client, Project, ServiceProvider
+
+PAGE = 50
+
+
+def seed(db, projects, bids_per_project, providers):
+    client = Client(email="bench@example.com", hashed_password="x")
+    db.add(client)
+    db.flush()
+    db.execute(insert(ServiceProvider), [
+        {"email": f"sp{i}@example.com", "hashed_password": "x", "is_active": True} for i in range(providers)
+    ])
+    provider_ids = [row[0] for row in db.execute(select(ServiceProvider.id))]
+
+    rng = random.Random(7)
+    assigned = {}
+    db.execute(insert(Project), [
+        {"title": f"Project {i}", "description": "Benchmark", "client_id": client.id, "status": "open"}
+        for i in range(projects)
+    ])
+    project_ids = [row[0] for row in db.execute(select(Project.id))]
+    bids = []
+    for project_id in project_ids:
+        bidders = rng.sample(provider_ids, min(bids_per_project, len(provider_ids)))
+        winner = bidders[0] if rng.random() < 0.6 else None
+        if winner:
+            assigned[project_id] = winner
+        bids.extend(
+            {
+                "project_id": project_id,
+                "service_provider_id": sp_id,
+                "bid_amount": 1000,
+                "currency": "INR",
+                "cover_letter": "Benchmark bid",
+                "status": "accepted" if sp_id == winner else ("rejected" if winner else "pending"),
+            }
+            for sp_id in bidders
+        )
+    db.execute(insert(Bid), bids)
+    db.execute(
+        update(Project)
+        .values(assigned_service_provider_id=(
+            select(Bid.service_provider_id)
+            .where(Bid.project_id == Project.id, Bid.status == "accepted")
+            .scalar_subquery()
+        ))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return provider_ids, project_ids, assigned
+
+
+def listing_join(sp_id):
+    return (
+        select(Project).join(Bid).where(Bid.service_provider_id == sp_id, Bid.status == "accepted")
+        .order_by(func.coalesce(Project.updated_at, Project.created_at).desc(), Project.id.desc()).limit(PAGE)
+    )
+
+
+def listing_column(sp_id):
+    return (
+        select(Project).where(Project.assigned_service_provider_id == sp_id)
+        .order_by(func.coalesce(Project.updated_at, Project.created_at).desc(), Project.id.desc()).limit(PAGE)
+    )
+
+
+def check_join(project_id, sp_id):
+    return select(Project).join(Bid).where(
+        Project.id == project_id, Bid.service_provider_id == sp_id, Bid.status == "accepted"
+    )
+
+
+def check_column(project_id, sp_id):
+    return select(Project).where(Project.id == project_id, Project.assigned_service_provider_id == sp_id)
+
+
+def timed(db, statements):
+    start = time.perf_counter()
+    rows = 0
+    for stmt in statements:
+        rows += len(db.execute(stmt).all())
+    return (time.perf_counter() - start) / len(statements) * 1000, rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--bids-per-project", type=int, default=40)
+    parser.add_argument("--providers", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_db_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        provider_ids, project_ids, assigned = seed(db, args.projects, args.bids_per_project, args.providers)
+        print(f"{args.projects} projects, {args.projects * args.bids_per_project} bids, {len(assigned)} assigned")
+
+        rng = random.Random(11)
+        providers = [rng.choice(provider_ids) for _ in range(args.queries)]
+        checks = [
+            (project_id, assigned.get(project_id, rng.choice(provider_ids)))
+            for project_id in (rng.choice(project_ids) for _ in range(args.queries))
+        ]
+        print(f"{'query':<22} {'join ms':>9} {'column ms':>10}")
+        for name, join_stmts, column_stmts in (
+            ("provider listing", [listing_join(sp) for sp in providers], [listing_column(sp) for sp in providers]),
+            ("authorization check", [check_join(*c) for c in checks], [check_column(*c) for c in checks]),
+        ):
+            join_ms, join_rows = timed(db, join_stmts)
+            column_ms, column_rows = timed(db, column_stmts)
+            assert join_rows == column_rows, (name, join_rows, column_rows)
+            print(f"{name:<22} {join_ms:>9.3f} {column_ms:>10.3f}")
+        db.close()
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
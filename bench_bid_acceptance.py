@@ -0,0 +1,117 @@
+"""
+Time bid acceptance for projects with many bids: the previous ORM loop over
+project.bids against the set-based accept_bid used by the endpoint.
+
+    python bench_bid_acceptance.py [--bids 10 1000 10000] [--url sqlite:///...]
+
+Each run gets a freshly seeded project. Statements are counted per parameter
+set, so an executemany of n UPDATEs at flush counts n.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints.project import accept_bid
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.models import Bid, Client, Project, ServiceProvider
+
+COVER_LETTER = "I have delivered a dozen similar projects. " * 20
+
+
+def seed(db, bids):
+    client = Client(email=f"client{time.monotonic_ns()}@example.com", hashed_password="x")
+    provider = ServiceProvider(email=f"sp{time.monotonic_ns()}@example.com", hashed_password="x")
+    db.add_all([client, provider])
+    db.flush()
+    project = Project(title="Popular project", description="Benchmark", client_id=client.id)
+    db.add(project)
+    db.flush()
+    db.execute(insert(Bid), [
+        {
+            "project_id": project.id,
+            "service_provider_id": provider.id,
+            "bid_amount": 1000 + i,
+            "currency": "INR",
+            "cover_letter": COVER_LETTER,
+            "status": "pending",
+        }
+        for i in range(bids)
+    ])
+    db.commit()
+    bid_id = db.query(Bid.id).filter(Bid.project_id == project.id).order_by(Bid.id.desc()).first()[0]
+    return client.id, project.id, bid_id
+
+
+def accept_orm_loop(db, project_id, bid_id, client_id):
+    project = db.query(Project).filter(Project.id == project_id, Project.client_id == client_id).first()
+    bid = db.query(Bid).filter(Bid.id == bid_id, Bid.project_id == project_id).first()
+    project.status = "pending_contract"
+    for b in project.bids:
+        b.status = "accepted" if b.id == bid_id else "rejected"
+    db.commit()
+    db.refresh(bid)
+    return bid
+
+
+def measure(engine, Session, strategy, bids):
+    setup = Session()
+    client_id, project_id, bid_id = seed(setup, bids)
+    setup.close()
+
+    statements = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += len(parameters) if executemany else 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    db = Session()
+    start = time.perf_counter()
+    bid = strategy(db, project_id, bid_id, client_id)
+    elapsed = time.perf_counter() - start
+    db.close()
+    event.remove(engine, "before_cursor_execute", count)
+
+    assert bid.status == "accepted"
+    check = Session()
+    rejected = check.query(Bid).filter(Bid.project_id == project_id, Bid.status == "rejected").count()
+    check.close()
+    assert rejected == bids - 1
+    return elapsed, statements
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bids", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--url", default=None, help="Database URL (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    path = None
+    url = args.url
+    if url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{path}"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    try:
+        print(f"{'bids':>7} {'strategy':<10} {'ms':>10} {'statements':>11}")
+        for bids in args.bids:
+            for name, strategy in (("orm loop", accept_orm_loop), ("set-based", accept_bid)):
+                elapsed, statements = measure(engine, Session, strategy, bids)
+                print(f"{bids:>7} {name:<10} {elapsed * 1000:>10.1f} {statements:>11}")
+    finally:
+        engine.dispose()
+        if path:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Provider directory (GET /service-providers) query times on a large table.
+
+    python bench_provider_directory.py [--providers 500000] [--queries 200]
+
+Seeds a temporary SQLite database with model indexes, fills the
+provider_directory read model, then times the first page and a deep keyset
+page (cursor after 10k rows) for each sort and filter.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import and_, insert, or_, select, true
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints.directory import SUMMARY_COLUMNS
+from app.core import provider_directory
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.models import ProviderDirectory, ServiceProvider, ServiceProviderProfile
+
+PAGE = 50
+BATCH = 10000
+AVAILABILITY = ["Full-time", "Part-time", "Contract", None]
+COUNTRIES = [("India", ["Bengaluru", "Pune", "Delhi"]), ("USA", ["Austin", "Boston"]), ("Germany", ["Berlin"])]
+
+
+def seed(db, providers):
+    rng = random.Random(7)
+    for start in range(0, providers, BATCH):
+        count = min(BATCH, providers - start)
+        db.execute(insert(ServiceProvider), [
+            {
+                "email": f"sp{start + i}@example.com",
+                "hashed_password": "x",
+                "is_active": rng.random() < 0.95,
+                "name": f"Provider {start + i}",
+                "professional_title": "Developer",
+                "hourly_rate": rng.choice([None, rng.randint(5, 200)]),
+                "availability": rng.choice(AVAILABILITY),
+                "completion_percentage": rng.choice([0, 20, 35, 55, 70, 85, 100]),
+            }
+            for i in range(count)
+        ])
+    rows = []
+    for sp_id in db.scalars(select(ServiceProvider.id)):
+        country, cities = rng.choice(COUNTRIES)
+        rows.append({"service_provider_id": sp_id, "location_country": country, "location_city": rng.choice(cities)})
+        if len(rows) == BATCH:
+            db.execute(insert(ServiceProviderProfile), rows)
+            rows = []
+    if rows:
+        db.execute(insert(ServiceProviderProfile), rows)
+    provider_directory.rebuild(db)
+    db.commit()
+
+
+def directory(where, sort_key, descending=True):
+    stmt = select(*SUMMARY_COLUMNS).where(ProviderDirectory.is_active == true(), *where)
+    if descending:
+        return stmt.order_by(sort_key.desc(), ProviderDirectory.id.desc())
+    return stmt.order_by(sort_key.asc(), ProviderDirectory.id.asc())
+
+
+def after(stmt, sort_key, row, value, descending=True):
+    if descending:
+        keyset = or_(sort_key < value, and_(sort_key == value, ProviderDirectory.id < row))
+    else:
+        keyset = or_(sort_key > value, and_(sort_key == value, ProviderDirectory.id > row))
+    return stmt.where(keyset)
+
+
+def timed(db, stmt, queries):
+    start = time.perf_counter()
+    for _ in range(queries):
+        db.execute(stmt.limit(PAGE + 1)).all()
+    return (time.perf_counter() - start) / queries * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--providers", type=int, default=500000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_db_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        seed(db, args.providers)
+        print(f"{args.providers} providers")
+
+        completion = ProviderDirectory.completion_percentage
+        rate = ProviderDirectory.hourly_rate
+        cases = [
+            ("completion", [], completion, True),
+            ("rate ascending", [rate.is_not(None)], rate, False),
+            ("rate 20-60", [rate.between(20, 60)], rate, False),
+            ("availability", [ProviderDirectory.availability == "Part-time"], completion, True),
+            ("country + city", [
+                ProviderDirectory.location_country == "India",
+                ProviderDirectory.location_city == "Pune",
+            ], completion, True),
+            ("min completion 70", [completion >= 70], completion, True),
+        ]
+        print(f"{'query':<20} {'first page ms':>14} {'deep page ms':>13}")
+        for name, where, sort_key, descending in cases:
+            stmt = directory(where, sort_key, descending)
+            anchor = db.execute(stmt.offset(10000).limit(1)).first()
+            first_ms = timed(db, stmt, args.queries)
+            deep_ms = float("nan")
+            if anchor is not None:
+                value = anchor.completion_percentage if sort_key is completion else anchor.hourly_rate
+                deep_ms = timed(db, after(stmt, sort_key, anchor.id, value, descending), args.queries)
+            print(f"{name:<20} {first_ms:>14.3f} {deep_ms:>13.3f}")
+        db.close()
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
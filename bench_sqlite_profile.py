@@ -0,0 +1,108 @@
+"""
+Concurrent read/write throughput of the SQLite engine, default vs tuned profile.
+
+Writers insert bids and commit one at a time (like bid submission); readers run
+the client project listing. Usage:
+
+    python bench_sqlite_profile.py [--seconds 5] [--readers 8] [--writers 2]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.models import Bid, Client, Project
+
+
+def seed(url, projects=500):
+    engine = create_db_engine(url, sqlite_tuned=False)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    client = Client(email="bench@example.com", hashed_password="x", name="Bench")
+    db.add(client)
+    db.flush()
+    db.add_all(
+        Project(title=f"Project {i}", description="Benchmark project", client_id=client.id)
+        for i in range(projects)
+    )
+    db.commit()
+    client_id, project_id = client.id, db.query(Project.id).first()[0]
+    db.close()
+    engine.dispose()
+    return client_id, project_id
+
+
+def run(url, tuned, seconds, readers, writers, client_id, project_id):
+    write_engine = create_db_engine(url, sqlite_tuned=tuned)
+    read_engine = create_db_engine(url, sqlite_tuned=tuned, read_only=tuned, pool_size=readers)
+    WriteSession = sessionmaker(bind=write_engine)
+    ReadSession = sessionmaker(bind=read_engine)
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def reader():
+        while time.perf_counter() < deadline:
+            db = ReadSession()
+            try:
+                db.query(Project).filter(Project.client_id == client_id).order_by(Project.created_at.desc()).all()
+                key = "reads"
+            except Exception:
+                key = "errors"
+            finally:
+                db.close()
+            with lock:
+                counts[key] += 1
+
+    def writer():
+        while time.perf_counter() < deadline:
+            db = WriteSession()
+            try:
+                db.add(Bid(project_id=project_id, service_provider_id=1, bid_amount=100,
+                           currency="USD", cover_letter="benchmark " * 50))
+                db.commit()
+                key = "writes"
+            except Exception:
+                db.rollback()
+                key = "errors"
+            finally:
+                db.close()
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    write_engine.dispose()
+    read_engine.dispose()
+    return {key: value / seconds for key, value in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10}{'reads/s':>12}{'writes/s':>12}{'errors/s':>12}")
+    for tuned in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            client_id, project_id = seed(url)
+            result = run(url, tuned, args.seconds, args.readers, args.writers, client_id, project_id)
+        name = "tuned" if tuned else "default"
+        print(f"{name:<10}{result['reads']:>12.1f}{result['writes']:>12.1f}{result['errors']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Event-loop latency while large files are uploaded concurrently: the former
+blocking shutil.copyfileobj write against app.api.uploads.save_blob, the path
+the upload endpoints use (streamed into the blob store of a temporary SQLite
+database).
+
+    python bench_upload_loop_latency.py [--clients 8] [--size-mb 50] [--rounds 2]
+
+Starts a small FastAPI app on a local port with one upload route per strategy.
+A monitor task on the server's loop sleeps 5 ms at a time and records how late
+it wakes up; that lag is what every other request on the worker would see.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import uvicorn
+from fastapi import FastAPI, File, UploadFile
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.api.uploads import save_blob
+from app.core import blobs
+from app.db.session import create_db_engine
+from app.models.blob import Blob
+
+TICK = 0.005
+
+
+def build_app(directory, session_factory):
+    app = FastAPI()
+    lags = []
+
+    async def monitor():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - start - TICK)
+
+    @app.on_event("startup")
+    async def start_monitor():
+        asyncio.get_running_loop().create_task(monitor())
+
+    @app.post("/blocking")
+    async def blocking(file: UploadFile = File(...)):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"blocking_{id(file)}"), "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
+        return {}
+
+    @app.post("/streaming")
+    async def streaming(file: UploadFile = File(...)):
+        db = session_factory()
+        try:
+            await save_blob(db, file, 1 << 40)
+            await run_in_threadpool(db.commit)
+        finally:
+            await run_in_threadpool(db.close)
+        return {}
+
+    @app.post("/lag")
+    async def reset_lag():
+        samples = sorted(lags)
+        lags.clear()
+        if not samples:
+            return {}
+        return {
+            "max_ms": samples[-1] * 1000,
+            "p99_ms": samples[int(len(samples) * 0.99) - 1] * 1000,
+            "median_ms": statistics.median(samples) * 1000,
+        }
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    blobs.BLOB_ROOT = os.path.join(directory, "blobs")
+    engine = create_db_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+    Blob.__table__.create(bind=engine)
+    app = build_app(directory, sessionmaker(bind=engine))
+    server = uvicorn.Server(uvicorn.Config(app, port=args.port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    base = f"http://127.0.0.1:{args.port}"
+    payload = os.urandom(args.size_mb * 1024 * 1024)
+
+    def upload(route):
+        requests.post(f"{base}/{route}", files={"file": ("work.pdf", payload, "application/pdf")}).raise_for_status()
+
+    try:
+        print(f"{args.clients} clients x {args.size_mb} MB, {args.rounds} rounds")
+        print(f"{'strategy':<10} {'seconds':>8} {'median ms':>10} {'p99 ms':>8} {'max ms':>8}")
+        for route in ("blocking", "streaming"):
+            requests.post(f"{base}/lag")
+            start = time.perf_counter()
+            with ThreadPoolExecutor(args.clients) as pool:
+                list(pool.map(upload, [route] * (args.clients * args.rounds)))
+            elapsed = time.perf_counter() - start
+            lag = requests.post(f"{base}/lag").json()
+            print(
+                f"{route:<10} {elapsed:>8.2f} {lag['median_ms']:>10.2f} "
+                f"{lag['p99_ms']:>8.2f} {lag['max_ms']:>8.2f}"
+            )
+    finally:
+        server.should_exit = True
+        thread.join()
+        engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Print the query plan of every hot query against the configured database.
+
+    python explain_queries.py
+
+Uses EXPLAIN QUERY PLAN on SQLite and EXPLAIN on MySQL. Run it after
+`alembic upgrade head` to check that each query is served by an index.
+"""
+from sqlalchemy import select, text, true
+
+from app.core.skills import projects_having_skills, service_providers_having_skills
+from app.db.fts import project_text_filter
+from app.db.session import engine
+from app.models import Bid, Client, Contract, Project, ProviderDirectory, RefreshToken, ServiceProvider
+
+HOT_QUERIES = {
+    "client projects": select(Project).where(Project.client_id == 1).order_by(Project.created_at.desc()),
+    "provider projects": select(Project).where(
+        Project.assigned_service_provider_id == 1
+    ).order_by(Project.updated_at.desc()),
+    "provider project check": select(Project).where(
+        Project.id == 1, Project.assigned_service_provider_id == 1
+    ),
+    "project bids": select(Bid).where(Bid.project_id == 1).order_by(Bid.created_at.desc()),
+    "my bids": select(Bid).where(Bid.service_provider_id == 1).order_by(Bid.created_at.desc()),
+    "accepted bid check": select(Bid).where(
+        Bid.project_id == 1, Bid.service_provider_id == 1, Bid.status == "accepted"
+    ),
+    "client contracts": select(Contract).where(Contract.client_id == 1).order_by(Contract.created_at.desc()),
+    "provider contracts": select(Contract).where(Contract.service_provider_id == 1).order_by(Contract.created_at.desc()),
+    "contract by bid": select(Contract).where(Contract.bid_id == 1),
+    "client principal": select(Client.id, Client.is_active).where(Client.id == 1),
+    "provider principal": select(ServiceProvider.id, ServiceProvider.is_active).where(ServiceProvider.id == 1),
+    "refresh token": select(RefreshToken).where(RefreshToken.token_hash == "0" * 64),
+    "marketplace": select(Project).where(Project.status == "open").order_by(Project.created_at.desc()).limit(50),
+    "marketplace search": select(Project).where(
+        Project.status == "open", project_text_filter(engine.dialect.name, "python api")
+    ).order_by(Project.created_at.desc()).limit(50),
+    "marketplace budget": select(Project).where(
+        Project.status == "open", Project.currency == "INR",
+        Project.budget_min <= 50000, Project.budget_max >= 10000,
+    ).order_by(Project.created_at.desc()).limit(50),
+    "marketplace skills": select(Project).where(
+        Project.status == "open", Project.id.in_(projects_having_skills([1, 2], "all"))
+    ).order_by(Project.created_at.desc()).limit(50),
+    "provider directory": select(ProviderDirectory.id).where(
+        ProviderDirectory.is_active == true()
+    ).order_by(ProviderDirectory.completion_percentage.desc(), ProviderDirectory.id.desc()).limit(50),
+    "provider directory rate": select(ProviderDirectory.id).where(
+        ProviderDirectory.is_active == true(), ProviderDirectory.hourly_rate.between(20, 60)
+    ).order_by(ProviderDirectory.hourly_rate, ProviderDirectory.id).limit(50),
+    "provider directory availability": select(ProviderDirectory.id).where(
+        ProviderDirectory.is_active == true(), ProviderDirectory.availability == "Full-time"
+    ).order_by(ProviderDirectory.completion_percentage.desc(), ProviderDirectory.id.desc()).limit(50),
+    "provider directory location": select(ProviderDirectory.id).where(
+        ProviderDirectory.is_active == true(), ProviderDirectory.location_country == "India"
+    ).order_by(ProviderDirectory.completion_percentage.desc(), ProviderDirectory.id.desc()).limit(50),
+    "provider directory skills": select(ProviderDirectory.id).where(
+        ProviderDirectory.is_active == true(),
+        ProviderDirectory.id.in_(service_providers_having_skills([1, 2], "all")),
+    ).order_by(ProviderDirectory.completion_percentage.desc(), ProviderDirectory.id.desc()).limit(50),
+    "project bids with providers": select(Bid, ProviderDirectory).outerjoin(
+        ProviderDirectory, ProviderDirectory.id == Bid.service_provider_id
+    ).where(Bid.project_id == 1).order_by(Bid.created_at.desc()).limit(50),
+}
+
+
+def explain_all():
+    prefix = "EXPLAIN QUERY PLAN" if engine.dialect.name == "sqlite" else "EXPLAIN"
+    with engine.connect() as connection:
+        for name, stmt in HOT_QUERIES.items():
+            sql = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+            print(f"--- {name} ---")
+            for row in connection.execute(text(f"{prefix} {sql}")):
+                print("   ", " | ".join(str(value) for value in row))
+
+
+if __name__ == "__main__":
+    explain_all()
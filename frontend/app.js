@@ -6,6 +6,7 @@ const MICROSOFT_TENANT_ID = 'aea9dfde-d6c4-4b08-be03-a56388eddc74';
 
 // State
 let currentToken = localStorage.getItem('token') || null;
+let currentRefreshToken = localStorage.getItem('refreshToken') || null;
 let currentUserType = localStorage.getItem('userType') || null; // 'client' or 'service_provider'
 let msalInstance = null;
 
@@ -36,9 +37,14 @@ function initializeTokenDisplay() {
     });
 
     document.getElementById('clearToken')?.addEventListener('click', () => {
+        if (currentRefreshToken) {
+            apiRequest('/auth/logout', 'POST', { refresh_token: currentRefreshToken });
+        }
         currentToken = null;
+        currentRefreshToken = null;
         currentUserType = null;
         localStorage.removeItem('token');
+        localStorage.removeItem('refreshToken');
         localStorage.removeItem('userType');
         document.getElementById('tokenDisplay').classList.add('hidden');
         updateUIBasedOnAuth();
@@ -46,10 +52,15 @@ function initializeTokenDisplay() {
     });
 }
 
-function displayToken(token, userType = null) {
+function displayToken(token, userType = null, refreshToken = null) {
     currentToken = token;
     localStorage.setItem('token', token);
 
+    if (refreshToken) {
+        currentRefreshToken = refreshToken;
+        localStorage.setItem('refreshToken', refreshToken);
+    }
+
     if (userType) {
         currentUserType = userType;
         localStorage.setItem('userType', userType);
@@ -108,6 +119,41 @@ function initializeTabs() {
     });
 }
 
+// Exchange the stored refresh token for a new access token (no password needed)
+let refreshInFlight = null;
+
+async function refreshAccessToken() {
+    if (!currentRefreshToken) return false;
+    if (!refreshInFlight) {
+        refreshInFlight = fetch(`${API_BASE_URL}/auth/refresh`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ refresh_token: currentRefreshToken }),
+        })
+            .then(async (response) => {
+                if (!response.ok) {
+                    currentRefreshToken = null;
+                    localStorage.removeItem('refreshToken');
+                    return false;
+                }
+                const data = await response.json();
+                currentToken = data.access_token;
+                currentRefreshToken = data.refresh_token;
+                localStorage.setItem('token', currentToken);
+                localStorage.setItem('refreshToken', currentRefreshToken);
+                document.getElementById('tokenValue').textContent = currentToken;
+                return true;
+            })
+            .catch(() => false)
+            .finally(() => { refreshInFlight = null; });
+    }
+    return refreshInFlight;
+}
+
+function isExpiredTokenResponse(response, requiresAuth) {
+    return requiresAuth && currentRefreshToken && (response.status === 401 || response.status === 403);
+}
+
 // API Helper
 async function apiRequest(endpoint, method = 'GET', body = null, requiresAuth = false) {
     const headers = {
@@ -128,19 +174,68 @@ async function apiRequest(endpoint, method = 'GET', body = null, requiresAuth =
     }
 
     try {
-        const response = await fetch(`${API_BASE_URL}${endpoint}`, options);
+        let response = await fetch(`${API_BASE_URL}${endpoint}`, options);
+        if (isExpiredTokenResponse(response, requiresAuth) && await refreshAccessToken()) {
+            options.headers['Authorization'] = `Bearer ${currentToken}`;
+            response = await fetch(`${API_BASE_URL}${endpoint}`, options);
+        }
         const data = await response.json();
 
         if (!response.ok) {
             throw new Error(data.detail || 'Request failed');
         }
 
-        return { success: true, data };
+        return { success: true, data, headers: response.headers };
     } catch (error) {
         return { success: false, error: error.message };
     }
 }
 
+// Fetch one page of a paginated listing; nextCursor (from X-Next-Cursor) is null on the last page
+async function apiListRequest(endpoint, requiresAuth = true, cursor = null) {
+    const separator = endpoint.includes('?') ? '&' : '?';
+    const url = cursor ? `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}` : endpoint;
+    const result = await apiRequest(url, 'GET', null, requiresAuth);
+    if (!result.success) {
+        return result;
+    }
+    return { success: true, data: result.data, nextCursor: result.headers.get('X-Next-Cursor') };
+}
+
+// Render the first page of a listing with render(items, container), followed by a
+// "Load more" button that fetches the next page with the stored cursor
+async function loadPagedList(endpoint, container, render) {
+    const items = [];
+    let cursor = null;
+
+    async function loadPage() {
+        const result = await apiListRequest(endpoint, true, cursor);
+        if (!result.success) {
+            return result;
+        }
+        items.push(...result.data);
+        cursor = result.nextCursor;
+        render(items, container);
+        if (cursor) {
+            const button = document.createElement('button');
+            button.className = 'btn btn-secondary btn-sm';
+            button.textContent = 'Load more';
+            button.addEventListener('click', async () => {
+                setLoading(button, true);
+                const next = await loadPage();
+                if (!next.success) {
+                    setLoading(button, false);
+                    showToast(next.error, 'error');
+                }
+            });
+            container.appendChild(button);
+        }
+        return result;
+    }
+
+    return loadPage();
+}
+
 async function apiMultipartRequest(endpoint, method = 'POST', formData = null, requiresAuth = false) {
     const headers = {};
 
@@ -155,7 +250,11 @@ async function apiMultipartRequest(endpoint, method = 'POST', formData = null, r
     };
 
     try {
-        const response = await fetch(`${API_BASE_URL}${endpoint}`, options);
+        let response = await fetch(`${API_BASE_URL}${endpoint}`, options);
+        if (isExpiredTokenResponse(response, requiresAuth) && await refreshAccessToken()) {
+            options.headers['Authorization'] = `Bearer ${currentToken}`;
+            response = await fetch(`${API_BASE_URL}${endpoint}`, options);
+        }
         const data = await response.json();
 
         if (!response.ok) {
@@ -266,7 +365,7 @@ function initializeAuth() {
         setLoading(btn, false);
 
         if (result.success) {
-            displayToken(result.data.access_token, 'client');
+            displayToken(result.data.access_token, 'client', result.data.refresh_token);
             displayResponse(result.data);
             showToast('Client login successful!', 'success');
             e.target.reset();
@@ -309,7 +408,7 @@ function initializeAuth() {
         setLoading(btn, false);
 
         if (result.success) {
-            displayToken(result.data.access_token, 'service_provider');
+            displayToken(result.data.access_token, 'service_provider', result.data.refresh_token);
             displayResponse(result.data);
             showToast('Service Provider login successful!', 'success');
             e.target.reset();
@@ -369,7 +468,7 @@ async function handleGoogleCallback(response) {
     });
 
     if (result.success) {
-        displayToken(result.data.access_token, userType);
+        displayToken(result.data.access_token, userType, result.data.refresh_token);
         displayResponse(result.data);
         showToast(`Google login successful as ${userType}!`, 'success');
     } else {
@@ -415,7 +514,7 @@ async function loginWithMicrosoft(userType) {
         });
 
         if (result.success) {
-            displayToken(result.data.access_token, userType);
+            displayToken(result.data.access_token, userType, result.data.refresh_token);
             displayResponse(result.data);
             showToast(`Microsoft login successful as ${userType}!`, 'success');
         } else {
@@ -742,17 +841,23 @@ async function refreshMyProjects() {
     const list = document.getElementById('myProjectsList');
 
     setLoading(btn, true);
-    const result = await apiRequest('/client/projects/', 'GET', null, true);
+    const result = await loadPagedList('/client/projects/', list, (projects, container) => renderProjects(projects, container, true));
     setLoading(btn, false);
 
     if (result.success) {
-        renderProjects(result.data, list, true);
         showToast('Projects list updated', 'success');
     } else {
         showToast(result.error, 'error');
     }
 }
 
+function formatBidStats(p) {
+    if (!p.bid_count) return 'No bids yet';
+    const avg = Math.round(p.bid_amount_avg);
+    const last = p.last_bid_at ? ` | last ${new Date(p.last_bid_at).toLocaleString()}` : '';
+    return `${p.bid_count} bid${p.bid_count === 1 ? '' : 's'} | ${p.bid_amount_min}-${p.bid_amount_max} (avg ${avg})${last}`;
+}
+
 function renderProjects(projects, container, isOwner = false) {
     if (!projects || projects.length === 0) {
         container.innerHTML = '<p class="placeholder">No projects found.</p>';
@@ -763,6 +868,7 @@ function renderProjects(projects, container, isOwner = false) {
         <div class="item-card">
             <h4>${p.title}</h4>
             <div class="meta">${p.budget_range || 'No budget'} | ${p.currency || ''} | ${p.project_duration || 'No duration'}</div>
+            ${isOwner ? `<div class="meta">${formatBidStats(p)}</div>` : ''}
             <div class="description">${p.description}</div>
             <div class="tags">
                 ${(p.skills_required || '').split(',').map(s => s.trim() ? `<span class="item-tag">${s.trim()}</span>` : '').join('')}
@@ -811,12 +917,10 @@ function initializeBiddingAPIs() {
         // Let's try to get projects from client projects endpoint (might fail if auth check is strict)
         // Actually, let's just use the same /client/projects/ for testing if SP has access or create a new one.
         // For this task, I'll assume SP can list projects they can bid on.
-        const result = await apiRequest('/client/projects/', 'GET', null, true);
+        const result = await loadPagedList('/client/projects/', document.getElementById('availableProjectsList'), renderProjects);
         setLoading(e.target, false);
 
-        if (result.success) {
-            renderProjects(result.data, document.getElementById('availableProjectsList'), false);
-        } else {
+        if (!result.success) {
             showToast(result.error, 'error');
         }
     });
@@ -830,29 +934,32 @@ async function refreshMyBids() {
     const list = document.getElementById('myBidsList');
 
     setLoading(btn, true);
-    const result = await apiRequest('/service-provider/my-bids', 'GET', null, true);
+    const result = await loadPagedList('/service-provider/my-bids', list, renderMyBids);
     setLoading(btn, false);
 
     if (result.success) {
-        if (!result.data || result.data.length === 0) {
-            list.innerHTML = '<p class="placeholder">No bids submitted yet.</p>';
-            return;
-        }
-
-        list.innerHTML = result.data.map(b => `
-            <div class="item-card">
-                <h4>Project #${b.project_id}</h4>
-                <div class="meta">Amount: ${b.bid_amount} ${b.currency}</div>
-                <div class="description">${b.cover_letter}</div>
-                <div class="status-badge ${b.status}">${b.status.toUpperCase()}</div>
-            </div>
-        `).join('');
         showToast('Bids list updated', 'success');
     } else {
         showToast(result.error, 'error');
     }
 }
 
+function renderMyBids(bids, container) {
+    if (!bids || bids.length === 0) {
+        container.innerHTML = '<p class="placeholder">No bids submitted yet.</p>';
+        return;
+    }
+
+    container.innerHTML = bids.map(b => `
+        <div class="item-card">
+            <h4>Project #${b.project_id}</h4>
+            <div class="meta">Amount: ${b.bid_amount} ${b.currency}</div>
+            <div class="description">${b.cover_letter}</div>
+            <div class="status-badge ${b.status}">${b.status.toUpperCase()}</div>
+        </div>
+    `).join('');
+}
+
 window.viewProjectBids = async function (projectId, projectTitle) {
     const container = document.getElementById(`bids-container-${projectId}`);
 
@@ -864,15 +971,13 @@ window.viewProjectBids = async function (projectId, projectTitle) {
     container.innerHTML = '<p class="loading">Loading bids...</p>';
     container.classList.remove('hidden');
 
-    const result = await apiRequest(`/client/projects/${projectId}/bids`, 'GET', null, true);
-
-    if (result.success) {
-        if (!result.data || result.data.length === 0) {
-            container.innerHTML = '<p class="placeholder">No bids yet.</p>';
+    const result = await loadPagedList(`/client/projects/${projectId}/bids`, container, (bids, list) => {
+        if (!bids || bids.length === 0) {
+            list.innerHTML = '<p class="placeholder">No bids yet.</p>';
             return;
         }
 
-        container.innerHTML = result.data.map(b => `
+        list.innerHTML = bids.map(b => `
             <div class="bid-item">
                 <div class="bid-meta">Amount: ${b.bid_amount} ${b.currency} | Status: ${b.status}</div>
                 <div class="bid-letter">${b.cover_letter}</div>
@@ -884,7 +989,9 @@ window.viewProjectBids = async function (projectId, projectTitle) {
                  ` : ''}
              </div>
         `).join('');
-    } else {
+    });
+
+    if (!result.success) {
         container.innerHTML = `<p class="error">${result.error}</p>`;
     }
 };
@@ -1003,11 +1110,10 @@ async function refreshMyContracts() {
     const list = document.getElementById('myContractsList');
 
     setLoading(btn, true);
-    const result = await apiRequest('/client/contracts/', 'GET', null, true);
+    const result = await loadPagedList('/client/contracts/', list, (contracts, container) => renderContracts(contracts, container, 'client'));
     setLoading(btn, false);
 
     if (result.success) {
-        renderContracts(result.data, list, 'client');
         showToast('Contracts list updated', 'success');
     } else {
         showToast(result.error, 'error');
@@ -1151,12 +1257,10 @@ async function refreshAvailableProjects() {
     if (!btn) return;
 
     setLoading(btn, true);
-    const result = await apiRequest('/client/projects/', 'GET', null, true);
+    const result = await loadPagedList('/client/projects/', document.getElementById('availableProjectsList'), renderProjects);
     setLoading(btn, false);
 
-    if (result.success) {
-        renderProjects(result.data, document.getElementById('availableProjectsList'), false);
-    } else {
+    if (!result.success) {
         showToast(result.error, 'error');
     }
 }
@@ -0,0 +1,143 @@
+"""
+Delete unreferenced blobs from the content-addressed upload store.
+
+    python gc_blobs.py [--dry-run] [--recount] [--grace-minutes 60]
+
+A blob is collected when its ref_count is zero and both its row and its file
+are older than the grace period. The file is first moved aside, so an upload
+of the same content stores a fresh copy instead of reusing it; the row is then
+deleted (only if still unreferenced) and the moved file removed, or put back
+if the blob was referenced again in the meantime. Files under the store with
+no matching row, and abandoned `.upload-*.part` temp files, are removed once
+past the grace period too. --recount rebuilds every ref_count from the
+referencing columns first. Expired resumable upload sessions and their staged
+files are purged as well.
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, text
+
+from app.core import blobs, upload_sessions
+from app.db.session import SessionLocal
+from app.models import Blob
+
+
+def as_utc(value):
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def older_than(path, cutoff):
+    try:
+        return os.path.getmtime(path) < cutoff
+    except FileNotFoundError:
+        return True
+
+
+def remove(path, dry_run):
+    if dry_run:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def restore(quarantined, path):
+    try:
+        os.replace(quarantined, path)
+    except FileNotFoundError:
+        pass
+
+
+def collect_row(db, blob, path, cutoff):
+    """
+    Delete one unreferenced blob; False if it was referenced again.
+    """
+    quarantined = f"{path}.gc"
+    try:
+        os.replace(path, quarantined)
+    except FileNotFoundError:
+        pass
+    # blobs.place refreshes the mtime when it reuses the file
+    if not older_than(quarantined, cutoff):
+        restore(quarantined, path)
+        return False
+    deleted = db.execute(
+        delete(Blob).where(Blob.id == blob.id, Blob.ref_count <= 0)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    if not deleted:
+        restore(quarantined, path)  # Referenced again since the SELECT
+        return False
+    remove(quarantined, False)
+    return True
+
+
+def collect_rows(db, grace, dry_run):
+    cutoff = time.time() - grace.total_seconds()
+    created_cutoff = datetime.now(timezone.utc) - grace
+    removed = 0
+    freed = 0
+    for blob in db.scalars(select(Blob).where(Blob.ref_count <= 0)).all():
+        path = blobs.file_path(blob.id, blob.extension)
+        if blob.created_at is not None and as_utc(blob.created_at) > created_cutoff:
+            continue
+        if not older_than(path, cutoff):
+            continue
+        if not dry_run and not collect_row(db, blob, path, cutoff):
+            continue
+        removed += 1
+        freed += blob.size
+    return removed, freed
+
+
+def collect_files(db, grace, dry_run):
+    cutoff = time.time() - grace.total_seconds()
+    known = {
+        os.path.normpath(blobs.file_path(blob_id, extension))
+        for blob_id, extension in db.execute(select(Blob.id, Blob.extension))
+    }
+    removed = 0
+    for directory, _, names in os.walk(blobs.BLOB_ROOT):
+        for name in names:
+            path = os.path.normpath(os.path.join(directory, name))
+            if path in known or not older_than(path, cutoff):
+                continue
+            remove(path, dry_run)
+            removed += 1
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="report what would be deleted")
+    parser.add_argument("--recount", action="store_true", help="rebuild ref_count before collecting")
+    parser.add_argument("--grace-minutes", type=int, default=60)
+    args = parser.parse_args()
+    grace = timedelta(minutes=args.grace_minutes)
+
+    db = SessionLocal()
+    try:
+        if args.recount and not args.dry_run:
+            db.execute(text(blobs.RECOUNT_SQL))
+            db.commit()
+        sessions = 0 if args.dry_run else upload_sessions.purge_expired(db, limit=None, sweep_files=True)
+        rows, freed = collect_rows(db, grace, args.dry_run)
+        files = collect_files(db, grace, args.dry_run)
+    finally:
+        db.close()
+
+    verb = "Would delete" if args.dry_run else "Deleted"
+    print(f"{verb} {rows} unreferenced blobs ({freed / (1024 * 1024):.1f} MB) and {files} orphaned files")
+    if sessions:
+        print(f"Purged {sessions} expired upload sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base.metadata
+from app.db.base import Base
+from app.db.session import create_db_engine
+
+
+@pytest.fixture
+def db():
+    """
+    A session on a fresh in-memory SQLite database with every table created.
+    """
+    engine = create_db_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
@@ -0,0 +1,63 @@
+import pytest
+from pydantic import ValidationError
+
+from app.core.budget import MAX_BUDGET, parse_budget_range
+from app.schemas.project import ProjectCreate, ProjectUpdate
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1000-5000", (1000, 5000)),
+        ("$1000 - $5000", (1000, 5000)),
+        ("5000-1000", (1000, 5000)),
+        ("1,00,000", (100000, 100000)),
+        ("1k - 5k", (1000, 5000)),
+        ("1-5k", (1000, 5000)),
+        ("10-20 lakhs", (1000000, 2000000)),
+        ("1.5-2 lakh", (150000, 200000)),
+        ("₹2 lakh", (200000, 200000)),
+        ("2-3 crore", (20000000, 30000000)),
+        ("500 - 2k", (500, 2000)),
+        ("5000+", (5000, None)),
+        ("above 5000", (5000, None)),
+        ("Over $5k", (5000, None)),
+        ("Under 500", (None, 500)),
+        ("upto 2 lakhs", (None, 200000)),
+        ("below 1000", (None, 1000)),
+        ("negotiable", (None, None)),
+        ("", (None, None)),
+        (None, (None, None)),
+    ],
+)
+def test_parse_budget_range(text, expected):
+    assert parse_budget_range(text) == expected
+
+
+def test_parse_budget_range_rejects_amounts_beyond_the_int_columns():
+    assert parse_budget_range(str(MAX_BUDGET)) == (MAX_BUDGET, MAX_BUDGET)
+    with pytest.raises(ValueError):
+        parse_budget_range("1000 crore")
+
+
+def test_project_create_derives_budget_columns():
+    project = ProjectCreate(title="t", description="d", budget_range="10-20 lakhs")
+    assert (project.budget_min, project.budget_max) == (1000000, 2000000)
+
+
+def test_project_create_rejects_budget_beyond_the_int_columns():
+    with pytest.raises(ValidationError):
+        ProjectCreate(title="t", description="d", budget_range="1000 crore")
+
+
+def test_budget_columns_must_agree_with_budget_range():
+    ProjectCreate(title="t", description="d", budget_range="1-5k", budget_min=1000, budget_max=5000)
+    with pytest.raises(ValidationError):
+        ProjectCreate(title="t", description="d", budget_range="1-5k", budget_min=1)
+    with pytest.raises(ValidationError):
+        ProjectUpdate(budget_min=100, budget_max=200)
+
+
+def test_project_update_without_budget_leaves_it_unset():
+    update = ProjectUpdate(title="renamed")
+    assert update.model_dump(exclude_unset=True) == {"title": "renamed"}
@@ -0,0 +1,113 @@
+import threading
+import time
+
+from app.core.jwks import JWKSCache, StaticJWKSProvider
+
+KEY_A = {"kid": "a", "kty": "RSA", "use": "sig", "n": "n-a", "e": "AQAB"}
+KEY_B = {"kid": "b", "kty": "RSA", "use": "sig", "n": "n-b", "e": "AQAB"}
+
+
+class SlowProvider(StaticJWKSProvider):
+    def fetch(self, tenant):
+        time.sleep(0.05)
+        return super().fetch(tenant)
+
+
+class FailingProvider(StaticJWKSProvider):
+    failing = False
+
+    def fetch(self, tenant):
+        if self.failing:
+            self.fetch_count += 1
+            raise ConnectionError("JWKS endpoint down")
+        return super().fetch(tenant)
+
+
+def wait_for_refresh(cache, tenant):
+    entry = cache._entry(tenant)
+    deadline = time.monotonic() + 5
+    while entry.refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_cached_keys_are_served_without_refetching():
+    provider = StaticJWKSProvider({"keys": [KEY_A, KEY_B]})
+    cache = JWKSCache(provider)
+    assert cache.get_key("tenant", "a") == KEY_A
+    assert cache.get_key("tenant", "b") == KEY_B
+    assert cache.get_key("tenant", "a") == KEY_A
+    assert provider.fetch_count == 1
+
+
+def test_tenants_are_cached_separately():
+    provider = StaticJWKSProvider({"keys": [KEY_A]})
+    cache = JWKSCache(provider)
+    cache.get_key("one", "a")
+    cache.get_key("two", "a")
+    cache.get_key("one", "a")
+    assert provider.fetch_count == 2
+
+
+def test_unknown_kid_refetches_once_under_concurrency():
+    provider = SlowProvider({"keys": [KEY_A]})
+    cache = JWKSCache(provider, min_refetch_interval=30)
+    assert cache.get_key("tenant", "a") == KEY_A
+    # The tenant rotates in key "b" after the last fetch became refetchable
+    cache._entry("tenant").fetched_at -= 60
+    provider.jwks = {"keys": [KEY_A, KEY_B]}
+
+    barrier = threading.Barrier(8)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append(cache.get_key("tenant", "b"))
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [KEY_B] * 8
+    assert provider.fetch_count == 2
+
+
+def test_unknown_kid_refetch_is_rate_limited():
+    provider = StaticJWKSProvider({"keys": [KEY_A]})
+    cache = JWKSCache(provider, min_refetch_interval=30)
+    cache.get_key("tenant", "a")
+    assert cache.get_key("tenant", "missing") is None
+    assert cache.get_key("tenant", "missing") is None
+    assert provider.fetch_count == 1
+
+
+def test_failed_background_refresh_keeps_serving_cached_keys():
+    provider = FailingProvider({"keys": [KEY_A]})
+    cache = JWKSCache(provider, default_ttl=3600, refresh_ahead=300)
+    assert cache.get_key("tenant", "a") == KEY_A
+
+    # Inside the refresh-ahead window, with the key endpoint failing
+    entry = cache._entry("tenant")
+    entry.expires_at = time.monotonic() + 10
+    provider.failing = True
+    assert cache.get_key("tenant", "a") == KEY_A
+    wait_for_refresh(cache, "tenant")
+
+    assert provider.fetch_count == 2
+    assert cache.stats()["fetch_errors"] == 1
+    assert cache.get_key("tenant", "a") == KEY_A
+
+
+def test_background_refresh_picks_up_new_keys():
+    provider = SlowProvider({"keys": [KEY_A]})
+    cache = JWKSCache(provider, default_ttl=3600, refresh_ahead=300)
+    cache.get_key("tenant", "a")
+
+    cache._entry("tenant").expires_at = time.monotonic() + 10
+    provider.jwks = {"keys": [KEY_B]}
+    assert cache.get_key("tenant", "a") == KEY_A  # Served while the refresh runs
+    wait_for_refresh(cache, "tenant")
+
+    assert cache.get_key("tenant", "b") == KEY_B
+    assert provider.fetch_count == 2
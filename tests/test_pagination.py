@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import insert, select, text, update
+
+from app.api.pagination import NEXT_CURSOR_HEADER, PageParams, decode_cursor, encode_cursor, page_items, paginate
+from app.models.provider_directory import ProviderDirectory
+from app.models.refresh_token import RefreshToken
+
+
+def page_params(limit=2, cursor=None, offset=None):
+    return PageParams(limit=limit, cursor=cursor, offset=offset)
+
+
+def fetch_page(db, stmt, sort_key, id_column, page, descending=True):
+    response = Response()
+    rows = page_items(db.scalars(paginate(stmt, page, sort_key, id_column, descending)).all(), page, response)
+    return [row.id for row in rows], response.headers.get(NEXT_CURSOR_HEADER)
+
+
+def walk(db, stmt, sort_key, id_column, descending=True, limit=2):
+    ids, cursor = [], None
+    while True:
+        page_ids, cursor = fetch_page(db, stmt, sort_key, id_column, page_params(limit, cursor), descending)
+        ids += page_ids
+        if not cursor:
+            return ids
+
+
+@pytest.fixture
+def providers(db):
+    # (id, completion_percentage): ties on 50 and 20 are broken by id
+    rows = [(1, 50), (2, 80), (3, 50), (4, 20), (5, 50), (6, 20), (7, 100)]
+    db.execute(insert(ProviderDirectory), [
+        {"id": provider_id, "is_active": True, "completion_percentage": completion}
+        for provider_id, completion in rows
+    ])
+    db.commit()
+    return select(ProviderDirectory)
+
+
+@pytest.mark.parametrize("value", [0, 42, 12.5, "text", None])
+def test_cursor_round_trip(value):
+    assert decode_cursor(encode_cursor(value, 7)) == (value, 7)
+
+
+def test_cursor_holds_datetimes_as_utc_text():
+    naive = datetime(2026, 3, 1, 12, 30, 5)
+    assert decode_cursor(encode_cursor(naive, 1)) == ("2026-03-01 12:30:05", 1)
+
+    aware = datetime(2026, 3, 1, 18, 0, 5, 250000, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+    assert decode_cursor(encode_cursor(aware, 2)) == ("2026-03-01 12:30:05.250000", 2)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        "bm90IGpzb24",  # "not json"
+        encode_cursor(1, 1)[:-3],
+        "eyJ2IjogMX0",  # {"v": 1}, no id
+        "eyJ2IjogWzFdLCAiaWQiOiAxfQ",  # {"v": [1], "id": 1}
+        "eyJ2IjogMSwgImlkIjogImEifQ",  # {"v": 1, "id": "a"}
+    ],
+)
+def test_malformed_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor(cursor)
+    assert excinfo.value.status_code == 400
+
+
+def test_keyset_pages_break_ties_on_id(db, providers):
+    sort_key = ProviderDirectory.completion_percentage
+    assert walk(db, providers, sort_key, ProviderDirectory.id) == [7, 2, 5, 3, 1, 6, 4]
+    assert walk(db, providers, sort_key, ProviderDirectory.id, descending=False) == [4, 6, 1, 3, 5, 2, 7]
+    assert walk(db, providers, sort_key, ProviderDirectory.id, limit=100) == [7, 2, 5, 3, 1, 6, 4]
+
+
+def test_next_cursor_only_when_more_rows_exist(db, providers):
+    sort_key = ProviderDirectory.completion_percentage
+    ids, cursor = fetch_page(db, providers, sort_key, ProviderDirectory.id, page_params(limit=7))
+    assert len(ids) == 7 and cursor is None
+
+    ids, cursor = fetch_page(db, providers, sort_key, ProviderDirectory.id, page_params(limit=3))
+    assert ids == [7, 2, 5]
+    assert decode_cursor(cursor) == (50, 5)
+
+
+def test_cursor_survives_changes_to_the_anchor_row(db, providers):
+    sort_key = ProviderDirectory.completion_percentage
+    ids, cursor = fetch_page(db, providers, sort_key, ProviderDirectory.id, page_params(limit=3))
+    assert ids == [7, 2, 5]
+
+    # The last row of the page moves to the top, another one is deleted
+    db.execute(update(ProviderDirectory).where(ProviderDirectory.id == 5).values(completion_percentage=100))
+    db.execute(ProviderDirectory.__table__.delete().where(ProviderDirectory.id == 3))
+    db.commit()
+
+    ids, _ = fetch_page(db, providers, sort_key, ProviderDirectory.id, page_params(limit=10, cursor=cursor))
+    assert ids == [1, 6, 4]
+
+
+def test_datetime_sort_keys_page_through_ties_and_fractions(db):
+    # Timestamps as CURRENT_TIMESTAMP stores them (ties within the second) ...
+    stored = ["2026-01-01 09:00:00", "2026-01-01 09:00:00", "2026-01-01 09:00:01", "2026-01-01 09:00:00"]
+    for i, value in enumerate(stored):
+        db.execute(
+            text(
+                "INSERT INTO refresh_token (token_hash, family_id, role, user_id, expires_at) "
+                "VALUES (:hash, 'f', 'client', 1, :value)"
+            ),
+            {"hash": f"{i:064d}", "value": value},
+        )
+    # ... and as SQLAlchemy binds datetimes with a fraction
+    for i, value in enumerate([datetime(2026, 1, 1, 9, 0, 0, 500), datetime(2026, 1, 1, 9, 0, 1, 250000)], 10):
+        db.execute(insert(RefreshToken), {
+            "token_hash": f"{i:064d}", "family_id": "f", "role": "client", "user_id": 1, "expires_at": value,
+        })
+    db.commit()
+
+    stmt = select(RefreshToken)
+    expected = [
+        token.id for token in db.scalars(
+            stmt.order_by(RefreshToken.expires_at.desc(), RefreshToken.id.desc())
+        )
+    ]
+    assert expected == [6, 3, 5, 4, 2, 1]
+    assert walk(db, stmt, RefreshToken.expires_at, RefreshToken.id) == expected
+    assert walk(db, stmt, RefreshToken.expires_at, RefreshToken.id, descending=False) == expected[::-1]
+
+
+def test_offset_fallback(db, providers):
+    sort_key = ProviderDirectory.completion_percentage
+    ids, cursor = fetch_page(db, providers, sort_key, ProviderDirectory.id, page_params(limit=2, offset=2))
+    assert ids == [5, 3]
+    assert cursor is not None
+
+    ids, cursor = fetch_page(db, providers, sort_key, ProviderDirectory.id, page_params(limit=2, offset=6))
+    assert ids == [4]
+    assert cursor is None
+
+
+def test_cursor_takes_precedence_over_offset(db, providers):
+    sort_key = ProviderDirectory.completion_percentage
+    cursor = encode_cursor(50, 5)
+    ids, _ = fetch_page(db, providers, sort_key, ProviderDirectory.id, page_params(limit=2, cursor=cursor, offset=5))
+    assert ids == [3, 1]
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.api.v1.endpoints.auth import issue_tokens, logout, refresh_access_token
+from app.core import security
+from app.core.config import settings
+from app.models.client import Client
+from app.models.refresh_token import RefreshToken
+from app.schemas.token import RefreshTokenRequest
+
+
+@pytest.fixture
+def client_id(db):
+    client = Client(email="client@example.com", name="Client", hashed_password="x", is_active=True)
+    db.add(client)
+    db.commit()
+    return client.id
+
+
+def refresh(db, token):
+    return refresh_access_token(RefreshTokenRequest(refresh_token=token), db)
+
+
+def assert_rejected(db, token):
+    with pytest.raises(HTTPException) as excinfo:
+        refresh(db, token)
+    assert excinfo.value.status_code == 401
+
+
+def test_refresh_rotates_the_token_pair(db, client_id):
+    login = issue_tokens(db, client_id, security.ROLE_CLIENT)
+    rotated = refresh(db, login["refresh_token"])
+
+    assert rotated["refresh_token"] != login["refresh_token"]
+    claims = jwt.decode(rotated["access_token"], settings.SECRET_KEY, algorithms=[security.ALGORITHM])
+    assert (claims["sub"], claims["role"]) == (str(client_id), security.ROLE_CLIENT)
+
+    tokens = db.query(RefreshToken).order_by(RefreshToken.id).all()
+    assert len(tokens) == 2
+    assert tokens[0].family_id == tokens[1].family_id
+    assert tokens[0].revoked_at is not None and tokens[1].revoked_at is None
+
+    # The rotated token is good for exactly one more rotation
+    assert refresh(db, rotated["refresh_token"])["refresh_token"]
+
+
+def test_reusing_a_rotated_token_revokes_the_family(db, client_id):
+    login = issue_tokens(db, client_id, security.ROLE_CLIENT)
+    rotated = refresh(db, login["refresh_token"])
+
+    with pytest.raises(HTTPException) as excinfo:
+        refresh(db, login["refresh_token"])
+    assert excinfo.value.status_code == 401
+    assert "reuse" in excinfo.value.detail
+
+    # The sibling issued by the legitimate rotation is revoked too
+    assert_rejected(db, rotated["refresh_token"])
+    assert db.query(RefreshToken).filter(RefreshToken.revoked_at.is_(None)).count() == 0
+
+
+def test_reuse_leaves_other_logins_alone(db, client_id):
+    first = issue_tokens(db, client_id, security.ROLE_CLIENT)
+    second = issue_tokens(db, client_id, security.ROLE_CLIENT)
+    refresh(db, first["refresh_token"])
+    assert_rejected(db, first["refresh_token"])
+
+    assert refresh(db, second["refresh_token"])["refresh_token"]
+
+
+def test_logout_revokes_the_family(db, client_id):
+    login = issue_tokens(db, client_id, security.ROLE_CLIENT)
+    rotated = refresh(db, login["refresh_token"])
+
+    logout(RefreshTokenRequest(refresh_token=rotated["refresh_token"]), db)
+
+    assert_rejected(db, rotated["refresh_token"])
+    assert_rejected(db, login["refresh_token"])
+
+
+def test_expired_token_is_rejected_without_revoking_the_family(db, client_id):
+    login = issue_tokens(db, client_id, security.ROLE_CLIENT)
+    token = db.query(RefreshToken).one()
+    token.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db.commit()
+
+    assert_rejected(db, login["refresh_token"])
+    db.refresh(token)
+    assert token.revoked_at is None
+
+
+def test_unknown_token_is_rejected(db):
+    assert_rejected(db, "not-a-token")
@@ -0,0 +1,116 @@
+import hashlib
+import os
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import deps
+from app.api.v1.endpoints.project import finalize_submission_upload
+from app.core import blobs, security, upload_sessions
+from app.core.config import settings
+from app.models.client import Client
+from app.models.project import Project
+from app.models.service_provider import ServiceProvider
+from app.models.upload_session import UploadSession
+from app.schemas.project import UploadSessionFinalize
+
+DATA = b"%PDF-1.4 " + bytes(range(256)) * 4
+
+
+@pytest.fixture(autouse=True)
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_STAGING_DIR", str(tmp_path / "staging"))
+    monkeypatch.setattr(blobs, "BLOB_ROOT", str(tmp_path / "blobs"))
+
+
+@pytest.fixture
+def upload(db):
+    client = Client(email="client@example.com", name="Client", hashed_password="x", is_active=True)
+    provider = ServiceProvider(email="sp@example.com", name="Provider", hashed_password="x", is_active=True)
+    db.add_all([client, provider])
+    db.flush()
+    project = Project(
+        title="Site", description="Build it", client_id=client.id,
+        assigned_service_provider_id=provider.id, status="in_progress",
+    )
+    db.add(project)
+    db.flush()
+    session = UploadSession(
+        id="a" * 32, project_id=project.id, service_provider_id=provider.id,
+        file_name="work.pdf", size=len(DATA), received=0, expires_at=upload_sessions.new_expiry(),
+    )
+    upload_sessions.create_file(session.id)
+    db.add(session)
+    db.commit()
+    return session
+
+
+def received(db, session_id):
+    db.expire_all()
+    return db.get(UploadSession, session_id).received
+
+
+def staged(session_id):
+    with open(upload_sessions.staging_path(session_id), "rb") as f:
+        return f.read()
+
+
+def finalize(db, session, sha256):
+    principal = deps.Principal(role=security.ROLE_SERVICE_PROVIDER, id=session.service_provider_id)
+    finalize_in = UploadSessionFinalize(github_link="https://github.com/example/site", sha256=sha256)
+    return finalize_submission_upload(session.project_id, session.id, finalize_in, db, principal)
+
+
+def test_chunks_advance_the_committed_offset(db, upload):
+    assert upload_sessions.append_chunk(db, upload.id, 0, DATA[:100])
+    assert upload_sessions.append_chunk(db, upload.id, 100, DATA[100:])
+    assert received(db, upload.id) == len(DATA)
+    assert staged(upload.id) == DATA
+
+
+def test_chunk_at_a_stale_offset_is_rejected(db, upload):
+    assert upload_sessions.append_chunk(db, upload.id, 0, DATA[:100])
+
+    assert not upload_sessions.append_chunk(db, upload.id, 0, b"x" * 50)
+    assert not upload_sessions.append_chunk(db, upload.id, 200, DATA[200:300])
+    assert received(db, upload.id) == 100
+    assert staged(upload.id) == DATA[:100]
+
+
+def test_retried_chunk_overwrites_the_uncommitted_tail(db, upload):
+    assert upload_sessions.append_chunk(db, upload.id, 0, DATA[:100])
+    # A failed attempt left bytes past the committed offset
+    with open(upload_sessions.staging_path(upload.id), "r+b") as f:
+        f.seek(100)
+        f.write(b"garbage" * 100)
+
+    assert upload_sessions.append_chunk(db, upload.id, 100, DATA[100:200])
+    assert received(db, upload.id) == 200
+    assert staged(upload.id) == DATA[:200]
+
+
+def test_finalize_rejects_a_wrong_checksum(db, upload):
+    assert upload_sessions.append_chunk(db, upload.id, 0, DATA)
+
+    with pytest.raises(HTTPException) as excinfo:
+        finalize(db, upload, hashlib.sha256(b"something else").hexdigest())
+    assert excinfo.value.status_code == 400
+
+    # The upload is untouched and can still be finalized
+    assert received(db, upload.id) == len(DATA)
+    assert staged(upload.id) == DATA
+
+
+def test_finalize_stores_the_file_as_a_blob(db, upload):
+    assert upload_sessions.append_chunk(db, upload.id, 0, DATA)
+    sha256 = hashlib.sha256(DATA).hexdigest()
+    upload_id = upload.id
+
+    project = finalize(db, upload, sha256.upper())
+
+    assert project.status == "awaiting_review"
+    assert project.submission_blob_id == sha256
+    assert db.get(UploadSession, upload_id) is None
+    assert not os.path.exists(upload_sessions.staging_path(upload_id))
+    with open(blobs.file_path(sha256, ".pdf"), "rb") as f:
+        assert f.read() == DATA
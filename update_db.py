@@ -1,12 +1,18 @@
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, text
+
 from app.db.session import engine
-from sqlalchemy import text
-from app.db.base import Base
-# Import models so Base.metadata knows about them
-from app.models.service_provider import ServiceProvider, PortfolioProject, WorkExperience, Education, Certification
 
-def update_schema():
-    print("Beginning schema update...")
-    with engine.connect() as connection:
+def patch_legacy_columns():
+    """
+    Databases from before the baseline migration may lack the profile columns.
+    Add them so the baseline matches, then let Alembic take over.
+    """
+    if "client" not in inspect(engine).get_table_names():
+        return
+    print("Patching legacy columns...")
+    with engine.begin() as connection:
         # 1. Add columns to ServiceProvider table
         columns_to_add_sp = [
             ("professional_title", "VARCHAR"),
@@ -55,15 +61,13 @@ def update_schema():
             except Exception as e:
                 print(f"Skipped {col_name}: {e}") # Simpler logging
 
-    # 3. Create new tables if they don't exist
-    print("Creating new tables...")
-    try:
-        Base.metadata.create_all(bind=engine)
-        print("Success: Tables created (if not existed).")
-    except Exception as e:
-        print(f"Error creating tables: {e}")
+def update_schema():
+    print("Beginning schema update...")
+    patch_legacy_columns()
+    print("Applying migrations...")
+    command.upgrade(Config("alembic.ini"), "head")
+    print("Success: Database is at the latest revision.")
 
 
 if __name__ == "__main__":
     update_schema()
-